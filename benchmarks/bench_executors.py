@@ -0,0 +1,84 @@
+"""Benchmark the executors of ``TerraformModuleResources.get_all_resources``.
+
+Parses batches of realistic docstrings with each executor and prints the
+wall time, to show which one wins at which batch size (and where
+``PROCESS_EXECUTOR_THRESHOLD`` should sit on this machine).
+
+Usage:
+    python benchmarks/bench_executors.py [--sizes 10,100,1000,...] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from python_terraform_bridge.module_resources import (
+    EXECUTORS,
+    TerraformModuleResources,
+    get_default_executor,
+    is_free_threaded,
+)
+
+
+DOCSTRING = """List {name}.
+
+generator=key: {name}, module_class: bench, extra_outputs: count
+
+name: domain, required: false, type: string, description: "Domain filter"
+name: limit, required: false, type: number, default: 100
+name: filters, type: map(any), json_encode: true, base64_encode: true
+name: tags, required: false, type: list(string), json_encode: true
+name: include_deleted, required: false, type: bool, default: false
+
+env=name: BENCH_TOKEN, required: true, sensitive: true
+
+extra_output=key: count
+sub_key=key: summary, json_encode: true
+"""
+
+
+def make_docstrings(count: int) -> dict[str, str]:
+    """Docstrings of count data source methods."""
+    return {
+        f"list_items_{i}": DOCSTRING.format(name=f"items_{i}") for i in range(count)
+    }
+
+
+def measure(docstrings: dict[str, str], executor: str, repeat: int) -> float:
+    """Return the best wall time of get_all_resources over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        tic = time.perf_counter()
+        TerraformModuleResources.get_all_resources(docstrings, executor=executor)
+        best = min(best, time.perf_counter() - tic)
+
+    return best
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10,100,500,1000,2000,5000,20000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"free-threaded: {is_free_threaded()}")
+    print(f"{'modules':>8} " + " ".join(f"{name:>10}" for name in EXECUTORS))
+
+    for size in map(int, args.sizes.split(",")):
+        docstrings = make_docstrings(size)
+        timings = {
+            executor: measure(docstrings, executor, args.repeat)
+            for executor in EXECUTORS
+        }
+        fastest = min(timings, key=timings.__getitem__)
+        print(
+            f"{size:>8} "
+            + " ".join(f"{timings[name]:>9.3f}s" for name in EXECUTORS)
+            + f"  fastest: {fastest}, default: {get_default_executor(size)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
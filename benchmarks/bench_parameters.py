@@ -0,0 +1,86 @@
+"""Benchmark constructing large numbers of module parameters.
+
+Compares TerraformModuleParameter, FrozenModuleParameter and interned
+FrozenModuleParameter instances for construction time, retained memory and
+repeated rendering (``get_variable``/``get_trigger``).
+
+Usage:
+    python benchmarks/bench_parameters.py [--count N] [--distinct N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from collections.abc import Callable
+from typing import Any
+
+from python_terraform_bridge.parameter import (
+    FrozenModuleParameter,
+    TerraformModuleParameter,
+)
+
+
+def definition(i: int, distinct: int) -> dict[str, Any]:
+    """Keyword arguments for the i-th parameter, cycling through definitions."""
+    n = i % distinct
+    return {
+        "name": f"param_{n}",
+        "default": None if n % 2 else f"value_{n}",
+        "required": bool(n % 2),
+        "json_encode": n % 3 == 0,
+    }
+
+
+def run(
+    label: str,
+    factory: Callable[..., Any],
+    count: int,
+    distinct: int,
+) -> None:
+    """Construct ``count`` parameters and report time and memory."""
+    definitions = [definition(i, distinct) for i in range(count)]
+
+    gc.collect()
+    tic = time.perf_counter()
+    params = [factory(**kwargs) for kwargs in definitions]
+    construct = time.perf_counter() - tic
+
+    tic = time.perf_counter()
+    for param in params:
+        param.get_variable()
+        param.get_trigger()
+    render = time.perf_counter() - tic
+    del params
+
+    gc.collect()
+    tracemalloc.start()
+    params = [factory(**kwargs) for kwargs in definitions]
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del params
+
+    print(
+        f"{label:>10}: construct {construct:6.2f} s, render {render:6.2f} s, "
+        f"retained {retained / 2**20:8.1f} MiB"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=1_000)
+    args = parser.parse_args()
+
+    print(f"{args.count} parameters, {args.distinct} distinct definitions")
+    run("dataclass", TerraformModuleParameter, args.count, args.distinct)
+    run("frozen", FrozenModuleParameter, args.count, args.distinct)
+    run("interned", FrozenModuleParameter.intern, args.count, args.distinct)
+
+
+if __name__ == "__main__":
+    main()
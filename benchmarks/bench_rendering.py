@@ -0,0 +1,76 @@
+"""Benchmark module rendering on large parameter lists.
+
+Measures wall time and peak traced memory of ``get_mixed`` for data source
+and null resource modules.
+
+Usage:
+    python benchmarks/bench_rendering.py [--params N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+from python_terraform_bridge.module_resources import TerraformModuleResources
+from python_terraform_bridge.parameter import TerraformModuleParameter
+
+
+def build_resources(param_count: int, module_type: str) -> TerraformModuleResources:
+    """Build a module with many parameters, env variables and outputs."""
+    resources = TerraformModuleResources(
+        module_name="bench_method",
+        docstring="Benchmark method.\n\ngenerator=key: results",
+        module_type=module_type,
+        module_params=[
+            TerraformModuleParameter(
+                name=f"param_{i}",
+                type="map(any)" if i % 3 == 0 else "string",
+                json_encode=i % 3 == 0,
+                base64_encode=i % 6 == 0,
+                required=i % 2 == 0,
+                default=None if i % 2 == 0 else f"value_{i}",
+            )
+            for i in range(param_count)
+        ],
+    )
+    resources.foreach_only.extend(f"param_{i}" for i in range(0, param_count, 10))
+    resources.env_variables.update({f"ENV_{i}": {"required": False} for i in range(20)})
+    resources.extra_outputs.update({f"extra_{i}": {} for i in range(10)})
+    return resources
+
+
+def measure(resources: TerraformModuleResources, repeat: int) -> tuple[float, int]:
+    """Return (seconds per render, peak bytes of one render)."""
+    tic = time.perf_counter()
+    for _ in range(repeat):
+        resources.get_mixed()
+    elapsed = (time.perf_counter() - tic) / repeat
+
+    tracemalloc.start()
+    resources.get_mixed()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--params", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    for module_type in ("data_source", "null_resource"):
+        resources = build_resources(args.params, module_type)
+        elapsed, peak = measure(resources, args.repeat)
+        print(
+            f"{module_type:>13}: {elapsed * 1000:8.3f} ms/render, "
+            f"peak {peak / 1024:8.1f} KiB ({args.params} params)"
+        )
+
+
+if __name__ == "__main__":
+    main()
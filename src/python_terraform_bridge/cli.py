@@ -13,61 +13,254 @@ from pathlib import Path
 from typing import Any
 
 
+def _import_target(target: str) -> Any:
+    """Import a ``module:Class`` target, printing an error on failure."""
+    import importlib
+
+    module_path, class_name = target.rsplit(":", 1)
+    try:
+        module = importlib.import_module(module_path)
+        return getattr(module, class_name)
+    except (ImportError, AttributeError) as e:
+        print(f"Error importing {target}: {e}", file=sys.stderr)
+        return None
+
+
+def _load_static_methods(target: str) -> dict[str, Any] | None:
+    """Read a ``module:Class`` target's methods from source without importing."""
+    from python_terraform_bridge.static import load_static_methods
+
+    try:
+        methods = load_static_methods(target)
+    except (ImportError, AttributeError, SyntaxError, RuntimeError) as e:
+        print(f"Error reading {target}: {e}", file=sys.stderr)
+        return None
+
+    for name, method in methods.items():
+        if method.unresolved_options:
+            print(
+                f"Warning: {name}: non-literal decorator arguments ignored: "
+                + ", ".join(method.unresolved_options),
+                file=sys.stderr,
+            )
+
+    return methods
+
+
+def _load_manifest(manifest_path: str) -> Any:
+    """Load a registry manifest, printing an error on failure."""
+    from python_terraform_bridge.registry import TerraformRegistry
+
+    try:
+        return TerraformRegistry.from_manifest(manifest_path)
+    except (OSError, ValueError) as e:
+        print(f"Error loading manifest {manifest_path}: {e}", file=sys.stderr)
+        return None
+
+
+def _get_source_checksum(enabled: bool, import_path: str | None) -> str | None:
+    """Hash a method's source for ``generate --source-checksum``."""
+    if not enabled:
+        return None
+
+    from python_terraform_bridge.static import get_method_checksum
+
+    if import_path is None:
+        raise RuntimeError("Cannot hash the source of a locally defined method")
+
+    try:
+        return get_method_checksum(import_path)
+    except (ImportError, AttributeError, OSError, SyntaxError) as e:
+        raise RuntimeError(f"Failed to hash the source of {import_path}: {e}") from e
+
+
+def watch_command(args: argparse.Namespace, binary_name: str) -> int:
+    """Handle 'generate --watch': regenerate modules as the source changes."""
+    from python_terraform_bridge.watch import ModuleWatcher, get_file_watcher
+
+    if args.manifest or args.dedupe:
+        print(
+            "Error: --watch cannot be combined with --manifest or --dedupe",
+            file=sys.stderr,
+        )
+        return 1
+
+    try:
+        watcher = ModuleWatcher(
+            args.target,
+            terraform_modules_dir=args.output,
+            terraform_modules_class=args.module_class,
+            binary_name=binary_name,
+            source_checksum=args.source_checksum,
+        )
+    except ImportError as e:
+        print(f"Error reading {args.target}: {e}", file=sys.stderr)
+        return 1
+
+    def refresh() -> None:
+        try:
+            changed = watcher.refresh()
+        except (AttributeError, SyntaxError, RuntimeError) as e:
+            print(f"Error generating modules: {e}", file=sys.stderr)
+            return
+
+        for module_path in changed:
+            print(f"Generated: {module_path}")
+        print(
+            f"{len(changed)} of {len(watcher.rendered)} modules updated, "
+            f"watching {watcher.source_path}"
+        )
+
+    refresh()
+    with get_file_watcher([watcher.source_path], interval=args.poll_interval) as files:
+        try:
+            while True:
+                if files.wait():
+                    refresh()
+        except KeyboardInterrupt:
+            return 0
+
+
 def generate_command(args: argparse.Namespace) -> int:
     """Handle the 'generate' subcommand.
 
     Generates Terraform modules from a Python class.
     """
-    from extended_data_types import get_available_methods
-
     from python_terraform_bridge.module_resources import TerraformModuleResources
 
-    # Import the target class
-    module_path, class_name = args.target.rsplit(":", 1)
-    try:
-        import importlib
+    output_dir = Path(args.output)
+    binary_name = args.binary or "python -m python_terraform_bridge"
 
-        module = importlib.import_module(module_path)
-        target_class = getattr(module, class_name)
-    except (ImportError, AttributeError) as e:
-        print(f"Error importing {args.target}: {e}", file=sys.stderr)
+    if args.watch:
+        return watch_command(args, binary_name)
+
+    try:
+        if args.manifest:
+            registry = _load_manifest(args.manifest)
+            if registry is None:
+                return 1
+
+            all_resources = registry.get_all_resources(
+                str(output_dir), binary_name, source_checksum=args.source_checksum
+            )
+        elif args.static:
+            methods = _load_static_methods(args.target)
+            if methods is None:
+                return 1
+
+            module_path, class_name = args.target.rsplit(":", 1)
+            all_resources = [
+                method.to_module_resources(
+                    terraform_modules_dir=str(output_dir),
+                    terraform_modules_class=args.module_class,
+                    binary_name=binary_name,
+                    checksum=_get_source_checksum(
+                        args.source_checksum,
+                        f"{module_path}:{class_name}.{method_name}",
+                    ),
+                )
+                for method_name, method in methods.items()
+                if not method_name.startswith("_")
+            ]
+        else:
+            target_class = _import_target(args.target)
+            if target_class is None:
+                return 1
+
+            from extended_data_types import get_available_methods
+
+            from python_terraform_bridge.registry import get_import_path
+
+            all_resources = [
+                TerraformModuleResources(
+                    module_name=method_name,
+                    docstring=docstring,
+                    terraform_modules_dir=str(output_dir),
+                    terraform_modules_class=args.module_class,
+                    binary_name=binary_name,
+                    checksum=_get_source_checksum(
+                        args.source_checksum,
+                        get_import_path(getattr(target_class, method_name)),
+                    ),
+                )
+                for method_name, docstring in get_available_methods(
+                    target_class
+                ).items()
+                if not method_name.startswith("_")
+                and not (docstring and "NOPARSE" in docstring)
+            ]
+
+        TerraformModuleResources.link_composites(all_resources)
+    except RuntimeError as e:
+        print(f"Error generating modules: {e}", file=sys.stderr)
         return 1
 
-    output_dir = Path(args.output)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    shard_weights = None
+    if args.shard:
+        from python_terraform_bridge import sharding
 
-    methods = get_available_methods(target_class)
+        if args.dedupe:
+            print("Error: --shard cannot be combined with --dedupe", file=sys.stderr)
+            return 1
 
-    generated = 0
-    for method_name, docstring in methods.items():
-        if method_name.startswith("_"):
-            continue
-        if docstring and "NOPARSE" in docstring:
-            continue
+        try:
+            sharding.parse_shard(args.shard)
+            if args.shard_weights:
+                shard_weights = sharding.load_timings(args.shard_weights)
+        except (OSError, ValueError) as e:
+            print(f"Error selecting shard {args.shard}: {e}", file=sys.stderr)
+            return 1
 
-        resources = TerraformModuleResources(
-            module_name=method_name,
-            docstring=docstring,
-            terraform_modules_dir=str(output_dir),
-            terraform_modules_class=args.module_class,
-            binary_name=args.binary or "python -m python_terraform_bridge",
+    from python_terraform_bridge.generation import write_modules
+
+    try:
+        generated = write_modules(
+            all_resources,
+            output_dir,
+            staged=not args.no_stage,
+            dedupe=args.dedupe,
+            shard=args.shard,
+            shard_weights=shard_weights,
         )
+    except RuntimeError as e:
+        print(f"Error generating modules: {e}", file=sys.stderr)
+        return 1
 
-        if resources.generation_forbidden:
-            continue
+    for module_path in generated.paths.values():
+        print(f"Generated: {module_path}")
 
-        module_path = resources.get_module_path()
-        module_json = resources.get_mixed()
+    print(f"\nGenerated {len(generated.paths)} Terraform modules in {output_dir}")
+    if generated.shard_manifest is not None:
+        print(f"Wrote shard {args.shard} manifest to {generated.shard_manifest}")
+    if generated.store is not None:
+        store = generated.store
+        print(
+            f"Stored {len(store.stored)} distinct modules in {store.store_dir} "
+            f"(dedup ratio {store.dedup_ratio:.2f}x)"
+        )
+    return 0
 
-        module_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with module_path.open("w") as f:
-            json.dump(module_json, f, indent=2)
+def merge_shards_command(args: argparse.Namespace) -> int:
+    """Handle the 'merge-shards' subcommand.
 
-        print(f"Generated: {module_path}")
-        generated += 1
+    Combines the output directories of a sharded generation.
+    """
+    from python_terraform_bridge.sharding import merge_shards, write_timings
+
+    try:
+        timings = merge_shards(args.shard_dirs, args.output)
+    except (OSError, RuntimeError) as e:
+        print(f"Error merging shards: {e}", file=sys.stderr)
+        return 1
 
-    print(f"\nGenerated {generated} Terraform modules in {output_dir}")
+    if args.timings:
+        write_timings(timings, args.timings)
+
+    print(
+        f"Merged {len(timings)} modules from {len(args.shard_dirs)} shards "
+        f"into {args.output}"
+    )
     return 0
 
 
@@ -76,20 +269,26 @@ def list_command(args: argparse.Namespace) -> int:
 
     Lists available methods from a Python class.
     """
-    from extended_data_types import get_available_methods
-
-    # Import the target class
-    module_path, class_name = args.target.rsplit(":", 1)
-    try:
-        import importlib
+    if args.manifest:
+        registry = _load_manifest(args.manifest)
+        if registry is None:
+            return 1
+
+        methods: dict[str, str | None] = registry.list_methods()
+    elif args.static:
+        static_methods = _load_static_methods(args.target)
+        if static_methods is None:
+            return 1
+
+        methods = {name: method.docstring for name, method in static_methods.items()}
+    else:
+        target_class = _import_target(args.target)
+        if target_class is None:
+            return 1
 
-        module = importlib.import_module(module_path)
-        target_class = getattr(module, class_name)
-    except (ImportError, AttributeError) as e:
-        print(f"Error importing {args.target}: {e}", file=sys.stderr)
-        return 1
+        from extended_data_types import get_available_methods
 
-    methods = get_available_methods(target_class)
+        methods = get_available_methods(target_class)
 
     if args.json:
         output: dict[str, Any] = {}
@@ -101,7 +300,7 @@ def list_command(args: argparse.Namespace) -> int:
             output[name] = docs.splitlines()[0] if docs else ""
         print(json.dumps(output, indent=2))
     else:
-        print(f"Methods in {args.target}:\n")
+        print(f"Methods in {args.target or args.manifest}:\n")
         for name, docs in methods.items():
             if name.startswith("_"):
                 continue
@@ -113,30 +312,68 @@ def list_command(args: argparse.Namespace) -> int:
     return 0
 
 
-def run_command(args: argparse.Namespace) -> int:
-    """Handle the 'run' subcommand.
+def manifest_command(args: argparse.Namespace) -> int:
+    """Handle the 'manifest' subcommand.
 
-    Runs as a Terraform external data provider.
+    Imports a module once and writes its registry to a manifest file.
     """
-    # This is for direct invocation - handled by __main__.py
-    # This subcommand provides an explicit way to run
     import importlib
 
-    from python_terraform_bridge.runtime import TerraformRuntime
+    from python_terraform_bridge.registry import TerraformRegistry, get_global_registry
 
-    # Import the target class
-    module_path, class_name = args.target.rsplit(":", 1)
+    module_path, _, attr_name = args.target.partition(":")
     try:
         module = importlib.import_module(module_path)
-        target_class = getattr(module, class_name)
+        registry = getattr(module, attr_name) if attr_name else get_global_registry()
     except (ImportError, AttributeError) as e:
         print(f"Error importing {args.target}: {e}", file=sys.stderr)
         return 1
 
-    runtime = TerraformRuntime(data_source_class=target_class)
+    if not isinstance(registry, TerraformRegistry):
+        print(f"{args.target} is not a TerraformRegistry", file=sys.stderr)
+        return 1
+
+    manifest = registry.export_manifest(args.output)
+
+    print(f"Wrote {len(manifest['methods'])} methods to {args.output}")
+    return 0
+
+
+def run_command(args: argparse.Namespace) -> int:
+    """Handle the 'run' subcommand.
+
+    Runs as a Terraform external data provider.
+    """
+    # This is for direct invocation - handled by __main__.py
+    # This subcommand provides an explicit way to run
+    from python_terraform_bridge.registry import TerraformRegistry
+    from python_terraform_bridge.runtime import TerraformRuntime
 
-    # Get remaining args as method name
     method_args = args.method_args or []
+
+    if args.manifest:
+        registry = _load_manifest(args.manifest)
+        if registry is None:
+            return 1
+
+        # Without a target, the first positional is part of the method name
+        if args.target:
+            method_args = [args.target, *method_args]
+
+        registry.run(method_args)
+        return 0
+
+    target = _import_target(args.target)
+    if target is None:
+        return 1
+
+    if isinstance(target, TerraformRegistry):
+        target.run(method_args)
+        return 0
+
+    runtime = TerraformRuntime(data_source_class=target)
+
+    # Get remaining args as method name
     runtime.run(method_args)
     return 0
 
@@ -162,6 +399,7 @@ def main(argv: list[str] | None = None) -> int:
     )
     gen_parser.add_argument(
         "target",
+        nargs="?",
         help="Python class to generate from (e.g., mymodule:MyClass)",
     )
     gen_parser.add_argument(
@@ -182,6 +420,63 @@ def main(argv: list[str] | None = None) -> int:
         default=None,
         help="Binary command for runtime invocation",
     )
+    gen_parser.add_argument(
+        "--static",
+        action="store_true",
+        help="Read the target's source with ast instead of importing it",
+    )
+    gen_parser.add_argument(
+        "-m",
+        "--manifest",
+        default=None,
+        help="Registry manifest to generate from instead of a target",
+    )
+    gen_parser.add_argument(
+        "--source-checksum",
+        action="store_true",
+        help="Default each checksum variable to a hash of the method's source",
+    )
+    gen_parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Store each distinct module once and write thin per-method wrappers",
+    )
+    gen_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "Keep running and regenerate changed modules when the target's "
+            "source changes (reads the source like --static)"
+        ),
+    )
+    gen_parser.add_argument(
+        "--no-stage",
+        action="store_true",
+        help=(
+            "Overwrite files in place. By default modules are written to a "
+            "temporary sibling directory, fsynced with the directories they "
+            "land in, then renamed into place (new output directory) or moved "
+            "in file by file with os.replace"
+        ),
+    )
+    gen_parser.add_argument(
+        "--shard",
+        default=None,
+        metavar="INDEX/COUNT",
+        help="Only write the modules of this shard (0-based, e.g. 0/4)",
+    )
+    gen_parser.add_argument(
+        "--shard-weights",
+        default=None,
+        metavar="TIMINGS",
+        help="Timings file from merge-shards --timings, to balance shards by cost",
+    )
+    gen_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=0.5,
+        help="Seconds between checks when --watch cannot use inotify",
+    )
 
     # List command
     list_parser = subparsers.add_parser(
@@ -190,6 +485,7 @@ def main(argv: list[str] | None = None) -> int:
     )
     list_parser.add_argument(
         "target",
+        nargs="?",
         help="Python class to inspect (e.g., mymodule:MyClass)",
     )
     list_parser.add_argument(
@@ -197,6 +493,56 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Output as JSON",
     )
+    list_parser.add_argument(
+        "--static",
+        action="store_true",
+        help="Read the target's source with ast instead of importing it",
+    )
+    list_parser.add_argument(
+        "-m",
+        "--manifest",
+        default=None,
+        help="Registry manifest to list instead of a target",
+    )
+
+    # Merge shards command
+    merge_parser = subparsers.add_parser(
+        "merge-shards",
+        help="Combine the output directories of a sharded generate",
+    )
+    merge_parser.add_argument(
+        "shard_dirs",
+        nargs="+",
+        help="Output directories of the shards",
+    )
+    merge_parser.add_argument(
+        "-o",
+        "--output",
+        default="terraform-modules",
+        help="Directory to merge the modules into",
+    )
+    merge_parser.add_argument(
+        "--timings",
+        default=None,
+        help="Write the combined per-module timings here for --shard-weights",
+    )
+
+    # Manifest command
+    manifest_parser = subparsers.add_parser(
+        "manifest",
+        help="Export a TerraformRegistry to a manifest file",
+    )
+    manifest_parser.add_argument(
+        "target",
+        help="Registry to export (e.g., mymodule:registry, or mymodule for the "
+        "global registry)",
+    )
+    manifest_parser.add_argument(
+        "-o",
+        "--output",
+        default="terraform-bridge-manifest.json",
+        help="Manifest file to write",
+    )
 
     # Run command
     run_parser = subparsers.add_parser(
@@ -205,13 +551,20 @@ def main(argv: list[str] | None = None) -> int:
     )
     run_parser.add_argument(
         "target",
-        help="Python class to run (e.g., mymodule:MyClass)",
+        nargs="?",
+        help="Python class or registry to run (e.g., mymodule:MyClass)",
     )
     run_parser.add_argument(
         "method_args",
         nargs="*",
         help="Method name (parts separated by spaces become underscores)",
     )
+    run_parser.add_argument(
+        "-m",
+        "--manifest",
+        default=None,
+        help="Registry manifest to run from instead of a target",
+    )
 
     args = parser.parse_args(argv)
 
@@ -219,10 +572,19 @@ def main(argv: list[str] | None = None) -> int:
         parser.print_help()
         return 0
 
+    if args.command in ("generate", "list", "run") and not (
+        args.target or args.manifest
+    ):
+        parser.error(f"{args.command} requires a target or --manifest")
+
     if args.command == "generate":
         return generate_command(args)
     elif args.command == "list":
         return list_command(args)
+    elif args.command == "manifest":
+        return manifest_command(args)
+    elif args.command == "merge-shards":
+        return merge_shards_command(args)
     elif args.command == "run":
         return run_command(args)
 
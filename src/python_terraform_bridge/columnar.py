@@ -0,0 +1,161 @@
+"""Column-oriented encoding of record results.
+
+Methods returning many records with the same fields repeat every field
+name in every record. With ``columnar`` output the runtime sends the
+primary value as one array per field instead::
+
+    [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    -> {"columns": {"id": [1, 2], "name": ["a", "b"]}}
+
+    {"u1": {"id": 1}, "u2": {"id": 2}}
+    -> {"keys": ["u1", "u2"], "columns": {"id": [1, 2]}}
+
+The generated module decodes that once and rebuilds the records with
+``for`` expressions (``get_records_expression``), so callers see the same
+output as before. Fields missing from some records come back as null.
+
+Example:
+    @registry.data_source(key="users", columnar=True)
+    def list_users() -> list[dict]: ...
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+
+COLUMNS_FIELD = "columns"
+KEYS_FIELD = "keys"
+
+
+class ColumnarBuilder:
+    """Collects records into columns, one record at a time.
+
+    Attributes:
+        columns: Values of each field, one per record added so far.
+        keys: Keys of the records, for results that are dicts of records.
+        rows: Number of records added.
+    """
+
+    def __init__(self, keyed: bool | None = None) -> None:
+        """Initialize an empty builder.
+
+        Args:
+            keyed: Whether records come from a dict result. None decides on
+                the first record added.
+        """
+        self.columns: dict[str, list[Any]] = {}
+        self.keys: list[str] | None = [] if keyed else None
+        self._keyed = keyed
+        self.rows = 0
+
+    def add(self, record: Any, key: Any = None) -> None:
+        """Add a record.
+
+        Args:
+            record: Dict of field values.
+            key: Key of the record in a dict result; None for list results.
+
+        Raises:
+            ValueError: If the record is not a dict, or keyed and unkeyed
+                records are mixed.
+        """
+        if not isinstance(record, Mapping):
+            raise ValueError(
+                f"Columnar output needs dict records, not {type(record).__name__}"
+            )
+
+        if self._keyed is None:
+            self._keyed = key is not None
+            self.keys = [] if self._keyed else None
+        elif (key is None) == self._keyed:
+            raise ValueError("Columnar output cannot mix keyed and listed records")
+
+        for name in record:
+            if name not in self.columns:
+                # Earlier records lack the field
+                self.columns[name] = [None] * self.rows
+
+        for name, column in self.columns.items():
+            column.append(record.get(name))
+
+        if self.keys is not None:
+            self.keys.append(str(key))
+        self.rows += 1
+
+    def get(self) -> dict[str, Any]:
+        """Return the columnar value."""
+        value: dict[str, Any] = {COLUMNS_FIELD: self.columns}
+        if self.keys is not None:
+            value[KEYS_FIELD] = self.keys
+
+        return value
+
+
+def check_columnar_output(columnar: Any, plaintext_output: Any) -> None:
+    """Reject columnar output combined with plaintext output.
+
+    The generated module decodes the columns as base64 JSON, so a plaintext
+    entry would fail to rebuild and silently yield no records.
+
+    Raises:
+        ValueError: If both options are set.
+    """
+    if columnar and plaintext_output:
+        raise ValueError("columnar output cannot be combined with plaintext_output")
+
+
+def to_columnar(result: Any) -> dict[str, Any]:
+    """Convert a list or dict of records to columns.
+
+    Args:
+        result: List of records, or dict mapping keys to records.
+
+    Returns:
+        Columnar value.
+
+    Raises:
+        ValueError: If the result is not a list or dict of dict records.
+    """
+    if isinstance(result, Mapping):
+        builder = ColumnarBuilder(keyed=True)
+        for key, record in result.items():
+            builder.add(record, key=key)
+    elif isinstance(result, (list, tuple)):
+        builder = ColumnarBuilder(keyed=False)
+        for record in result:
+            builder.add(record)
+    else:
+        raise ValueError(
+            "Columnar output needs a list or dict of records, "
+            f"not {type(result).__name__}"
+        )
+
+    return builder.get()
+
+
+def get_records_expression(columns_local: str) -> str:
+    """Terraform expression rebuilding records from a columnar local.
+
+    Dict results are rebuilt from their keys. List results iterate the
+    first column instead of ``range()``, which is capped at 1024 elements.
+    An empty list result has no columns and falls back to ``[]``.
+
+    Args:
+        columns_local: Name of the local holding the decoded columnar value.
+
+    Returns:
+        Interpolation string.
+    """
+    value = f"local.{columns_local}"
+    columns = f"{value}.{COLUMNS_FIELD}"
+    record = f"{{ for name, column in {columns} : name => column[i] }}"
+
+    return (
+        "${try("
+        f"{{ for i, key in {value}.{KEYS_FIELD} : key => {record} }}, "
+        f"[ for i, _ in values({columns})[0] : {record} ], "
+        "[]"
+        ")}"
+    )
@@ -0,0 +1,142 @@
+"""Writing generated modules to an output directory.
+
+``write_modules`` is the write loop shared by
+``TerraformRegistry.generate_modules`` and the ``generate`` CLI command:
+it optionally selects a shard, writes each module in place, through a
+``StagedTree`` or into a deduplicating ``ModuleStore``, and records how
+long each module took for shard manifests.
+
+Example:
+    generated = write_modules(all_resources, "terraform-modules", dedupe=True)
+    print(generated.paths, generated.store.dedup_ratio)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import time
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from python_terraform_bridge.module_resources import TerraformModuleResources
+    from python_terraform_bridge.sharding import ShardSpec
+    from python_terraform_bridge.store import ModuleStore
+
+
+@dataclass
+class GeneratedModules:
+    """Result of ``write_modules``.
+
+    Attributes:
+        paths: Module path written for each method, in generation order.
+        timings: Seconds spent on each relative module path (not recorded
+            for deduplicated modules).
+        store: The module store, when deduplicating.
+        shard_manifest: Path of the shard manifest, when sharding.
+    """
+
+    paths: dict[str, Path] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+    store: ModuleStore | None = None
+    shard_manifest: Path | None = None
+
+
+def write_modules(
+    all_resources: Iterable[TerraformModuleResources],
+    output_dir: Path | str,
+    *,
+    staged: bool = True,
+    dedupe: bool = False,
+    shard: ShardSpec | None = None,
+    shard_weights: Mapping[str, float] | None = None,
+) -> GeneratedModules:
+    """Write the modules of the given resources.
+
+    Resources with generation forbidden are skipped. If writing fails, a
+    staged output directory is left as it was.
+
+    Args:
+        all_resources: Resources of every method.
+        output_dir: Directory to write modules to.
+        staged: Write the modules to a temporary sibling directory and move
+            them in once all are written (see
+            ``python_terraform_bridge.staging.StagedTree``), instead of
+            overwriting files in place one by one.
+        dedupe: Write each distinct module once to a content-addressed store
+            and a thin wrapper module per method (see
+            ``python_terraform_bridge.store.ModuleStore``).
+        shard: Only write the modules of shard ``"INDEX/COUNT"`` (or
+            ``(index, count)``) and record them in a shard manifest for
+            ``python_terraform_bridge.sharding.merge_shards``.
+        shard_weights: Seconds per relative module path from an earlier run,
+            to balance shards by cost instead of by count.
+
+    Returns:
+        The written modules.
+
+    Raises:
+        ValueError: If the shard is invalid or combined with dedupe.
+    """
+    if dedupe and shard is not None:
+        raise ValueError("Sharded generation cannot be deduplicated")
+
+    if shard is not None:
+        from python_terraform_bridge import sharding
+
+        all_resources = sharding.select_shard(
+            all_resources, output_dir, shard, shard_weights
+        )
+
+    if staged:
+        from python_terraform_bridge.staging import StagedTree
+
+        stage_context: Any = StagedTree(output_dir)
+    else:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        stage_context = contextlib.nullcontext()
+
+    generated = GeneratedModules()
+    with stage_context as stage:
+        if dedupe:
+            from python_terraform_bridge.store import ModuleStore
+
+            generated.store = ModuleStore(output_dir, stage=stage)
+
+        for resources in all_resources:
+            if resources.generation_forbidden:
+                continue
+
+            if generated.store is not None:
+                generated.paths[resources.module_name] = generated.store.add(resources)
+                continue
+
+            tic = time.perf_counter()
+            module_path = resources.get_module_path()
+            module_json = resources.get_mixed()
+
+            if stage is not None:
+                stage.write_json(module_path, module_json)
+            else:
+                module_path.parent.mkdir(parents=True, exist_ok=True)
+
+                with module_path.open("w") as f:
+                    json.dump(module_json, f, indent=2)
+
+            generated.paths[resources.module_name] = module_path
+            generated.timings[module_path.relative_to(output_dir).as_posix()] = (
+                time.perf_counter() - tic
+            )
+
+    if shard is not None:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        generated.shard_manifest = sharding.write_shard_manifest(
+            output_dir, shard, generated.timings
+        )
+
+    return generated
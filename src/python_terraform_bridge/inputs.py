@@ -0,0 +1,251 @@
+"""Typed decoding of Terraform inputs.
+
+Terraform hands every input to the runtime as a string: external data query
+values are stringified, and null resource triggers arrive through the
+environment. Parameters may additionally be wrapped as
+``base64encode(jsonencode(var.x))`` by ``TerraformModuleParameter.get_trigger``.
+
+This module compiles a decoder per method from its parameter list that turns
+those strings back into Python values. Every input is validated and decoded
+before the method's owner is created, so bad calls fail before any
+expensive work.
+
+Null resources with ``spill_inputs`` pass large inputs as files instead
+(see ``TerraformModuleResources.get_null_resource``): the environment holds
+``<name>__file`` with the file's path, and ``resolve_file_inputs`` replaces
+it with the file's content before decoding.
+
+Example:
+    decoder = InputDecoder(config.parameters)
+    decoded = decoder.decode({"limit": "10", "filters": "eyJhIjogMX0="})
+    decoded["limit"]    # 10
+    decoded["filters"]  # {"a": 1}
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import mmap
+import os
+
+from collections.abc import Callable, Iterable, Mapping, MutableMapping
+from typing import TYPE_CHECKING, Any
+
+from extended_data_types import strtobool
+
+
+if TYPE_CHECKING:
+    from python_terraform_bridge.parameter import TerraformModuleParameter
+
+
+# Terraform collection types that cannot travel through a query as-is
+STRUCTURED_TYPES = frozenset({"list", "set", "tuple", "map", "object"})
+
+# Suffix of inputs holding the path of a file with the input's value
+FILE_INPUT_SUFFIX = "__file"
+
+# Input files at least this large are memory-mapped rather than read
+MMAP_THRESHOLD = 1024 * 1024
+
+
+def get_base_type(tf_type: str | None) -> str:
+    """Return the outer Terraform type name (``map(string)`` -> ``map``)."""
+    if not tf_type:
+        return "any"
+
+    return tf_type.split("(", 1)[0].strip()
+
+
+def _to_number(value: Any) -> int | float:
+    """Convert a Terraform number to int or float."""
+    if isinstance(value, bool):
+        raise ValueError(f"expected a number, got {value!r}")
+    if isinstance(value, (int, float)):
+        return value
+
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return float(value)
+
+
+def _to_bool(value: Any) -> bool:
+    """Convert a Terraform bool to bool."""
+    if isinstance(value, bool):
+        return value
+
+    converted = strtobool(str(value))
+    if converted is None:
+        raise ValueError(f"expected a bool, got {value!r}")
+
+    return converted
+
+
+def _base64_decode(value: Any) -> Any:
+    """Undo ``base64encode`` for string values."""
+    if not isinstance(value, str):
+        return value
+
+    try:
+        return base64.b64decode(value, validate=True).decode()
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError("invalid base64 payload") from exc
+
+
+def _json_decode(value: Any) -> Any:
+    """Undo ``jsonencode`` for string values."""
+    if not isinstance(value, str):
+        return value
+
+    return json.loads(value)
+
+
+def _compose(*steps: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Chain decoding steps into a single callable."""
+    if len(steps) == 1:
+        return steps[0]
+
+    def decode(value: Any) -> Any:
+        for step in steps:
+            value = step(value)
+        return value
+
+    return decode
+
+
+class _FieldDecoder:
+    """Compiled decoding plan for a single parameter."""
+
+    __slots__ = ("name", "required", "coerce", "decode")
+
+    def __init__(self, param: TerraformModuleParameter) -> None:
+        self.name = param.name
+        self.required = param.required
+
+        base_type = get_base_type(param.type)
+        self.coerce: Callable[[Any], Any] | None = None
+        if base_type == "number":
+            self.coerce = _to_number
+        elif base_type == "bool":
+            self.coerce = _to_bool
+
+        steps: list[Callable[[Any], Any]] = []
+        if param.base64_encode:
+            steps.append(_base64_decode)
+        if param.json_encode or base_type in STRUCTURED_TYPES:
+            steps.append(_json_decode)
+
+        self.decode = _compose(*steps) if steps else None
+
+
+class InputDecoder:
+    """Decoder compiled once from a method's parameter list.
+
+    Attributes:
+        names: Parameter names in declaration order.
+    """
+
+    def __init__(self, parameters: Iterable[TerraformModuleParameter]) -> None:
+        """Compile decoding plans for each parameter.
+
+        Args:
+            parameters: Parameter definitions for the method.
+        """
+        self._fields = tuple(_FieldDecoder(param) for param in parameters)
+        self.names = tuple(field.name for field in self._fields)
+
+    def decode(self, inputs: Mapping[str, Any]) -> dict[str, Any]:
+        """Validate and decode raw inputs for one invocation.
+
+        Inputs that do not match a parameter are ignored.
+
+        Args:
+            inputs: Raw inputs from Terraform or a caller.
+
+        Returns:
+            Decoded inputs by parameter name.
+
+        Raises:
+            ValueError: If required inputs are missing, or an input does not
+                match its declared type or cannot be decoded.
+        """
+        values: dict[str, Any] = {}
+        missing: list[str] = []
+        invalid: list[str] = []
+
+        for field in self._fields:
+            if field.name not in inputs:
+                if field.required:
+                    missing.append(field.name)
+                continue
+
+            value = inputs[field.name]
+
+            try:
+                if field.coerce is not None:
+                    value = field.coerce(value)
+                if field.decode is not None and isinstance(value, str):
+                    value = field.decode(value)
+            except (TypeError, ValueError) as exc:
+                invalid.append(f"{field.name} ({exc})")
+                continue
+
+            values[field.name] = value
+
+        if missing or invalid:
+            problems = []
+            if missing:
+                problems.append(f"missing required inputs {missing}")
+            if invalid:
+                problems.append(f"invalid inputs {invalid}")
+            raise ValueError("; ".join(problems))
+
+        return values
+
+
+def read_input_file(path: str | os.PathLike[str]) -> str:
+    """Read a spilled input.
+
+    Large files are memory-mapped and decoded straight from the mapping,
+    so the content is not copied into an intermediate bytes object.
+
+    Args:
+        path: Path of the input file.
+
+    Returns:
+        The file's text.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size < MMAP_THRESHOLD:
+            return file.read().decode()
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, "utf-8")
+
+
+def resolve_file_inputs(inputs: MutableMapping[str, Any]) -> None:
+    """Replace ``<name>__file`` inputs with the content of their files.
+
+    A value given directly for ``<name>`` wins over its file.
+
+    Args:
+        inputs: Raw inputs, updated in place.
+
+    Raises:
+        ValueError: If an input file cannot be read.
+    """
+    for key in [key for key in inputs if key.endswith(FILE_INPUT_SUFFIX)]:
+        name = key.removesuffix(FILE_INPUT_SUFFIX)
+        path = inputs.pop(key)
+        if not name or name in inputs:
+            continue
+
+        try:
+            inputs[name] = read_input_file(path)
+        except (OSError, UnicodeDecodeError) as exc:
+            raise ValueError(f"Failed to read input file for {name}: {exc}") from exc
@@ -7,19 +7,95 @@ Terraform module JSON from Python class methods.
 from __future__ import annotations
 
 import concurrent.futures
+import functools
 import json
+import os
+import sys
 import time
 
-from copy import deepcopy
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from pathlib import Path
 from shlex import quote as shlex_quote
 from shlex import split as shlex_split
-from typing import Any
+from types import MappingProxyType
+from typing import Any, TypeVar
 
 from extended_data_types import is_nothing, strtobool
 from tssplit import tssplit
 
+from python_terraform_bridge.columnar import check_columnar_output
+from python_terraform_bridge.inputs import FILE_INPUT_SUFFIX
 from python_terraform_bridge.parameter import TerraformModuleParameter
+from python_terraform_bridge.projection import PROJECTION_VARIABLE
+from python_terraform_bridge.result_files import HASH_KEY, PATH_KEY, get_result_mode
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+# Where generated modules read the runtime's result entries from
+EXTERNAL_RESULT = "data.external.default.result"
+
+# Local holding the decoded result file of result_mode: file modules
+RESULT_FILE_LOCAL = "result_file"
+
+# Directory, below the module, of spilled null resource inputs
+SPILL_DIR = ".bridge-inputs"
+
+# Configuration attributes made read-only by TerraformModuleResources.seal()
+SEALED_ATTRIBUTES = (
+    "module_parameters",
+    "module_parameter_names",
+    "generator_parameters",
+    "extra_outputs",
+    "sub_keys",
+    "composite_members",
+    "env_variables",
+    "sensitive_env_variables",
+    "required_providers",
+    "copy_variables_to",
+    "foreach_modules",
+    "foreach_keys",
+    "foreach_values",
+    "foreach_only",
+    "foreach_forbidden",
+)
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only view of nested dicts, lists and sets."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _memoized(method: F) -> F:
+    """Cache a rendering method's results while its resources are sealed.
+
+    Results are shared between callers, so they must be treated as
+    read-only.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: TerraformModuleResources, *args: Any, **kwargs: Any) -> Any:
+        cache = self._render_cache
+        if cache is None:
+            return method(self, *args, **kwargs)
+
+        try:
+            key = (method.__name__, args, frozenset(kwargs.items()))
+            return cache[key]
+        except TypeError:
+            # Unhashable arguments
+            return method(self, *args, **kwargs)
+        except KeyError:
+            return cache.setdefault(key, method(self, *args, **kwargs))
+
+    return wrapper  # type: ignore[return-value]
 
 
 def get_json_export_for_chunk(chunk: str) -> tuple[str, Any]:
@@ -39,9 +115,304 @@ def get_json_export_for_chunk(chunk: str) -> tuple[str, Any]:
         return k, v
 
 
+# Refresh interval units: (formatdate layout of the enclosing period,
+# formatdate layout of the unit within it, units per period)
+_REFRESH_UNITS = {
+    "m": ("YYYYMMDDhh", "m", 60),
+    "h": ("YYYYMMDD", "h", 24),
+    "d": ("YYYYMM", "D", None),
+}
+
+
+# Local holding the plan's timestamp, read by refresh triggers
+PLAN_TIME_LOCAL = "plan_time"
+
+
+def get_plan_time_locals(triggers: Mapping[str, str]) -> dict[str, str]:
+    """Return the plan timestamp local if any trigger reads it.
+
+    Args:
+        triggers: Trigger or query expressions.
+
+    Returns:
+        Locals to add to the module; empty if no trigger needs them.
+    """
+    reference = f"local.{PLAN_TIME_LOCAL}"
+    if not any(reference in trigger for trigger in triggers.values()):
+        return {}
+
+    return {PLAN_TIME_LOCAL: "${plantimestamp()}"}
+
+
+def get_refresh_trigger(interval: str) -> str:
+    """Build a trigger that only changes when time enters a new interval.
+
+    Intervals are a count and a unit: ``15m``, ``1h``, ``6h`` or ``1d``.
+    Minute and hour counts must divide an hour or a day evenly so every
+    bucket has the same length; days only support ``1d``.
+
+    The expression reads the plan's timestamp from ``local.plan_time``
+    (``get_plan_time_locals``). Unlike ``timestamp()``, ``plantimestamp()``
+    is known while planning, so unchanged buckets plan no replacement and
+    external data is still read during the plan.
+
+    Args:
+        interval: Refresh interval.
+
+    Returns:
+        Terraform expression built from ``formatdate`` and the plan time.
+
+    Raises:
+        ValueError: If the interval is not supported.
+    """
+    import re
+
+    match = re.fullmatch(r"\s*(\d+)\s*([mhd])\s*", str(interval))
+    if match is None:
+        raise ValueError(
+            f"Invalid refresh interval {interval!r}; expected e.g. 15m, 1h or 1d"
+        )
+
+    count = int(match.group(1))
+    period_layout, unit_layout, units_per_period = _REFRESH_UNITS[match.group(2)]
+    plan_time = f"local.{PLAN_TIME_LOCAL}"
+
+    if count == 1:
+        return f'${{formatdate("{period_layout}{unit_layout * 2}", {plan_time})}}'
+
+    if units_per_period is None or count <= 0 or units_per_period % count:
+        raise ValueError(
+            f"Invalid refresh interval {interval!r}; minutes must divide 60, "
+            "hours must divide 24 and days must be 1"
+        )
+
+    return (
+        f'${{formatdate("{period_layout}", {plan_time})}}-'
+        f'${{floor(tonumber(formatdate("{unit_layout}", {plan_time})) / {count})}}'
+    )
+
+
 def drop_empty_blocks(data_blocks: dict[str, Any]) -> dict[str, Any]:
     """Remove empty values from a dictionary."""
-    return {k: v for k, v in data_blocks.items() if not is_nothing(v)}
+    # Blocks are mostly dicts, for which emptiness is just their length;
+    # is_nothing stringifies its argument, which is costly for large blocks
+    return {
+        k: v
+        for k, v in data_blocks.items()
+        if (v if isinstance(v, dict) else not is_nothing(v))
+    }
+
+
+def get_result_expression(
+    key: str,
+    plaintext: bool = False,
+    source: str = EXTERNAL_RESULT,
+) -> str:
+    """Terraform expression reading one entry of the external data result.
+
+    Args:
+        key: Result key.
+        plaintext: Read the entry as-is instead of as base64 JSON.
+        source: Expression of the result map (the result file's local for
+            ``result_mode: file`` modules).
+
+    Returns:
+        Interpolation string.
+    """
+    if plaintext:
+        return f'${{{source}["{key}"]}}'
+
+    return f'${{jsondecode(base64decode({source}["{key}"]))}}'
+
+
+def get_env_data_blocks(
+    env_variables: dict[str, dict[str, Any]],
+    sensitive_env_variables: dict[str, dict[str, Any]],
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Build the env_var and env_sensitive data blocks.
+
+    Args:
+        env_variables: Environment variable definitions.
+        sensitive_env_variables: Sensitive environment variable definitions.
+
+    Returns:
+        Data blocks keyed by data source type, without empty blocks.
+    """
+    blocks: dict[str, dict[str, dict[str, Any]]] = {}
+
+    for block_type, definitions in (
+        ("env_var", env_variables),
+        ("env_sensitive", sensitive_env_variables),
+    ):
+        if definitions:
+            blocks[block_type] = {
+                env_name: {"id": env_name, "required": env_data.get("required", False)}
+                for env_name, env_data in definitions.items()
+            }
+
+    return blocks
+
+
+def get_env_references(
+    env_variables: dict[str, dict[str, Any]],
+    sensitive_env_variables: dict[str, dict[str, Any]],
+    prefix: str = "",
+) -> dict[str, str]:
+    """Map environment variable names to their data source expressions.
+
+    Args:
+        env_variables: Environment variable definitions.
+        sensitive_env_variables: Sensitive environment variable definitions.
+        prefix: Prefix for every returned name.
+
+    Returns:
+        Dict of (prefixed) names to interpolation strings.
+    """
+    references = {
+        f"{prefix}{env_name}": f"${{data.env_var.{env_name}.value}}"
+        for env_name in env_variables
+    }
+    references.update(
+        {
+            f"{prefix}{env_name}": f"${{data.env_sensitive.{env_name}.value}}"
+            for env_name in sensitive_env_variables
+        }
+    )
+    return references
+
+
+EXECUTORS = ("thread", "process", "serial")
+
+# Processes only pay off for large batches on several cores: results come
+# back pickled, and unpickling them in the parent takes about a third as
+# long as parsing (see benchmarks/bench_executors.py)
+PROCESS_EXECUTOR_THRESHOLD = 2000
+PROCESS_EXECUTOR_MIN_CPUS = 4
+
+
+def is_free_threaded() -> bool:
+    """Whether this interpreter runs Python code without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def get_default_executor(count: int) -> str:
+    """Pick the fastest executor for parsing ``count`` modules.
+
+    Docstring parsing is pure Python, so threads only help without the GIL.
+    With the GIL, threads only add overhead, and processes need a large
+    batch and several cores to win over parsing serially.
+
+    Args:
+        count: Number of modules.
+
+    Returns:
+        ``"thread"``, ``"process"`` or ``"serial"``.
+    """
+    if is_free_threaded():
+        return "thread"
+
+    if (
+        count >= PROCESS_EXECUTOR_THRESHOLD
+        and (os.cpu_count() or 1) >= PROCESS_EXECUTOR_MIN_CPUS
+    ):
+        return "process"
+
+    return "serial"
+
+
+def _build_resources_chunk(
+    cls: type[TerraformModuleResources],
+    items: list[tuple[str, str]],
+    kwargs: dict[str, Any],
+) -> list[TerraformModuleResources]:
+    """Build resources for (name, docstring) pairs; runs in pool workers."""
+    return [
+        cls(module_name=module_name, docstring=module_docs, **kwargs)
+        for module_name, module_docs in items
+    ]
+
+
+def iter_rendered_resources(
+    items: Iterable[T],
+    build: Callable[[T], TerraformModuleResources],
+    build_member: Callable[[str], TerraformModuleResources],
+    max_workers: int | None = None,
+    max_pending: int | None = None,
+) -> Iterator[tuple[TerraformModuleResources, dict[str, Any], float]]:
+    """Build and render resources in parallel, yielding each when ready.
+
+    Items are submitted lazily and at most ``max_pending`` are in flight,
+    so memory use does not grow with the number of items as long as the
+    caller does not keep what it is given. Results arrive in completion
+    order. Composite members are built again next to their composite
+    instead of being kept around.
+
+    Args:
+        items: Work items, e.g. (method name, docstring) pairs.
+        build: Builds the resources of one item.
+        build_member: Builds the resources of a composite member by name.
+        max_workers: Worker threads (defaults to the executor's default).
+        max_pending: Items in flight at once (defaults to twice the
+            number of workers).
+
+    Yields:
+        Tuples of (resources, module JSON, seconds spent on the item).
+        Resources whose generation is forbidden are skipped.
+
+    Raises:
+        RuntimeError: If an item fails; pending items are cancelled.
+    """
+
+    def render(item: T) -> tuple[TerraformModuleResources, dict[str, Any], float]:
+        tic = time.perf_counter()
+        resources = build(item)
+        if resources.generation_forbidden:
+            return resources, {}, time.perf_counter() - tic
+
+        member_names = resources.get_member_names()
+        if member_names:
+            resources.set_composite_members(
+                [build_member(member_name) for member_name in member_names]
+            )
+
+        module_json = resources.get_mixed()
+        return resources, module_json, time.perf_counter() - tic
+
+    if max_workers is None:
+        # ThreadPoolExecutor's default
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    if max_pending is None:
+        max_pending = 2 * max_workers
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        items = iter(items)
+        pending: set[concurrent.futures.Future[Any]] = set()
+
+        try:
+            while True:
+                for item in items:
+                    pending.add(executor.submit(render, item))
+                    if len(pending) >= max_pending:
+                        break
+
+                if not pending:
+                    return
+
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    try:
+                        resources, module_json, elapsed = future.result()
+                    except Exception as exc:
+                        raise RuntimeError("Failed to get resources") from exc
+
+                    if not resources.generation_forbidden:
+                        yield resources, module_json, elapsed
+        finally:
+            for future in pending:
+                future.cancel()
 
 
 class TerraformModuleResources:
@@ -59,6 +430,13 @@ class TerraformModuleResources:
         name: param2, required: false, type: string, default: "value"
         '''
 
+    A composite module lists other data source methods instead of
+    parameters (``generator=members: list_users|list_groups``) and serves
+    all of their outputs from a single runtime call.
+
+    Configuration containers are plain lists and dicts, so an instance must
+    not be changed while other threads use it; ``seal()`` it before sharing.
+
     Attributes:
         module_name: Name of the Python method.
         module_type: Type of module (data_source or null_resource).
@@ -80,6 +458,7 @@ class TerraformModuleResources:
         terraform_modules_class: str | None = None,
         terraform_modules_name_delim: str | None = None,
         binary_name: str | None = None,
+        checksum: str | None = None,
     ):
         """Initialize TerraformModuleResources.
 
@@ -92,6 +471,8 @@ class TerraformModuleResources:
             terraform_modules_class: Module class prefix.
             terraform_modules_name_delim: Delimiter for module names.
             binary_name: Command to invoke the Python runtime.
+            checksum: Default for the checksum variable, e.g. a hash of the
+                method's source so resources re-run when the code changes.
         """
         self.terraform_modules_dir = terraform_modules_dir or self.DEFAULT_MODULES_DIR
         self.terraform_modules_name_delim = (
@@ -109,11 +490,13 @@ class TerraformModuleResources:
         self.module_name = module_name
         self.module_type = module_type
         self.docstring = docstring
+        self.checksum = checksum or ""
         self.descriptor: str | None = None
         self.module_parameters: list[TerraformModuleParameter] = []
         self.generator_parameters: dict[str, Any] = {}
         self.extra_outputs: dict[str, dict[str, Any]] = {}
         self.sub_keys: dict[str, dict[str, Any]] = {}
+        self.composite_members: dict[str, TerraformModuleResources] = {}
 
         # Environment variable definitions
         self.env_variables: dict[str, dict[str, Any]] = {}
@@ -137,6 +520,7 @@ class TerraformModuleResources:
         self.foreach_forbidden: list[str] = []
         self.generation_forbidden: bool = False
         self.foreach_bind_log_file_name_to_key: bool = False
+        self._render_cache: dict[Any, Any] | None = None
 
         self._program_args = self._build_program_args()
         self.call = " ".join(shlex_quote(part) for part in self._program_args)
@@ -145,6 +529,41 @@ class TerraformModuleResources:
         self.set_module_params(module_params)
         self.set_required_module_params()
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.__dict__.get("_render_cache") is not None:
+            raise AttributeError(
+                f"Cannot set {name}: resources for {self.module_name} are sealed"
+            )
+
+        super().__setattr__(name, value)
+
+    @property
+    def sealed(self) -> bool:
+        """Whether the configuration is frozen and rendering is memoized."""
+        return self._render_cache is not None
+
+    def seal(self) -> TerraformModuleResources:
+        """Freeze the configuration and memoize rendered output.
+
+        After sealing, configuration containers become read-only views,
+        attributes can no longer be assigned and ``get_module_class``,
+        ``get_module_name``, ``get_module_path``, ``get_variables``,
+        ``get_triggers`` and ``get_mixed`` compute each result once. Cached
+        results are shared, so callers must not modify them. Sealed resources
+        can be shared between threads.
+
+        Returns:
+            The sealed resources, for chaining.
+        """
+        if self.sealed:
+            return self
+
+        for name in SEALED_ATTRIBUTES:
+            super().__setattr__(name, _freeze(getattr(self, name)))
+
+        super().__setattr__("_render_cache", {})
+        return self
+
     def _build_program_args(self) -> list[str]:
         """Return a shell-safe argv list for invoking the runtime."""
 
@@ -192,10 +611,14 @@ class TerraformModuleResources:
                     chunks = split_param(param.removeprefix("generator="))
                     for chunk in chunks:
                         k, v = get_json_export_for_chunk(chunk)
-                        if k == "plaintext_output":
+                        if k in ("plaintext_output", "columnar", "projection"):
                             self.generator_parameters[k] = strtobool(v)
                         else:
                             self.generator_parameters[k] = v
+                    check_columnar_output(
+                        self.generator_parameters.get("columnar"),
+                        self.generator_parameters.get("plaintext_output"),
+                    )
                     continue
 
                 if param.startswith("env="):
@@ -344,12 +767,8 @@ class TerraformModuleResources:
                     self.foreach_values.append(module_param.name)
                 if foreach_only:
                     self.foreach_only.append(module_param.name)
-                    continue
                 if foreach_forbidden:
                     self.foreach_forbidden.append(module_param.name)
-                    continue
-
-                module_params.append(expanded_param)
 
             except RuntimeError as exc:
                 raise RuntimeError(f"Failed to parse docstring param: {param}") from exc
@@ -373,7 +792,7 @@ class TerraformModuleResources:
         required_params = {
             "checksum": TerraformModuleParameter(
                 name="checksum",
-                default="",
+                default=self.checksum,
                 required=False,
                 description="Optional checksum to use for triggering resource updates",
             ),
@@ -384,24 +803,38 @@ class TerraformModuleResources:
                 self.module_parameters.append(module_param)
                 self.module_parameter_names.add(param_name)
 
+    def _get_filtered_parameters(
+        self,
+        filter_foreach_only: bool,
+        filter_foreach_forbidden: bool,
+    ) -> list[TerraformModuleParameter]:
+        """Return the parameters left after the foreach filters."""
+        excluded: set[str] = set()
+        if filter_foreach_only:
+            excluded.update(self.foreach_only)
+        if filter_foreach_forbidden:
+            excluded.update(self.foreach_forbidden)
+
+        if not excluded:
+            return self.module_parameters
+
+        return [param for param in self.module_parameters if param.name not in excluded]
+
+    @_memoized
     def get_variables(
         self,
         filter_foreach_only: bool = True,
         filter_foreach_forbidden: bool = False,
     ) -> dict[str, dict[str, Any]]:
         """Generate Terraform variable blocks."""
-        variables: dict[str, dict[str, Any]] = {}
-
-        for param in self.module_parameters:
-            if filter_foreach_only and param.name in self.foreach_only:
-                continue
-            if filter_foreach_forbidden and param.name in self.foreach_forbidden:
-                continue
-
-            variables[param.name] = param.get_variable()
-
-        return variables
+        return {
+            param.name: param.get_variable()
+            for param in self._get_filtered_parameters(
+                filter_foreach_only, filter_foreach_forbidden
+            )
+        }
 
+    @_memoized
     def get_triggers(
         self,
         disable_encoding: bool = False,
@@ -409,19 +842,20 @@ class TerraformModuleResources:
         filter_foreach_forbidden: bool = False,
     ) -> dict[str, str]:
         """Generate Terraform trigger expressions."""
-        triggers: dict[str, str] = {}
-
-        for param in self.module_parameters:
-            if filter_foreach_only and param.name in self.foreach_only:
-                continue
-            if filter_foreach_forbidden and param.name in self.foreach_forbidden:
-                continue
-
-            triggers[param.name] = param.get_trigger(disable_encoding)
+        triggers = {
+            param.name: param.get_trigger(disable_encoding)
+            for param in self._get_filtered_parameters(
+                filter_foreach_only, filter_foreach_forbidden
+            )
+        }
 
         if strtobool(self.generator_parameters.get("always", False)):
             triggers["always"] = "${timestamp()}"
 
+        refresh = self.generator_parameters.get("refresh")
+        if not is_nothing(refresh):
+            triggers["refresh"] = get_refresh_trigger(refresh)
+
         return triggers
 
     def get_terraform(
@@ -436,18 +870,22 @@ class TerraformModuleResources:
             "required_version": f">={terraform_min_version}",
         }
 
-        terraform_providers = deepcopy(self.required_providers)
+        # Provider settings are flat string maps, so copying one level deep
+        # keeps the output independent of self.required_providers
+        terraform_providers = {
+            name: dict(provider) for name, provider in self.required_providers.items()
+        }
 
-        if not is_nothing(provider_type):
+        if provider_type:
             terraform_providers[provider_type] = {
                 "source": f"{provider_organization}/{provider_type}",
             }
-            if not is_nothing(provider_min_version):
+            if provider_min_version:
                 terraform_providers[provider_type]["version"] = (
                     f">={provider_min_version}"
                 )
 
-        if not is_nothing(terraform_providers):
+        if terraform_providers:
             terraform["required_providers"] = terraform_providers
 
         return terraform
@@ -457,7 +895,17 @@ class TerraformModuleResources:
         key: str | None = None,
         output_description: str = "Data query results",
     ) -> dict[str, Any]:
-        """Generate external_data Terraform module."""
+        """Generate external_data Terraform module.
+
+        With ``projection`` set, the module gets an optional
+        ``bridge_fields`` variable that is passed to the runtime to project
+        the result (see ``python_terraform_bridge.projection``).
+
+        Raises:
+            RuntimeError: If there is no data key, or a projecting module has
+                a parameter named like the projection variable.
+            ValueError: If the result mode is not supported.
+        """
         if key is None:
             key = self.generator_parameters.get("key")
 
@@ -466,76 +914,150 @@ class TerraformModuleResources:
                 "Cannot generate external data module without a data key"
             )
 
-        query = self.get_triggers()
+        # Copies: get_variables and get_triggers results may be shared once
+        # sealed
+        variables = dict(self.get_variables())
+        query = dict(self.get_triggers())
+
+        if self.has_projection():
+            if PROJECTION_VARIABLE in variables or PROJECTION_VARIABLE in query:
+                raise RuntimeError(
+                    f"Module {self.module_name} has a parameter named "
+                    f"{PROJECTION_VARIABLE}, which is reserved for result projection"
+                )
+
+            variables[PROJECTION_VARIABLE] = {
+                "type": "string",
+                "default": "",
+                "description": "Result fields to keep, as comma-separated paths "
+                '(e.g. "*.id,*.email"); empty keeps the whole result',
+            }
+            query[PROJECTION_VARIABLE] = f"${{var.{PROJECTION_VARIABLE}}}"
 
         # Add environment variable references
-        for env_name in self.env_variables:
-            query[env_name] = f"${{data.env_var.{env_name}.value}}"
-        for env_name in self.sensitive_env_variables:
-            query[env_name] = f"${{data.env_sensitive.{env_name}.value}}"
+        query.update(
+            get_env_references(self.env_variables, self.sensitive_env_variables)
+        )
 
-        external_data = {"program": list(self._program_args), "query": query}
+        external_data: dict[str, Any] = {
+            "program": list(self._program_args),
+            "query": query,
+        }
 
-        data_blocks = drop_empty_blocks(
-            {
-                "external": {"default": external_data},
-                "env_var": {
-                    env_name: {
-                        "id": env_name,
-                        "required": env_data.get("required", False),
-                    }
-                    for env_name, env_data in self.env_variables.items()
-                },
-                "env_sensitive": {
-                    env_name: {
-                        "id": env_name,
-                        "required": env_data.get("required", False),
+        data_blocks = {
+            "external": {"default": external_data},
+            **get_env_data_blocks(self.env_variables, self.sensitive_env_variables),
+        }
+
+        if self.get_result_mode() == "file":
+            # Fail rather than read a file replaced since the runtime wrote it
+            external_data["lifecycle"] = {
+                "postcondition": [
+                    {
+                        "condition": (
+                            f'${{filesha256(self.result["{PATH_KEY}"]) == '
+                            f'self.result["{HASH_KEY}"]}}'
+                        ),
+                        "error_message": "Result file does not match its hash.",
                     }
-                    for env_name, env_data in self.sensitive_env_variables.items()
-                },
+                ]
             }
-        )
 
-        # Determine output expression
-        if self.generator_parameters.get("plaintext_output", False):
-            results_expr = '${data.external.default.result["' + key + '"]}'
+            # The runtime returns the path of a file holding the result map
+            results_locals, outputs = self.get_result_blocks(
+                key,
+                output_description=output_description,
+                result_source=f"local.{RESULT_FILE_LOCAL}",
+            )
+            results_locals = {
+                RESULT_FILE_LOCAL: (
+                    f'${{jsondecode(file({EXTERNAL_RESULT}["{PATH_KEY}"]))}}'
+                ),
+                **results_locals,
+            }
         else:
-            results_expr = (
-                '${jsondecode(base64decode(data.external.default.result["'
-                + key
-                + '"]))}'
+            results_locals, outputs = self.get_result_blocks(
+                key, output_description=output_description
             )
+        results_locals = {**get_plan_time_locals(query), **results_locals}
 
-        tf_json = drop_empty_blocks(
+        return drop_empty_blocks(
             {
                 "terraform": self.get_terraform("external", "2.3.1"),
-                "variable": self.get_variables(),
+                "variable": variables,
                 "data": data_blocks,
-                "locals": {"results": results_expr},
-                "output": {
-                    key: {
-                        "value": "${local.results}",
-                        "description": output_description,
-                    }
-                },
+                "locals": results_locals,
+                "output": outputs,
             }
         )
 
+    def get_result_blocks(
+        self,
+        key: str,
+        output_description: str = "Data query results",
+        results_local: str = "results",
+        result_source: str = EXTERNAL_RESULT,
+    ) -> tuple[dict[str, str], dict[str, dict[str, str]]]:
+        """Generate the locals and outputs that decode the external result.
+
+        Args:
+            key: Primary output key.
+            output_description: Description for every output.
+            results_local: Name of the local holding the primary value.
+            result_source: Expression of the result map.
+
+        Returns:
+            Tuple of (locals, outputs).
+
+        Raises:
+            ValueError: If columnar and plaintext output are both set.
+        """
+        check_columnar_output(
+            self.generator_parameters.get("columnar"),
+            self.generator_parameters.get("plaintext_output"),
+        )
+        result_expression = get_result_expression(
+            key,
+            plaintext=bool(self.generator_parameters.get("plaintext_output", False)),
+            source=result_source,
+        )
+        if self.generator_parameters.get("columnar", False):
+            from python_terraform_bridge.columnar import get_records_expression
+
+            # Decode the columns once, then rebuild the records from them
+            columns_local = f"{results_local}_columns"
+            results_locals = {
+                columns_local: result_expression,
+                results_local: get_records_expression(columns_local),
+            }
+        else:
+            results_locals = {results_local: result_expression}
+        outputs = {
+            key: {
+                "value": "${local." + results_local + "}",
+                "description": output_description,
+            }
+        }
+
         # Add extra outputs
         for extra_key, _extra_config in self.extra_outputs.items():
-            tf_json["locals"][extra_key] = (
-                '${jsondecode(base64decode(data.external.default.result["'
-                + extra_key
-                + '"]))}'
+            results_locals[extra_key] = get_result_expression(
+                extra_key, source=result_source
             )
-            tf_json["output"][extra_key] = {
+            outputs[extra_key] = {
                 "value": "${local." + extra_key + "}",
                 "description": output_description,
             }
 
         # Add sub-key outputs
         for sub_key_key, sub_key_config in self.sub_keys.items():
-            sub_key_value = f"local.results.{sub_key_key}"
+            if strtobool(sub_key_config.get("split", False)):
+                # Pre-split by the runtime into its own result entry
+                sub_key_value = (
+                    f'jsondecode(base64decode({result_source}["{sub_key_key}"]))'
+                )
+            else:
+                sub_key_value = f"local.{results_local}.{sub_key_key}"
 
             if sub_key_config.get("base64_encode", False):
                 sub_key_value = "base64decode(" + sub_key_value + ")"
@@ -546,34 +1068,258 @@ class TerraformModuleResources:
 
             sub_key_value = "${" + sub_key_value + "}"
 
-            tf_json["output"][sub_key_key] = {
+            outputs[sub_key_key] = {
                 "value": sub_key_value,
                 "description": output_description,
             }
 
-        return tf_json
+        return results_locals, outputs
+
+    def get_member_names(self) -> list[str]:
+        """Return the member methods of a composite module.
+
+        Returns:
+            Member method names, empty for regular modules.
+        """
+        members = self.generator_parameters.get("members")
+        if is_nothing(members):
+            return []
+
+        if isinstance(members, str):
+            members = members.split("|")
+
+        return [member.strip() for member in members if member.strip()]
+
+    def set_composite_members(
+        self, members: Iterable[TerraformModuleResources]
+    ) -> None:
+        """Attach the resources of a composite module's members.
+
+        Args:
+            members: Resources for every member method.
+
+        Raises:
+            RuntimeError: If a member is not a data source or is missing.
+        """
+        available = {member.module_name: member for member in members}
+
+        for member_name in self.get_member_names():
+            member = available.get(member_name)
+            if member is None:
+                raise RuntimeError(
+                    f"Composite {self.module_name} member not found: {member_name}"
+                )
+            if member.get_member_names():
+                raise RuntimeError(
+                    f"Composite {self.module_name} cannot contain composite "
+                    f"{member_name}"
+                )
+            if member.module_type not in (None, "data_source") or (
+                member.generator_parameters.get("type", "data_source") != "data_source"
+            ):
+                raise RuntimeError(
+                    f"Composite {self.module_name} member {member_name} "
+                    "is not a data source"
+                )
+
+            self.composite_members[member_name] = member
+
+    @classmethod
+    def link_composites(cls, all_resources: Iterable[TerraformModuleResources]) -> None:
+        """Resolve the members of every composite module in a batch.
+
+        Args:
+            all_resources: Resources generated together.
+        """
+        all_resources = list(all_resources)
+
+        for resources in all_resources:
+            if resources.get_member_names():
+                resources.set_composite_members(all_resources)
+
+    def get_composite_external_data(
+        self,
+        output_description: str = "Data query results",
+    ) -> dict[str, Any]:
+        """Generate an external_data module that serves several members.
+
+        Variables are shared by name across members, while each member's
+        query entries are namespaced as ``<member>.<name>`` so the runtime
+        can hand every member only its own inputs.
+        """
+        if self.get_result_mode() != "inline":
+            raise RuntimeError(
+                f"Composite {self.module_name} cannot use result_mode "
+                f"{self.get_result_mode()}; set it on its members' own modules"
+            )
+
+        member_names = self.get_member_names()
+        if len(self.composite_members) != len(member_names):
+            raise RuntimeError(
+                f"Composite {self.module_name} members are not resolved; "
+                "call link_composites first"
+            )
+
+        variables: dict[str, dict[str, Any]] = {}
+        query: dict[str, str] = {}
+        env_variables: dict[str, dict[str, Any]] = {}
+        sensitive_env_variables: dict[str, dict[str, Any]] = {}
+        required_providers: dict[str, dict[str, str]] = {}
+        results_locals: dict[str, str] = {}
+        outputs: dict[str, dict[str, str]] = {}
+
+        for member_name in member_names:
+            member = self.composite_members[member_name]
+
+            for var_name, variable in member.get_variables().items():
+                if variables.setdefault(var_name, variable) != variable:
+                    raise RuntimeError(
+                        f"Composite {self.module_name} members define "
+                        f"variable {var_name} differently"
+                    )
+
+            for trigger_name, trigger in member.get_triggers().items():
+                query[f"{member_name}.{trigger_name}"] = trigger
+
+            query.update(
+                get_env_references(
+                    member.env_variables,
+                    member.sensitive_env_variables,
+                    prefix=f"{member_name}.",
+                )
+            )
+
+            env_variables.update(member.env_variables)
+            sensitive_env_variables.update(member.sensitive_env_variables)
+            required_providers.update(
+                {
+                    name: dict(provider)
+                    for name, provider in member.required_providers.items()
+                }
+            )
+
+            member_key = member.generator_parameters.get("key")
+            if is_nothing(member_key):
+                raise RuntimeError(
+                    f"Composite {self.module_name} member {member_name} has no data key"
+                )
+
+            member_locals, member_outputs = member.get_result_blocks(
+                member_key,
+                output_description=output_description,
+                results_local=member_key,
+            )
+
+            collisions = set(member_outputs) & set(outputs)
+            if collisions:
+                raise RuntimeError(
+                    f"Composite {self.module_name} members share outputs: "
+                    f"{sorted(collisions)}"
+                )
+
+            results_locals.update(member_locals)
+            outputs.update(member_outputs)
+
+        results_locals = {**get_plan_time_locals(query), **results_locals}
+        external_data = {"program": list(self._program_args), "query": query}
+
+        data_blocks = {
+            "external": {"default": external_data},
+            **get_env_data_blocks(env_variables, sensitive_env_variables),
+        }
+
+        terraform = self.get_terraform("external", "2.3.1")
+        terraform["required_providers"].update(
+            {
+                name: provider
+                for name, provider in required_providers.items()
+                if name not in terraform["required_providers"]
+            }
+        )
+
+        return drop_empty_blocks(
+            {
+                "terraform": terraform,
+                "variable": variables,
+                "data": data_blocks,
+                "locals": results_locals,
+                "output": outputs,
+            }
+        )
+
+    def get_output_plan(self) -> dict[str, Any]:
+        """Return the result keys the generated external data module reads.
+
+        Returns:
+            Keyword arguments for ``runtime.encode_result``.
+        """
+        return {
+            "key": self.generator_parameters.get("key") or self.module_name,
+            "extra_outputs": list(self.extra_outputs),
+            "sub_keys": [
+                sub_key
+                for sub_key, sub_key_config in self.sub_keys.items()
+                if strtobool(sub_key_config.get("split", False))
+            ],
+            "plaintext_output": bool(
+                self.generator_parameters.get("plaintext_output", False)
+            ),
+            "columnar": bool(self.generator_parameters.get("columnar", False)),
+        }
+
+    def has_projection(self) -> bool:
+        """Return whether the module accepts a ``bridge_fields`` projection."""
+        return bool(self.generator_parameters.get("projection", False))
+
+    def get_result_mode(self) -> str:
+        """Return how the runtime hands the result to the generated module.
+
+        Returns:
+            ``inline`` (in the external data result) or ``file`` (see
+            ``result_files``).
+
+        Raises:
+            ValueError: If the configured result mode is not supported.
+        """
+        return get_result_mode(self.generator_parameters.get("result_mode"))
 
     def get_null_resource(self, provisioner_type: str | None = None) -> dict[str, Any]:
-        """Generate null_resource (terraform_data) Terraform module."""
+        """Generate null_resource (terraform_data) Terraform module.
+
+        With ``spill_inputs`` set, JSON or base64 encoded parameters are
+        written to ``local_sensitive_file`` resources and only their paths
+        go through the provisioner's environment, as ``<name>__file``. This
+        keeps large inputs clear of argument and environment size limits.
+        The file names contain the content's hash, so changed inputs still
+        replace the resource.
+        """
         provisioner_type = provisioner_type or self.generator_parameters.get(
             "provisioner_type"
         )
         if provisioner_type is None:
             provisioner_type = "local-exec"
 
-        triggers = self.get_triggers()
+        # Copy: get_triggers results may be shared once sealed
+        triggers = dict(self.get_triggers())
+
+        spill_files = {}
+        if strtobool(self.generator_parameters.get("spill_inputs", False)):
+            spill_files = self._get_spill_files(triggers)
+            for name in spill_files:
+                triggers[name] = f"${{local_sensitive_file.{name}.filename}}"
 
         environment = {
-            name: "${self.triggers_replace." + name + "}"
+            f"{name}{FILE_INPUT_SUFFIX}" if name in spill_files else name: (
+                f"${{self.triggers_replace.{name}}}"
+            )
             for name in triggers
             if name != "script"
         }
 
         # Add environment variable references
-        for env_name in self.env_variables:
-            environment[env_name] = f"${{data.env_var.{env_name}.value}}"
-        for env_name in self.sensitive_env_variables:
-            environment[env_name] = f"${{data.env_sensitive.{env_name}.value}}"
+        environment.update(
+            get_env_references(self.env_variables, self.sensitive_env_variables)
+        )
 
         provisioner = {"command": self.call, "environment": environment}
         provisioner_block = [{provisioner_type: provisioner}]
@@ -583,34 +1329,58 @@ class TerraformModuleResources:
             "provisioner": provisioner_block,
         }
 
-        data_blocks = drop_empty_blocks(
-            {
-                "env_var": {
-                    env_name: {
-                        "id": env_name,
-                        "required": env_data.get("required", False),
-                    }
-                    for env_name, env_data in self.env_variables.items()
-                },
-                "env_sensitive": {
-                    env_name: {
-                        "id": env_name,
-                        "required": env_data.get("required", False),
-                    }
-                    for env_name, env_data in self.sensitive_env_variables.items()
-                },
-            }
+        data_blocks = get_env_data_blocks(
+            self.env_variables, self.sensitive_env_variables
         )
 
+        resources: dict[str, Any] = {"terraform_data": {"default": null_resource}}
+        if spill_files:
+            resources["local_sensitive_file"] = spill_files
+
         return drop_empty_blocks(
             {
-                "terraform": self.get_terraform(),
+                "terraform": (
+                    self.get_terraform("local", "2.2.0")
+                    if spill_files
+                    else self.get_terraform()
+                ),
                 "variable": self.get_variables(),
-                "resource": {"terraform_data": {"default": null_resource}},
+                "resource": resources,
                 "data": data_blocks,
+                "locals": get_plan_time_locals(triggers),
             }
         )
 
+    def _get_spill_files(self, triggers: dict[str, str]) -> dict[str, dict[str, str]]:
+        """Return local_sensitive_file resources for the encoded parameters.
+
+        Args:
+            triggers: Trigger expressions by parameter name.
+
+        Returns:
+            Resource bodies by parameter name.
+        """
+        spill_files = {}
+        for param in self.module_parameters:
+            trigger = triggers.get(param.name)
+            if trigger is None or not (param.json_encode or param.base64_encode):
+                continue
+            if not (trigger.startswith("${") and trigger.endswith("}")):
+                # Custom literal trigger: small by construction
+                continue
+
+            content_hash = f"${{sha256({trigger[2:-1]})}}"
+            spill_files[param.name] = {
+                "content": trigger,
+                "filename": (
+                    f"${{abspath(path.module)}}/{SPILL_DIR}/{param.name}-{content_hash}"
+                ),
+                "file_permission": "0600",
+            }
+
+        return spill_files
+
+    @_memoized
     def get_mixed(
         self, module_type: str | None = None, **kwargs: Any
     ) -> dict[str, Any]:
@@ -622,12 +1392,78 @@ class TerraformModuleResources:
             module_type = self.generator_parameters.get("type", "data_source")
 
         if module_type == "data_source":
+            if self.get_member_names():
+                return self.get_composite_external_data(**kwargs)
             return self.get_external_data(**kwargs)
         elif module_type == "null_resource":
             return self.get_null_resource(**kwargs)
         else:
             raise RuntimeError(f"Unknown module type: {module_type}")
 
+    def get_shared_module(
+        self, method_variable: str = "bridge_method"
+    ) -> dict[str, Any]:
+        """Generate the module with the runtime method read from a variable.
+
+        Methods that differ only in their name render identical shared
+        modules, so one copy can serve all of them.
+
+        Args:
+            method_variable: Name of the variable holding the method name.
+
+        Returns:
+            Module JSON, independent of ``get_mixed`` results.
+
+        Raises:
+            RuntimeError: If the module already defines ``method_variable``.
+        """
+        module_json = dict(self.get_mixed())
+        variables = dict(module_json.get("variable", {}))
+        if method_variable in variables:
+            raise RuntimeError(
+                f"Module {self.module_name} already has a variable named "
+                f"{method_variable}"
+            )
+
+        method_reference = f"${{var.{method_variable}}}"
+        variables[method_variable] = {
+            "type": "string",
+            "description": "Runtime method to invoke",
+        }
+        module_json["variable"] = variables
+
+        if "external" in module_json.get("data", {}):
+            external_data = dict(module_json["data"]["external"]["default"])
+            external_data["program"] = [*self._program_args[:-1], method_reference]
+            module_json["data"] = {
+                **module_json["data"],
+                "external": {"default": external_data},
+            }
+
+        if "terraform_data" in module_json.get("resource", {}):
+            command = " ".join(
+                [
+                    *(shlex_quote(part) for part in self._program_args[:-1]),
+                    method_reference,
+                ]
+            )
+            null_resource = dict(module_json["resource"]["terraform_data"]["default"])
+            null_resource["provisioner"] = [
+                {
+                    provisioner_type: {**provisioner, "command": command}
+                    for provisioner_type, provisioner in block.items()
+                }
+                for block in null_resource["provisioner"]
+            ]
+            # Keep the other resources, e.g. spilled input files
+            module_json["resource"] = {
+                **module_json["resource"],
+                "terraform_data": {"default": null_resource},
+            }
+
+        return module_json
+
+    @_memoized
     def get_module_class(self, module_class: str | None = None) -> str | None:
         """Get the module class for path construction."""
         import re
@@ -644,6 +1480,7 @@ class TerraformModuleResources:
 
         return module_class
 
+    @_memoized
     def get_module_name(
         self,
         module_class: str | None = None,
@@ -668,6 +1505,7 @@ class TerraformModuleResources:
             "_", self.terraform_modules_name_delim
         )
 
+    @_memoized
     def get_module_path(
         self,
         modules_dir: str | None = None,
@@ -695,36 +1533,122 @@ class TerraformModuleResources:
     def get_all_resources(
         cls,
         terraform_modules: dict[str, str],
+        executor: str | None = None,
+        max_workers: int | None = None,
+        chunksize: int | None = None,
         **kwargs: Any,
     ) -> tuple[list[TerraformModuleResources], float]:
-        """Generate resources for all modules in parallel.
+        """Generate resources for all modules.
 
         Args:
             terraform_modules: Dict mapping method names to docstrings.
-            **kwargs: Additional arguments for TerraformModuleResources.
+            executor: ``"thread"``, ``"process"`` or ``"serial"``. Defaults
+                to ``get_default_executor(len(terraform_modules))``.
+            max_workers: Worker threads or processes.
+            chunksize: Modules per submitted task (defaults to about four
+                tasks per worker).
+            **kwargs: Additional arguments for TerraformModuleResources;
+                must be picklable for the process executor.
 
         Returns:
-            Tuple of (list of resources, elapsed time).
+            Tuple of (list of resources in input order, elapsed time).
+
+        Raises:
+            ValueError: If the executor is unknown.
+            RuntimeError: If a module fails to parse.
         """
-        resources: list[TerraformModuleResources] = []
+        if executor is None:
+            executor = get_default_executor(len(terraform_modules))
+
+        if executor not in EXECUTORS:
+            raise ValueError(
+                f"Unknown executor: {executor}. Expected one of {EXECUTORS}"
+            )
+
+        items = list(terraform_modules.items())
 
         tic = time.perf_counter()
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            futures = []
+        if executor == "serial" or not items:
+            try:
+                resources = _build_resources_chunk(cls, items, kwargs)
+            except Exception as exc:
+                raise RuntimeError("Failed to get resources") from exc
 
-            for module_name, module_docs in terraform_modules.items():
-                futures.append(
-                    executor.submit(
-                        cls, module_name=module_name, docstring=module_docs, **kwargs
-                    )
-                )
+            return resources, time.perf_counter() - tic
 
-            for future in concurrent.futures.as_completed(futures):
+        executor_class = (
+            concurrent.futures.ProcessPoolExecutor
+            if executor == "process"
+            else concurrent.futures.ThreadPoolExecutor
+        )
+        if max_workers is None:
+            max_workers = (
+                os.cpu_count() or 1
+                if executor == "process"
+                else min(32, (os.cpu_count() or 1) + 4)
+            )
+        if chunksize is None:
+            chunksize = max(1, -(-len(items) // (max_workers * 4)))
+
+        chunks = [
+            items[start : start + chunksize]
+            for start in range(0, len(items), chunksize)
+        ]
+
+        resources = []
+        with executor_class(min(max_workers, len(chunks))) as pool:
+            futures = [
+                pool.submit(_build_resources_chunk, cls, chunk, kwargs)
+                for chunk in chunks
+            ]
+
+            # Collect in submission order so output is deterministic
+            for future in futures:
                 try:
-                    resources.append(future.result())
+                    resources.extend(future.result())
                 except Exception as exc:
-                    executor.shutdown(wait=False, cancel_futures=True)
+                    pool.shutdown(wait=False, cancel_futures=True)
                     raise RuntimeError("Failed to get resources") from exc
 
         toc = time.perf_counter()
         return resources, toc - tic
+
+    @classmethod
+    def iter_resources(
+        cls,
+        terraform_modules: dict[str, str],
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> Iterator[tuple[TerraformModuleResources, dict[str, Any], float]]:
+        """Generate and render resources for all modules as they are ready.
+
+        Unlike ``get_all_resources``, nothing is collected: each resources
+        object is yielded with its ``get_mixed()`` JSON and the seconds it
+        took, so callers can write or validate modules while others are
+        still being parsed. See ``iter_rendered_resources``.
+
+        Args:
+            terraform_modules: Dict mapping method names to docstrings.
+            max_workers: Worker threads.
+            **kwargs: Additional arguments for TerraformModuleResources.
+
+        Yields:
+            Tuples of (resources, module JSON, elapsed seconds).
+        """
+
+        def build_member(module_name: str) -> TerraformModuleResources:
+            if module_name not in terraform_modules:
+                raise RuntimeError(f"Composite member not found: {module_name}")
+
+            return cls(
+                module_name=module_name,
+                docstring=terraform_modules.get(module_name),
+                **kwargs,
+            )
+
+        return iter_rendered_resources(
+            terraform_modules.items(),
+            build=lambda item: cls(module_name=item[0], docstring=item[1], **kwargs),
+            build_member=build_member,
+            max_workers=max_workers,
+        )
@@ -1,16 +1,26 @@
 """Terraform module parameter definition.
 
 This module provides the TerraformModuleParameter class for defining
-input parameters for Terraform modules.
+input parameters for Terraform modules, and FrozenModuleParameter, an
+immutable, interned variant for generating very large numbers of modules.
 """
 
 from __future__ import annotations
 
+import dataclasses
+import sys
+import threading
+import weakref
+
 from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+# Per-instance __dict__ is dropped where dataclasses support it (3.10+)
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class TerraformModuleParameter:
     """Represents a parameter for a Terraform module.
 
@@ -108,6 +118,11 @@ class TerraformModuleParameter:
     ) -> TerraformModuleParameter:
         """Create parameter from Python type hint.
 
+        Structured types map to precise Terraform types such as
+        ``list(string)``, ``map(number)`` or ``object({...})``. Flat
+        collections are only JSON encoded; values nested more than one level
+        deep (or of unknown shape) are also base64 encoded.
+
         Args:
             name: Parameter name.
             type_hint: Python type annotation.
@@ -119,46 +134,348 @@ class TerraformModuleParameter:
         """
         import inspect
 
-        from typing import get_origin
-
         # Determine if required based on default
         required = default is inspect.Parameter.empty
 
-        # Infer encoding from type hints
-        json_encode = False
-        base64_encode = False
-        tf_type = "any"
-
-        origin = get_origin(type_hint)
-
-        # Handle basic types
-        if type_hint is str:
-            tf_type = "string"
-        elif type_hint is bool:
-            tf_type = "bool"
-        elif type_hint is int or type_hint is float:
-            tf_type = "number"
-        # Handle generic types (List[x], Dict[k,v], etc.)
-        elif origin is list:
-            tf_type = "list(any)"
-        elif origin is dict:
-            tf_type = "map(any)"
-            json_encode = True
-            base64_encode = True
-        # Handle bare list/dict without generics
-        elif type_hint is list:
-            tf_type = "list(any)"
-        elif type_hint is dict:
-            tf_type = "map(any)"
-            json_encode = True
-            base64_encode = True
+        tf_type, depth = get_terraform_type(type_hint)
 
         return cls(
             name=name,
-            json_encode=json_encode,
-            base64_encode=base64_encode,
+            json_encode=depth != 0,
+            base64_encode=depth < 0 or depth > 1,
             default=None if required else default,
             required=required,
             description=description,
             type=tf_type,
         )
+
+    def freeze(self) -> FrozenModuleParameter:
+        """Return the interned, immutable equivalent of this parameter.
+
+        Returns:
+            Shared FrozenModuleParameter with the same fields.
+        """
+        return FrozenModuleParameter.intern(
+            **{f.name: getattr(self, f.name) for f in dataclasses.fields(self)}
+        )
+
+
+def _intern_key(value: Any) -> Any:
+    """Hashable, type-preserving key for a field value."""
+    if isinstance(value, dict):
+        return (dict, tuple((k, _intern_key(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_intern_key(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_intern_key(v) for v in value))
+
+    # Keep the type so that True, 1 and 1.0 do not collide
+    return (type(value), value)
+
+
+_FIELD_DEFAULTS = tuple(
+    (f.name, f.default) for f in dataclasses.fields(TerraformModuleParameter)
+)
+
+
+class FrozenModuleParameter(TerraformModuleParameter):
+    """Immutable TerraformModuleParameter with cached rendering.
+
+    Takes the same arguments as TerraformModuleParameter. Fields cannot be
+    reassigned after construction, ``get_variable``/``get_trigger`` results
+    are computed once and shared (treat them as read-only), and ``intern``
+    returns one shared instance per distinct definition.
+
+    Example:
+        param = FrozenModuleParameter.intern(name="domain", type="string")
+        assert param is FrozenModuleParameter.intern(name="domain", type="string")
+    """
+
+    __slots__ = (
+        "_frozen",
+        "_variable",
+        "_trigger",
+        "_plain_trigger",
+        *(() if hasattr(TerraformModuleParameter, "__weakref__") else ("__weakref__",)),
+    )
+
+    _interned: weakref.WeakValueDictionary[Any, FrozenModuleParameter] = (
+        weakref.WeakValueDictionary()
+    )
+    _intern_lock = threading.Lock()
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> FrozenModuleParameter:
+        self = super().__new__(cls)
+        # Pre-fill the bookkeeping slots so hot paths never hit AttributeError
+        for slot in ("_frozen", "_variable", "_trigger", "_plain_trigger"):
+            object.__setattr__(self, slot, None)
+        return self
+
+    def __post_init__(self) -> None:
+        """Infer the type, then freeze."""
+        super().__post_init__()
+        object.__setattr__(self, "_frozen", True)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen:
+            raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Unpickled copies are interned again rather than restored slot by slot
+        return (
+            _intern_frozen,
+            tuple(getattr(self, name) for name, _default in _FIELD_DEFAULTS),
+        )
+
+    def __hash__(self) -> int:
+        return hash(self._fields_key())
+
+    def _fields_key(self) -> tuple[Any, ...]:
+        """Intern key of the fully constructed parameter."""
+        return tuple(
+            _intern_key(getattr(self, name)) for name, _default in _FIELD_DEFAULTS
+        )
+
+    @classmethod
+    def intern(cls, *args: Any, **kwargs: Any) -> FrozenModuleParameter:
+        """Return the shared instance for a parameter definition.
+
+        The lookup happens before construction, so type inference only runs
+        for the first occurrence of each definition. Instances are held
+        weakly and released once no module uses them.
+
+        Args:
+            *args: Positional TerraformModuleParameter arguments.
+            **kwargs: Keyword TerraformModuleParameter arguments.
+
+        Returns:
+            Shared FrozenModuleParameter.
+        """
+        # Fast path: the call's own (hashable) arguments, with their types so
+        # that True, 1 and 1.0 do not collide
+        try:
+            key: Any = (
+                args,
+                tuple(map(type, args)),
+                tuple(kwargs.items()),
+                tuple(map(type, kwargs.values())),
+            )
+            param = cls._interned.get(key)
+        except TypeError:
+            # Collection defaults: normalize every field instead
+            values = dict(zip((name for name, _ in _FIELD_DEFAULTS), args))
+            values.update(kwargs)
+            try:
+                key = tuple(
+                    _intern_key(values.get(name, default))
+                    for name, default in _FIELD_DEFAULTS
+                )
+                param = cls._interned.get(key)
+            except TypeError:
+                # Unhashable default (e.g. a custom object): do not intern
+                return cls(*args, **kwargs)
+
+        if param is not None:
+            return param
+
+        param = cls(*args, **kwargs)
+        canonical_key = param._fields_key()
+
+        with cls._intern_lock:
+            # Definitions that only differ by inferred fields share one instance
+            param = cls._interned.setdefault(canonical_key, param)
+            cls._interned[key] = param
+
+        return param
+
+    def get_variable(self) -> dict[str, Any]:
+        """Generate Terraform variable block, computed once."""
+        variable = self._variable
+        if variable is None:
+            variable = TerraformModuleParameter.get_variable(self)
+            object.__setattr__(self, "_variable", variable)
+
+        return variable  # type: ignore[no-any-return]
+
+    def get_trigger(self, disable_encoding: bool = False) -> str:
+        """Generate Terraform trigger expression, computed once."""
+        slot = "_plain_trigger" if disable_encoding else "_trigger"
+        trigger = getattr(self, slot)
+        if trigger is None:
+            trigger = TerraformModuleParameter.get_trigger(self, disable_encoding)
+            object.__setattr__(self, slot, trigger)
+
+        return trigger  # type: ignore[no-any-return]
+
+
+def _intern_frozen(*args: Any) -> FrozenModuleParameter:
+    """Unpickle a FrozenModuleParameter."""
+    return FrozenModuleParameter.intern(*args)
+
+
+# Depth reported for values whose shape is unknown (``any``)
+UNKNOWN_DEPTH = -1
+
+
+def get_terraform_type(type_hint: Any) -> tuple[str, int]:
+    """Translate a Python type hint into a Terraform type constraint.
+
+    Args:
+        type_hint: Python type annotation.
+
+    Returns:
+        Tuple of (Terraform type, nesting depth). Depth is 0 for scalars,
+        1 for collections of scalars, more for nested collections and
+        ``UNKNOWN_DEPTH`` for collections of unknown shape. A bare ``any``
+        is reported with depth 0 since it is passed through untouched.
+    """
+    tf_type, depth = _get_terraform_type(type_hint, frozenset())
+
+    if tf_type == "any":
+        return tf_type, 0
+
+    return tf_type, depth
+
+
+def _collection_depth(*element_depths: int) -> int:
+    """Depth of a collection holding elements of the given depths."""
+    if not element_depths or UNKNOWN_DEPTH in element_depths:
+        return UNKNOWN_DEPTH
+
+    return 1 + max(element_depths)
+
+
+def _get_terraform_type(type_hint: Any, seen: frozenset[Any]) -> tuple[str, int]:
+    """Recursive worker for get_terraform_type."""
+    import dataclasses
+    import typing
+
+    from collections.abc import Mapping, Sequence
+    from collections.abc import Set as AbstractSet
+
+    if type_hint is bool:
+        return "bool", 0
+    if type_hint is str:
+        return "string", 0
+    if type_hint is int or type_hint is float:
+        return "number", 0
+
+    origin = typing.get_origin(type_hint)
+    args = typing.get_args(type_hint)
+
+    if origin is typing.Annotated:
+        return _get_terraform_type(args[0], seen)
+
+    if origin is typing.Literal:
+        literal_types = {_get_terraform_type(type(arg), seen)[0] for arg in args}
+        if len(literal_types) == 1:
+            return literal_types.pop(), 0
+        return "any", UNKNOWN_DEPTH
+
+    if origin is typing.Union or type(type_hint).__name__ == "UnionType":
+        # Optional[X] is X; Terraform variables are nullable by default
+        members = [
+            _get_terraform_type(arg, seen) for arg in args if arg is not type(None)
+        ]
+        if len({tf_type for tf_type, _ in members}) == 1:
+            depths = [depth for _, depth in members]
+            if UNKNOWN_DEPTH in depths:
+                return members[0][0], UNKNOWN_DEPTH
+            return members[0][0], max(depths)
+        return "any", UNKNOWN_DEPTH
+
+    if type_hint in seen:
+        # Recursive structure
+        return "any", UNKNOWN_DEPTH
+
+    if _is_typeddict(type_hint) or (
+        isinstance(type_hint, type) and dataclasses.is_dataclass(type_hint)
+    ):
+        return _get_object_type(type_hint, seen | {type_hint})
+
+    collection = origin or type_hint
+
+    if collection in (list, Sequence) or (
+        collection is tuple and len(args) == 2 and args[1] is Ellipsis
+    ):
+        return _get_collection_type("list", args[:1], seen)
+
+    if collection is tuple:
+        if not args:
+            return "list(any)", UNKNOWN_DEPTH
+        elements = [_get_terraform_type(arg, seen) for arg in args]
+        return (
+            "tuple([" + ", ".join(tf_type for tf_type, _ in elements) + "])",
+            _collection_depth(*(depth for _, depth in elements)),
+        )
+
+    if collection in (set, frozenset, AbstractSet):
+        return _get_collection_type("set", args[:1], seen)
+
+    if collection in (dict, Mapping):
+        return _get_collection_type("map", args[1:2], seen)
+
+    return "any", UNKNOWN_DEPTH
+
+
+def _get_collection_type(
+    kind: str,
+    element_args: tuple[Any, ...],
+    seen: frozenset[Any],
+) -> tuple[str, int]:
+    """Terraform type for a homogeneous list, set or map."""
+    if not element_args:
+        return f"{kind}(any)", UNKNOWN_DEPTH
+
+    element_type, element_depth = _get_terraform_type(element_args[0], seen)
+    return f"{kind}({element_type})", _collection_depth(element_depth)
+
+
+def _get_object_type(type_hint: Any, seen: frozenset[Any]) -> tuple[str, int]:
+    """Terraform object type for a TypedDict or dataclass."""
+    import dataclasses
+    import typing
+
+    try:
+        hints = typing.get_type_hints(type_hint)
+    except Exception:
+        hints = getattr(type_hint, "__annotations__", {})
+
+    if _is_typeddict(type_hint):
+        optional_keys = getattr(type_hint, "__optional_keys__", frozenset())
+    else:
+        optional_keys = {
+            f.name
+            for f in dataclasses.fields(type_hint)
+            if f.default is not dataclasses.MISSING
+            or f.default_factory is not dataclasses.MISSING
+        }
+
+    attributes = []
+    depths = []
+    for attr_name, attr_hint in hints.items():
+        attr_type, attr_depth = _get_terraform_type(attr_hint, seen)
+        if attr_name in optional_keys:
+            attr_type = f"optional({attr_type})"
+        attributes.append(f"{attr_name} = {attr_type}")
+        depths.append(attr_depth)
+
+    if not attributes:
+        return "object({})", 1
+
+    return "object({" + ", ".join(attributes) + "})", _collection_depth(*depths)
+
+
+def _is_typeddict(type_hint: Any) -> bool:
+    """Whether a type hint is a TypedDict class."""
+    return (
+        isinstance(type_hint, type)
+        and issubclass(type_hint, dict)
+        and hasattr(type_hint, "__total__")
+        and hasattr(type_hint, "__annotations__")
+    )
@@ -0,0 +1,190 @@
+"""Projection of method results onto the fields Terraform uses.
+
+With ``projection`` set (``register(projection=True)`` or ``projection:
+true`` on the ``generator=`` line), the external data module gets an
+optional ``bridge_fields`` variable. When set, the runtime drops everything
+else from the primary result before encoding it, which shrinks the
+external data result, the Terraform state and the
+``jsondecode(base64decode(...))`` work.
+
+A projection spec is a comma-separated list of dotted paths, or a JSON
+list of them. ``*`` matches every key of a dict or element of a list, and
+numeric segments select list elements:
+
+- ``"id,email"`` keeps two top-level fields.
+- ``"*.email,*.profile.name"`` keeps two fields of every user in an
+  inventory keyed by user id (or in a list of users).
+
+Paths that do not exist are skipped. A scalar result is returned unchanged.
+Extra outputs are never projected, and split sub keys are taken from the
+full result; a non-split sub key has to be part of the projection.
+
+Example:
+    @registry.data_source(key="users", projection=True)
+    def list_users() -> dict: ...
+
+    module "users" {
+      source        = "./terraform-modules/directory/list-users"
+      bridge_fields = "*.email,*.name"
+    }
+"""
+
+from __future__ import annotations
+
+import json
+
+from collections.abc import Mapping
+from typing import Any, Union
+
+
+# Reserved query parameter and variable carrying the projection spec
+PROJECTION_VARIABLE = "bridge_fields"
+
+# Path segment matching every key or element
+WILDCARD = "*"
+
+# Nested selected segments; None keeps the whole value below a segment
+Projection = dict[str, Union["Projection", None]]
+
+# Returned by project_entry for entries the projection drops
+MISSING = object()
+
+
+def parse_projection(spec: str | list[str] | None) -> Projection | None:
+    """Parse a projection spec.
+
+    Args:
+        spec: Comma-separated paths, a JSON list of paths, a list of paths,
+            or None/empty for no projection.
+
+    Returns:
+        Projection tree, or None to keep the whole result.
+
+    Raises:
+        ValueError: If the spec is malformed.
+    """
+    if spec is None:
+        return None
+
+    if isinstance(spec, str):
+        spec = spec.strip()
+        if spec.startswith("["):
+            try:
+                paths = json.loads(spec)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Invalid projection spec: {spec!r}") from exc
+        else:
+            paths = spec.split(",")
+    else:
+        paths = spec
+
+    if not isinstance(paths, list):
+        raise ValueError(f"Invalid projection spec: {spec!r}")
+
+    projection: Projection = {}
+    for path in paths:
+        if not isinstance(path, str):
+            raise ValueError(f"Projection paths must be strings, not {path!r}")
+        if not path.strip():
+            continue
+
+        segments = [segment.strip() for segment in path.split(".")]
+        if not all(segments):
+            raise ValueError(f"Invalid projection path: {path!r}")
+
+        node = projection
+        for segment in segments[:-1]:
+            child = node.setdefault(segment, {})
+            if child is None:
+                # A shorter path already keeps the whole value
+                break
+            node = child
+        else:
+            node[segments[-1]] = None
+
+    return projection or None
+
+
+def _merge(first: Projection | None, second: Projection | None) -> Projection | None:
+    """Union of two projections; keeping a whole value wins."""
+    if first is None or second is None:
+        return None
+
+    merged = dict(first)
+    for segment, child in second.items():
+        merged[segment] = _merge(merged[segment], child) if segment in merged else child
+
+    return merged
+
+
+def _select(projection: Projection, key: str) -> Any:
+    """Return the projection below a key, or MISSING if it is not selected."""
+    exact = projection.get(key, MISSING)
+    wildcard = projection.get(WILDCARD, MISSING)
+
+    if exact is MISSING:
+        return wildcard
+    if wildcard is MISSING:
+        return exact
+
+    return _merge(exact, wildcard)
+
+
+def _apply(value: Any, projection: Projection | None) -> Any:
+    """Project a nested value, returning MISSING if nothing is selected."""
+    if projection is None:
+        return value
+
+    if isinstance(value, Mapping):
+        projected: Any = {}
+        for key, item in value.items():
+            entry = project_entry(key, item, projection)
+            if entry is not MISSING:
+                projected[key] = entry
+        return projected
+
+    if isinstance(value, (list, tuple)):
+        projected = []
+        for index, item in enumerate(value):
+            entry = project_entry(index, item, projection)
+            if entry is not MISSING:
+                projected.append(entry)
+        return projected
+
+    return MISSING
+
+
+def project_entry(key: Any, value: Any, projection: Projection) -> Any:
+    """Project one entry of a dict (or element of a list) of the result.
+
+    Used to filter streamed results entry by entry.
+
+    Args:
+        key: Dict key or list index of the entry.
+        value: Entry value.
+        projection: Projection of the containing value.
+
+    Returns:
+        The projected value, or ``MISSING`` if the entry is not selected.
+    """
+    selection = _select(projection, str(key))
+    if selection is MISSING:
+        return MISSING
+
+    return _apply(value, selection)
+
+
+def project(value: Any, projection: Projection | None) -> Any:
+    """Keep only the selected parts of a result.
+
+    Args:
+        value: Method result.
+        projection: Projection from ``parse_projection``, or None.
+
+    Returns:
+        The projected result. Scalars are returned unchanged.
+    """
+    if projection is None or not isinstance(value, (Mapping, list, tuple)):
+        return value
+
+    return _apply(value, projection)
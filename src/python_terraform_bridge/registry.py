@@ -21,27 +21,73 @@ Example:
 from __future__ import annotations
 
 import functools
+import importlib
 import inspect
 import json
+import os
+import sys
+import threading
+import typing
+
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from extended_data_types import strtobool
+
+from python_terraform_bridge.columnar import check_columnar_output
+from python_terraform_bridge.inputs import (
+    FILE_INPUT_SUFFIX,
+    InputDecoder,
+    resolve_file_inputs,
+)
+from python_terraform_bridge.module_resources import (
+    TerraformModuleResources,
+    get_refresh_trigger,
+    iter_rendered_resources,
+)
+from python_terraform_bridge.parameter import TerraformModuleParameter
+from python_terraform_bridge.projection import PROJECTION_VARIABLE, parse_projection
+from python_terraform_bridge.result_files import get_result_mode, open_result_output
 
-from collections.abc import Callable
-from dataclasses import dataclass, field
-from pathlib import Path  # noqa: TC003 - used at runtime for Path.open()
-from typing import Any, TypeVar
 
-from python_terraform_bridge.module_resources import TerraformModuleResources
-from python_terraform_bridge.parameter import TerraformModuleParameter
+if TYPE_CHECKING:
+    from lifecyclelogging import Logging
+
+    from python_terraform_bridge.projection import Projection
 
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Bump when the manifest layout changes incompatibly
+MANIFEST_VERSION = 1
+
+
+def get_import_path(func: Callable[..., Any]) -> str | None:
+    """Return the ``module:qualname`` path a callable can be re-imported from.
+
+    Args:
+        func: Function or method.
+
+    Returns:
+        Import path, or None for callables defined inside functions.
+    """
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+
+    if not module or not qualname or "<locals>" in qualname:
+        return None
+
+    return f"{module}:{qualname}"
+
 
 @dataclass
 class TerraformMethodConfig:
     """Configuration for a registered Terraform method.
 
     Attributes:
-        method: The original method.
+        method: The original method (None when discovered statically).
         method_name: Name of the method.
         module_type: Type of Terraform module (data_source, null_resource).
         key: Output key name.
@@ -51,13 +97,24 @@ class TerraformMethodConfig:
         env_variables: Environment variables to read.
         sensitive_env_variables: Sensitive environment variables.
         extra_outputs: Additional output keys.
+        sub_keys: Outputs taken from keys of the primary result.
         required_providers: Additional Terraform providers.
         generation_forbidden: Whether to skip module generation.
         always_run: Whether to always trigger execution.
+        refresh: Re-trigger execution once per interval (``1h``, ``1d``).
         plaintext_output: Whether output is plaintext (vs base64 JSON).
+        columnar: Send record results as column arrays (see ``columnar``).
+        result_mode: ``inline``, or ``file`` to pass the result through a
+            file instead of Terraform state (see ``result_files``).
+        spill_inputs: Pass encoded null resource inputs as files instead of
+            environment variables.
+        projection: Accept a ``bridge_fields`` input projecting the result
+            (see ``projection``).
+        import_path: ``module:qualname`` used to resolve ``method`` lazily.
+        members: Member methods served by a composite data source.
     """
 
-    method: Callable[..., Any]
+    method: Callable[..., Any] | None
     method_name: str
     module_type: str = "data_source"
     key: str | None = None
@@ -67,30 +124,207 @@ class TerraformMethodConfig:
     env_variables: dict[str, dict[str, Any]] = field(default_factory=dict)
     sensitive_env_variables: dict[str, dict[str, Any]] = field(default_factory=dict)
     extra_outputs: dict[str, dict[str, Any]] = field(default_factory=dict)
+    sub_keys: dict[str, dict[str, Any]] = field(default_factory=dict)
     required_providers: dict[str, dict[str, str]] = field(default_factory=dict)
     generation_forbidden: bool = False
     always_run: bool = False
+    refresh: str | None = None
     plaintext_output: bool = False
+    columnar: bool = False
+    result_mode: str = "inline"
+    spill_inputs: bool = False
+    projection: bool = False
+    import_path: str | None = None
+    members: list[str] = field(default_factory=list)
+    _takes_self: bool | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _decoder: InputDecoder | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Extract description from docstring if not provided."""
-        if self.description is None and self.method.__doc__:
+        if self.description is None and self.method is not None and self.method.__doc__:
             # First line of docstring
             self.description = self.method.__doc__.strip().split("\n")[0]
 
         if self.key is None:
             self.key = self.method_name
 
+        if self.import_path is None and self.method is not None:
+            self.import_path = get_import_path(self.method)
+
+    def resolve_method(self) -> Callable[..., Any]:
+        """Return the callable, importing it from ``import_path`` if needed.
+
+        Returns:
+            The registered function.
+
+        Raises:
+            RuntimeError: If there is neither a callable nor an import path.
+        """
+        if self.method is not None:
+            return self.method
+
+        if self.import_path is None:
+            raise RuntimeError(
+                f"Method {self.method_name} has no callable or import path"
+            )
+
+        module_path, qualname = self.import_path.split(":", 1)
+        target: Any = importlib.import_module(module_path)
+        for attr in qualname.split("."):
+            target = getattr(target, attr)
+
+        self.method = target
+        return target
+
+    def resolve_owner(self) -> type[Any]:
+        """Return the class a method was defined on, importing it if needed.
+
+        Returns:
+            The owning class.
+
+        Raises:
+            RuntimeError: If the method is not defined on an importable class.
+        """
+        module_path, _, qualname = (self.import_path or "").partition(":")
+        if "." not in qualname:
+            # Module-level functions have a bare qualname
+            raise RuntimeError(
+                f"Method {self.method_name} is not defined on an importable class"
+            )
+
+        owner: Any = importlib.import_module(module_path)
+        for attr in qualname.split(".")[:-1]:
+            owner = getattr(owner, attr)
+
+        return owner  # type: ignore[no-any-return]
+
+    def takes_self(self) -> bool:
+        """Whether the method must be called on an instance of its class."""
+        if self._takes_self is None:
+            params = list(inspect.signature(self.resolve_method()).parameters)
+            self._takes_self = bool(params) and params[0] == "self"
+
+        return self._takes_self
+
+    def is_async(self) -> bool:
+        """Whether the method is ``async def`` (coroutine or async generator)."""
+        from python_terraform_bridge.runtime import is_async_method
+
+        return is_async_method(self.resolve_method())
+
+    def get_source_checksum(self) -> str:
+        """Hash the method's source and its same-module dependencies.
+
+        The source is read from ``import_path`` without importing it.
+
+        Returns:
+            Hex SHA-256 digest.
+
+        Raises:
+            RuntimeError: If the method has no import path or its source
+                cannot be read.
+        """
+        from python_terraform_bridge.static import get_method_checksum
+
+        if self.import_path is None:
+            raise RuntimeError(f"Method {self.method_name} has no import path")
+
+        try:
+            return get_method_checksum(self.import_path)
+        except (ImportError, AttributeError, OSError, SyntaxError) as exc:
+            raise RuntimeError(
+                f"Failed to hash the source of {self.method_name}: {exc}"
+            ) from exc
+
+    def get_output_plan(self) -> dict[str, Any]:
+        """Return the result keys the generated module reads.
+
+        Returns:
+            Keyword arguments for ``runtime.encode_result``.
+        """
+        return {
+            "key": self.key or self.method_name,
+            "extra_outputs": list(self.extra_outputs),
+            "sub_keys": [
+                sub_key
+                for sub_key, sub_key_config in self.sub_keys.items()
+                if strtobool(sub_key_config.get("split", False))
+            ],
+            "plaintext_output": self.plaintext_output,
+            "columnar": self.columnar,
+        }
+
+    def get_decoder(self) -> InputDecoder:
+        """Return the input decoder for this method, compiled on first use."""
+        if self._decoder is None:
+            self._decoder = InputDecoder(self.parameters)
+
+        return self._decoder
+
+    def decode_inputs(self, inputs: Mapping[str, Any]) -> dict[str, Any]:
+        """Validate raw inputs and decode them into method keyword arguments.
+
+        Args:
+            inputs: Merged inputs from the environment, stdin and callers.
+
+        Returns:
+            Decoded keyword arguments for the registered parameters.
+
+        Raises:
+            ValueError: If required inputs are missing, have the wrong type or
+                cannot be decoded.
+        """
+        try:
+            return self.get_decoder().decode(inputs)
+        except ValueError as exc:
+            raise ValueError(f"Invalid inputs for {self.method_name}: {exc}") from exc
+
+    def to_manifest_entry(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible manifest entry.
+
+        Returns:
+            Dict of every field except the callable itself.
+        """
+        entry = {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.init and f.name != "method"
+        }
+        entry["parameters"] = [asdict(param) for param in self.parameters]
+        return entry
+
+    @classmethod
+    def from_manifest_entry(cls, entry: dict[str, Any]) -> TerraformMethodConfig:
+        """Deserialize a manifest entry without importing the method.
+
+        Args:
+            entry: Dict produced by ``to_manifest_entry``.
+
+        Returns:
+            TerraformMethodConfig whose callable resolves lazily.
+        """
+        entry = dict(entry)
+        entry["parameters"] = [
+            TerraformModuleParameter(**param) for param in entry.get("parameters", [])
+        ]
+        return cls(method=None, **entry)
+
     def to_module_resources(
         self,
         terraform_modules_dir: str = "terraform-modules",
         binary_name: str = "python -m python_terraform_bridge",
+        checksum: str | None = None,
     ) -> TerraformModuleResources:
         """Convert to TerraformModuleResources.
 
         Args:
             terraform_modules_dir: Output directory for modules.
             binary_name: Command to invoke the Python runtime.
+            checksum: Default for the module's checksum variable.
 
         Returns:
             TerraformModuleResources instance.
@@ -100,31 +334,27 @@ class TerraformMethodConfig:
             "key": self.key,
             "type": self.module_type,
             "plaintext_output": self.plaintext_output,
+            "columnar": self.columnar,
         }
         if self.always_run:
             generator_params["always"] = True
+        if self.refresh:
+            generator_params["refresh"] = self.refresh
+        if self.result_mode != "inline":
+            generator_params["result_mode"] = self.result_mode
+        if self.spill_inputs:
+            generator_params["spill_inputs"] = True
+        if self.projection:
+            generator_params["projection"] = True
 
         # Build docstring for compatibility
         docstring_lines = [self.description or ""]
         docstring_lines.append(
             f"generator=key: {self.key}, type: {self.module_type}"
             + (f", module_class: {self.module_class}" if self.module_class else "")
+            + (f", members: {'|'.join(self.members)}" if self.members else "")
         )
 
-        for param in self.parameters:
-            parts = [f"name: {param.name}"]
-            if param.type:
-                parts.append(f"type: {param.type}")
-            if not param.required:
-                parts.append("required: false")
-                if param.default is not None:
-                    parts.append(f'default: "{param.default}"')
-            if param.description:
-                parts.append(f'description: "{param.description}"')
-            if param.sensitive:
-                parts.append("sensitive: true")
-            docstring_lines.append(", ".join(parts))
-
         for env_name, env_config in self.env_variables.items():
             parts = [f"name: {env_name}"]
             if env_config.get("required"):
@@ -139,18 +369,23 @@ class TerraformMethodConfig:
 
         docstring = "\n".join(docstring_lines)
 
+        # Parameters are passed as-is rather than rendered into the docstring
+        # so that structured types, typed defaults and encodings survive
         resources = TerraformModuleResources(
             module_name=self.method_name,
             docstring=docstring,
             module_type=self.module_type,
+            module_params=self.parameters,
             terraform_modules_dir=terraform_modules_dir,
             terraform_modules_class=self.module_class,
             binary_name=binary_name,
+            checksum=checksum,
         )
 
         # Override with explicit settings
         resources.generator_parameters.update(generator_params)
         resources.extra_outputs.update(self.extra_outputs)
+        resources.sub_keys.update(self.sub_keys)
         resources.required_providers.update(self.required_providers)
         resources.generation_forbidden = self.generation_forbidden
 
@@ -186,6 +421,11 @@ class TerraformRegistry:
         """
         self.name = name
         self._methods: dict[str, TerraformMethodConfig] = {}
+        self._logging: Logging | None = None
+        # Guards registration and lazy setup. Readers iterate snapshots
+        # from _get_methods(), so decorators running in other threads
+        # (or without the GIL) never change a dict being iterated.
+        self._lock = threading.RLock()
 
     def register(
         self,
@@ -198,10 +438,16 @@ class TerraformRegistry:
         env_variables: dict[str, dict[str, Any]] | None = None,
         sensitive_env_variables: dict[str, dict[str, Any]] | None = None,
         extra_outputs: dict[str, dict[str, Any]] | None = None,
+        sub_keys: dict[str, dict[str, Any]] | None = None,
         required_providers: dict[str, dict[str, str]] | None = None,
         generation_forbidden: bool = False,
         always_run: bool = False,
+        refresh: str | None = None,
         plaintext_output: bool = False,
+        columnar: bool = False,
+        result_mode: str = "inline",
+        spill_inputs: bool = False,
+        projection: bool = False,
     ) -> Callable[[F], F]:
         """Register a method with the Terraform bridge.
 
@@ -215,14 +461,35 @@ class TerraformRegistry:
             env_variables: Environment variables.
             sensitive_env_variables: Sensitive environment variables.
             extra_outputs: Additional outputs.
+            sub_keys: Outputs taken from keys of the primary result; set
+                ``split: True`` to have the runtime emit them separately.
             required_providers: Additional providers.
             generation_forbidden: Skip module generation.
             always_run: Always trigger execution.
+            refresh: Re-trigger execution only when time enters a new
+                interval (``15m``, ``1h``, ``6h``, ``1d``).
             plaintext_output: Output as plaintext.
+            columnar: Send a list or dict of records as one array per
+                field; the generated module rebuilds the records.
+            result_mode: ``file`` to write the result to a content-addressed
+                file and keep only its path in Terraform state.
+            spill_inputs: Have null resources write JSON or base64 encoded
+                inputs to files and pass only their paths.
+            projection: Give the data source module a ``bridge_fields``
+                variable selecting the result fields to keep.
 
         Returns:
             Decorator function.
+
+        Raises:
+            ValueError: If the refresh interval or result mode is not
+                supported, or columnar output is combined with plaintext.
         """
+        # Fail at registration rather than at generation time
+        if refresh is not None:
+            get_refresh_trigger(refresh)
+        get_result_mode(result_mode)
+        check_columnar_output(columnar, plaintext_output)
 
         def decorator(func: F) -> F:
             nonlocal method_name, parameters
@@ -245,13 +512,20 @@ class TerraformRegistry:
                 env_variables=env_variables or {},
                 sensitive_env_variables=sensitive_env_variables or {},
                 extra_outputs=extra_outputs or {},
+                sub_keys=sub_keys or {},
                 required_providers=required_providers or {},
                 generation_forbidden=generation_forbidden,
                 always_run=always_run,
+                refresh=refresh,
                 plaintext_output=plaintext_output,
+                columnar=columnar,
+                result_mode=result_mode,
+                spill_inputs=spill_inputs,
+                projection=projection,
             )
 
-            self._methods[method_name] = config
+            with self._lock:
+                self._methods[method_name] = config
 
             @functools.wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -306,6 +580,58 @@ class TerraformRegistry:
             **kwargs,
         )
 
+    def composite(
+        self,
+        method_name: str,
+        members: list[str],
+        module_class: str | None = None,
+        description: str | None = None,
+    ) -> TerraformMethodConfig:
+        """Register a composite data source serving several members at once.
+
+        The generated module calls the runtime once; the runtime runs every
+        member concurrently in a single process and returns all of their
+        outputs, so the module exposes the same outputs as the members'
+        own modules.
+
+        Args:
+            method_name: Name of the composite module.
+            members: Registered data source methods to serve.
+            module_class: Module class prefix.
+            description: Short description.
+
+        Returns:
+            The composite's configuration.
+
+        Raises:
+            ValueError: If a member is unknown, not a data source or itself
+                a composite.
+        """
+        # Check members and register in one step
+        with self._lock:
+            for member in members:
+                member_config = self._methods.get(member)
+                if member_config is None:
+                    raise ValueError(
+                        f"Composite {method_name} member not found: {member}"
+                    )
+                if member_config.module_type != "data_source" or member_config.members:
+                    raise ValueError(
+                        f"Composite {method_name} member {member} must be a data source"
+                    )
+
+            config = TerraformMethodConfig(
+                method=None,
+                method_name=method_name,
+                module_class=module_class,
+                description=description or f"Composite of {', '.join(members)}",
+                members=list(members),
+            )
+
+            self._methods[method_name] = config
+
+        return config
+
     def _infer_parameters(
         self,
         func: Callable[..., Any],
@@ -319,7 +645,12 @@ class TerraformRegistry:
             List of inferred parameters.
         """
         sig = inspect.signature(func)
-        hints = getattr(func, "__annotations__", {})
+
+        # Resolve postponed (string) annotations where possible
+        try:
+            hints = typing.get_type_hints(func)
+        except Exception:
+            hints = getattr(func, "__annotations__", {})
         parameters = []
 
         for name, param in sig.parameters.items():
@@ -338,6 +669,11 @@ class TerraformRegistry:
 
         return parameters
 
+    def _get_methods(self) -> dict[str, TerraformMethodConfig]:
+        """Return a snapshot of the registered methods, safe to iterate."""
+        with self._lock:
+            return dict(self._methods)
+
     def get_method(self, method_name: str) -> TerraformMethodConfig | None:
         """Get a registered method by name.
 
@@ -356,66 +692,694 @@ class TerraformRegistry:
             Dict mapping method names to descriptions.
         """
         return {
-            name: config.description or "" for name, config in self._methods.items()
+            name: config.description or ""
+            for name, config in self._get_methods().items()
         }
 
     def generate_modules(
         self,
         output_dir: str = "terraform-modules",
         binary_name: str = "python -m python_terraform_bridge",
+        source_checksum: bool = False,
+        dedupe: bool = False,
+        shard: str | tuple[int, int] | None = None,
+        shard_weights: Mapping[str, float] | None = None,
+        staged: bool = True,
     ) -> dict[str, Path]:
         """Generate Terraform modules for all registered methods.
 
         Args:
             output_dir: Directory to write modules.
             binary_name: Command to invoke the runtime.
+            source_checksum: Default each checksum variable to a hash of the
+                method's source, so resources re-run only when code changes.
+            dedupe: Write each distinct module once to a content-addressed
+                store and a thin wrapper module per method (see
+                ``python_terraform_bridge.store.ModuleStore``).
+            shard: Only write the modules of shard ``"INDEX/COUNT"`` (or
+                ``(index, count)``) and record them in a shard manifest for
+                ``python_terraform_bridge.sharding.merge_shards``.
+            shard_weights: Seconds per relative module path from an earlier
+                run, to balance shards by cost instead of by count.
+            staged: Write the modules to a temporary sibling directory and
+                move them in once all are written (see
+                ``python_terraform_bridge.staging.StagedTree``), instead of
+                overwriting files in place one by one.
 
         Returns:
             Dict mapping method names to generated module paths.
+
+        Raises:
+            ValueError: If the shard is invalid or combined with dedupe.
         """
-        generated: dict[str, Path] = {}
+        from python_terraform_bridge.generation import write_modules
 
-        for name, config in self._methods.items():
-            if config.generation_forbidden:
-                continue
+        all_resources = self.get_all_resources(
+            output_dir, binary_name, source_checksum=source_checksum
+        )
+
+        return write_modules(
+            all_resources,
+            output_dir,
+            staged=staged,
+            dedupe=dedupe,
+            shard=shard,
+            shard_weights=shard_weights,
+        ).paths
+
+    @property
+    def logging(self) -> Logging:
+        """Runtime logging, created on first use."""
+        if self._logging is None:
+            from lifecyclelogging import Logging
+
+            with self._lock:
+                # One Logging per registry, even if threads race to log
+                if self._logging is None:
+                    self._logging = Logging(
+                        enable_console=False,
+                        enable_file=True,
+                        logger_name="terraform_bridge",
+                    )
+
+        return self._logging
+
+    def invoke(
+        self,
+        method_name: str,
+        from_stdin: bool = False,
+        to_stdout: bool = False,
+        instance: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Invoke a registered method by name.
+
+        The method is looked up directly in the registry, so dispatch cost
+        does not depend on how many methods are registered. Inputs are read
+        from the environment and stdin for each registered parameter, then
+        overridden by explicit keyword arguments.
+
+        Args:
+            method_name: Name of the registered method.
+            from_stdin: Read inputs as JSON from stdin.
+            to_stdout: Write the encoded result to stdout.
+            instance: Instance to call the method on, for methods that take
+                ``self``. Defaults to a new instance of the owning class.
+            **kwargs: Explicit method arguments.
+
+        Composites read their members' inputs namespaced as
+        ``<member>.<name>`` and return a dict of member results.
+
+        ``async def`` methods are run to completion on the calling thread's
+        event loop, which is kept for later calls; use ``ainvoke`` from
+        code that is already running on a loop.
+
+        Methods may return a generator or async generator of result items
+        (see ``python_terraform_bridge.streaming``), which is written to
+        stdout as it is consumed.
+
+        For methods registered with ``projection=True``, a ``bridge_fields``
+        input is reserved: it projects the result written to stdout (see
+        ``python_terraform_bridge.projection``) and is never passed to the
+        method.
+
+        Returns:
+            Method result. A result stream is returned unconsumed, or None
+            once it has been written to stdout.
+
+        Raises:
+            ValueError: If the method is unknown or required inputs are missing.
+        """
+        from python_terraform_bridge.runtime import call_method
+        from python_terraform_bridge.streaming import (
+            is_result_stream,
+            write_result_stream,
+        )
+
+        config, inputs = self._get_call_inputs(method_name, from_stdin, kwargs)
+        projection = self._get_projection(config, inputs)
+
+        if config.members:
+            return self._invoke_composite(config, inputs, to_stdout=to_stdout)
+
+        args, call_kwargs = self._bind_call(config, inputs, instance, to_stdout)
+        result = call_method(config.resolve_method(), *args, **call_kwargs)
+
+        if to_stdout and is_result_stream(result):
+            with open_result_output(config.result_mode) as out:
+                write_result_stream(
+                    result,
+                    out,
+                    projection=projection,
+                    logger=self.logging.logger,
+                    label=method_name,
+                    **config.get_output_plan(),
+                )
+            return None
+
+        if to_stdout:
+            self._output_result(config, result, projection)
+
+        return result
+
+    async def ainvoke(
+        self,
+        method_name: str,
+        from_stdin: bool = False,
+        to_stdout: bool = False,
+        instance: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Invoke a registered method by name from a coroutine.
+
+        Takes the same arguments as ``invoke``. ``async def`` methods are
+        awaited on the running event loop, so a method can fan out many
+        concurrent requests; sync methods run in a worker thread so they do
+        not block the loop. Composite members run concurrently as tasks.
+
+        Returns:
+            Method result. A result stream is returned unconsumed, or None
+            once it has been written to stdout.
+
+        Raises:
+            ValueError: If the method is unknown or required inputs are missing.
+        """
+        from python_terraform_bridge.runtime import acall_method
+        from python_terraform_bridge.streaming import (
+            awrite_result_stream,
+            is_result_stream,
+        )
+
+        config, inputs = self._get_call_inputs(method_name, from_stdin, kwargs)
+        projection = self._get_projection(config, inputs)
+
+        if config.members:
+            return await self._ainvoke_composite(config, inputs, to_stdout=to_stdout)
+
+        args, call_kwargs = self._bind_call(config, inputs, instance, to_stdout)
+        result = await acall_method(config.resolve_method(), *args, **call_kwargs)
+
+        if to_stdout and is_result_stream(result):
+            with open_result_output(config.result_mode) as out:
+                await awrite_result_stream(
+                    result,
+                    out,
+                    projection=projection,
+                    logger=self.logging.logger,
+                    label=method_name,
+                    **config.get_output_plan(),
+                )
+            return None
+
+        if to_stdout:
+            self._output_result(config, result, projection)
+
+        return result
+
+    def _get_call_inputs(
+        self,
+        method_name: str,
+        from_stdin: bool,
+        kwargs: dict[str, Any],
+    ) -> tuple[TerraformMethodConfig, dict[str, Any]]:
+        """Look up a method and collect its inputs, explicit kwargs last.
+
+        Raises:
+            ValueError: If the method is unknown.
+        """
+        config = self._methods.get(method_name)
+        if config is None:
+            raise ValueError(
+                f"Unknown method: {method_name}. Available: {list(self._get_methods())}"
+            )
+
+        inputs = self._read_inputs(config, from_stdin=from_stdin)
+        inputs.update(kwargs)
+        return config, inputs
+
+    def _bind_call(
+        self,
+        config: TerraformMethodConfig,
+        inputs: dict[str, Any],
+        instance: Any,
+        to_stdout: bool,
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        """Return the positional and keyword arguments to call a method with.
+
+        Raises:
+            ValueError: If inputs are missing or invalid.
+        """
+        # Decode before the (potentially expensive) owner instance is built
+        call_kwargs = config.decode_inputs(inputs)
+
+        if not config.takes_self():
+            return (), call_kwargs
+
+        if instance is None:
+            instance = self._instantiate_owner(config, to_stdout=to_stdout)
+        return (instance,), call_kwargs
+
+    @staticmethod
+    def _get_projection(
+        config: TerraformMethodConfig, inputs: dict[str, Any]
+    ) -> Projection | None:
+        """Take the projection spec out of the inputs of a projecting method.
 
-            resources = config.to_module_resources(
-                terraform_modules_dir=output_dir,
-                binary_name=binary_name,
+        Raises:
+            ValueError: If the projection spec is malformed.
+        """
+        if not config.projection:
+            return None
+
+        return parse_projection(inputs.pop(PROJECTION_VARIABLE, None))
+
+    def _output_result(
+        self,
+        config: TerraformMethodConfig,
+        result: Any,
+        projection: Projection | None = None,
+    ) -> None:
+        """Encode a method result, projected if requested, and write it out."""
+        from python_terraform_bridge.runtime import encode_result
+
+        output = encode_result(
+            result, projection=projection, **config.get_output_plan()
+        )
+        with open_result_output(config.result_mode) as out:
+            print(json.dumps(output), file=out)
+
+    def run(self, args: list[str] | None = None) -> None:
+        """Run the registry as a Terraform external data provider CLI.
+
+        Args:
+            args: Command line arguments (defaults to sys.argv).
+        """
+        from python_terraform_bridge.runtime import TerraformRuntime, log_exception
+
+        if args is None:
+            args = sys.argv[1:]
+
+        if not args:
+            self._print_help()
+            sys.exit(1)
+
+        method_name = "_".join(args)
+
+        if method_name == "show_methods":
+            registered = self._get_methods()
+            methods = {
+                "data_sources": [
+                    name
+                    for name, config in registered.items()
+                    if config.module_type == "data_source"
+                ],
+                "resources": [
+                    name
+                    for name, config in registered.items()
+                    if config.module_type == "null_resource"
+                ],
+            }
+            print(json.dumps(methods, indent=2))
+            sys.exit(0)
+
+        if method_name not in self._methods:
+            self.logging.logger.error(f"Unknown method: {method_name}")
+            self._print_help()
+            sys.exit(1)
+
+        try:
+            self.invoke(method_name, from_stdin=True, to_stdout=True)
+        except Exception as e:
+            error_id = log_exception(self.logging.logger, method_name, e)
+            print(json.dumps(TerraformRuntime._format_public_error(error_id)))
+            sys.exit(1)
+
+    def _invoke_composite(
+        self,
+        config: TerraformMethodConfig,
+        inputs: dict[str, Any],
+        *,
+        to_stdout: bool,
+    ) -> dict[str, Any]:
+        """Run a composite's members concurrently in this process.
+
+        Members defined on the same class share one instance, so clients
+        and sessions set up by the owner are only created once. If any
+        member is async, all of them run as tasks on the event loop.
+        Streamed member results are assembled, since all members share one
+        response.
+        """
+        from python_terraform_bridge.runtime import (
+            ainvoke_composite,
+            invoke_composite,
+            run_sync,
+        )
+        from python_terraform_bridge.streaming import collect_result
+
+        member_configs, member_inputs, instances = self._prepare_composite(
+            config, inputs, to_stdout=to_stdout
+        )
+
+        if any(member_config.is_async() for member_config in member_configs.values()):
+            results = run_sync(
+                ainvoke_composite(
+                    functools.partial(self._acall_member, member_configs, instances),
+                    member_inputs,
+                )
+            )
+        else:
+            results = invoke_composite(
+                lambda member, kwargs: collect_result(
+                    self.invoke(
+                        member,
+                        instance=self._get_member_instance(
+                            member_configs[member], instances
+                        ),
+                        **kwargs,
+                    )
+                ),
+                member_inputs,
             )
 
-            module_path = resources.get_module_path()
-            module_json = resources.get_mixed()
+        if to_stdout:
+            self._output_composite(member_configs, results)
+
+        return results
+
+    async def _ainvoke_composite(
+        self,
+        config: TerraformMethodConfig,
+        inputs: dict[str, Any],
+        *,
+        to_stdout: bool,
+    ) -> dict[str, Any]:
+        """Run a composite's members concurrently on the running event loop."""
+        from python_terraform_bridge.runtime import ainvoke_composite
+
+        member_configs, member_inputs, instances = self._prepare_composite(
+            config, inputs, to_stdout=to_stdout
+        )
 
-            # Ensure directory exists
-            module_path.parent.mkdir(parents=True, exist_ok=True)
+        results = await ainvoke_composite(
+            functools.partial(self._acall_member, member_configs, instances),
+            member_inputs,
+        )
 
-            # Write module
-            with module_path.open("w") as f:
-                json.dump(module_json, f, indent=2)
+        if to_stdout:
+            self._output_composite(member_configs, results)
 
-            generated[name] = module_path
+        return results
 
-        return generated
+    def _prepare_composite(
+        self,
+        config: TerraformMethodConfig,
+        inputs: dict[str, Any],
+        *,
+        to_stdout: bool,
+    ) -> tuple[
+        dict[str, TerraformMethodConfig],
+        dict[str, dict[str, Any]],
+        dict[Any, Any],
+    ]:
+        """Validate a composite's member inputs and create shared instances.
+
+        Returns:
+            Member configurations, inputs of each member, and one instance
+            per owning class.
+        """
+        from python_terraform_bridge.runtime import split_composite_inputs
+
+        member_configs = {member: self._methods[member] for member in config.members}
+
+        # Validate every member before any of them runs
+        member_inputs = split_composite_inputs(inputs, config.members)
+        for member, member_config in member_configs.items():
+            member_config.decode_inputs(
+                {
+                    **self._read_inputs(member_config, from_stdin=False),
+                    **member_inputs[member],
+                }
+            )
+
+        instances: dict[Any, Any] = {}
+        for member_config in member_configs.values():
+            if member_config.takes_self():
+                owner = member_config.resolve_owner()
+                if owner not in instances:
+                    instances[owner] = self._instantiate_owner(
+                        member_config, to_stdout=to_stdout
+                    )
+
+        return member_configs, member_inputs, instances
+
+    async def _acall_member(
+        self,
+        member_configs: Mapping[str, TerraformMethodConfig],
+        instances: Mapping[Any, Any],
+        member: str,
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Invoke a composite member from a coroutine, assembling streams."""
+        from python_terraform_bridge.streaming import acollect_result
+
+        result = await self.ainvoke(
+            member,
+            instance=self._get_member_instance(member_configs[member], instances),
+            **kwargs,
+        )
+        return await acollect_result(result)
+
+    @staticmethod
+    def _get_member_instance(
+        member_config: TerraformMethodConfig,
+        instances: Mapping[Any, Any],
+    ) -> Any:
+        """Return the shared instance a composite member is called on."""
+        if not member_config.takes_self():
+            return None
+
+        return instances[member_config.resolve_owner()]
+
+    @staticmethod
+    def _output_composite(
+        member_configs: Mapping[str, TerraformMethodConfig],
+        results: Mapping[str, Any],
+    ) -> None:
+        """Encode the member results of a composite and write them to stdout."""
+        from python_terraform_bridge.runtime import (
+            encode_result,
+            merge_composite_outputs,
+        )
+
+        outputs = {
+            member: encode_result(result, **member_configs[member].get_output_plan())
+            for member, result in results.items()
+        }
+        print(json.dumps(merge_composite_outputs(outputs)))
+
+    def _read_inputs(
+        self,
+        config: TerraformMethodConfig,
+        *,
+        from_stdin: bool,
+    ) -> dict[str, Any]:
+        """Collect raw inputs for a method's parameters.
+
+        Environment variables are read first (null resources receive their
+        triggers this way), then stdin JSON (external data queries) on top.
+        Spilled inputs are read from their files.
+        """
+        inputs = {}
+        for param in config.parameters:
+            for name in (param.name, param.name + FILE_INPUT_SUFFIX):
+                if name in os.environ:
+                    inputs[name] = os.environ[name]
+
+        if from_stdin:
+            raw = sys.stdin.read()
+            if raw.strip():
+                inputs.update(json.loads(raw))
+
+        resolve_file_inputs(inputs)
+        return inputs
+
+    def _instantiate_owner(
+        self,
+        config: TerraformMethodConfig,
+        *,
+        to_stdout: bool,
+    ) -> Any:
+        """Create an instance of the class a method is defined on."""
+        from python_terraform_bridge.runtime import (
+            instantiate_target,
+            is_directed_inputs_class,
+        )
+
+        owner = config.resolve_owner()
+        if not is_directed_inputs_class(owner):
+            return owner()
+
+        # Stdin has already been consumed by the registry
+        return instantiate_target(
+            owner,
+            logging=self.logging,
+            from_stdin=False,
+            to_stdout=to_stdout,
+            resource_type=config.module_type,
+        )
+
+    def _print_help(self) -> None:
+        """Print help message."""
+        help_txt = "Terraform Bridge Runtime\n\n"
+        help_txt += "Usage: python -m python_terraform_bridge <method_name>\n\n"
+
+        for name, description in self.list_methods().items():
+            help_txt += f"  {name}: {description}\n"
+
+        print(help_txt)
+
+    def export_manifest(self, path: str | Path | None = None) -> dict[str, Any]:
+        """Serialize every registered method to a versioned manifest.
+
+        The manifest stores each method's import path in place of the
+        callable, so listing and generation can run without importing
+        user code.
+
+        Args:
+            path: Optional file to write the manifest JSON to.
+
+        Returns:
+            The manifest dictionary.
+        """
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "name": self.name,
+            "methods": {
+                name: config.to_manifest_entry()
+                for name, config in self._get_methods().items()
+            },
+        }
+
+        if path is not None:
+            with Path(path).open("w") as f:
+                json.dump(manifest, f, indent=2, default=str)
+
+        return manifest
+
+    @classmethod
+    def from_manifest(
+        cls,
+        manifest: str | Path | dict[str, Any],
+    ) -> TerraformRegistry:
+        """Load a registry from a manifest without importing user code.
+
+        Callables are resolved on first use via
+        ``TerraformMethodConfig.resolve_method``.
+
+        Args:
+            manifest: Manifest dictionary or path to a manifest JSON file.
+
+        Returns:
+            TerraformRegistry populated from the manifest.
+
+        Raises:
+            ValueError: If the manifest version is not supported.
+        """
+        if not isinstance(manifest, dict):
+            with Path(manifest).open() as f:
+                manifest = json.load(f)
+
+        version = manifest.get("version")
+        if version != MANIFEST_VERSION:
+            raise ValueError(
+                f"Unsupported manifest version: {version} (expected {MANIFEST_VERSION})"
+            )
+
+        registry = cls(manifest.get("name", "default"))
+        for name, entry in manifest.get("methods", {}).items():
+            registry._methods[name] = TerraformMethodConfig.from_manifest_entry(entry)
+
+        return registry
 
     def get_all_resources(
         self,
         terraform_modules_dir: str = "terraform-modules",
         binary_name: str = "python -m python_terraform_bridge",
+        source_checksum: bool = False,
     ) -> list[TerraformModuleResources]:
         """Get TerraformModuleResources for all registered methods.
 
         Args:
             terraform_modules_dir: Output directory for modules.
             binary_name: Command to invoke the runtime.
+            source_checksum: Default checksum variables to source hashes.
 
         Returns:
             List of TerraformModuleResources instances.
         """
-        return [
-            config.to_module_resources(terraform_modules_dir, binary_name)
-            for config in self._methods.values()
+        all_resources = [
+            config.to_module_resources(
+                terraform_modules_dir,
+                binary_name,
+                checksum=(
+                    config.get_source_checksum()
+                    if source_checksum and not config.members
+                    else None
+                ),
+            )
+            for config in self._get_methods().values()
         ]
+        TerraformModuleResources.link_composites(all_resources)
+
+        return all_resources
+
+    def iter_resources(
+        self,
+        terraform_modules_dir: str = "terraform-modules",
+        binary_name: str = "python -m python_terraform_bridge",
+        source_checksum: bool = False,
+        max_workers: int | None = None,
+    ) -> Iterator[tuple[TerraformModuleResources, dict[str, Any], float]]:
+        """Build and render the resources of all methods as they are ready.
+
+        Streaming counterpart of ``get_all_resources``: at most a few
+        resources are held at a time, and each is yielded with its
+        ``get_mixed()`` JSON and the seconds it took, in completion order.
+
+        Args:
+            terraform_modules_dir: Output directory for modules.
+            binary_name: Command to invoke the runtime.
+            source_checksum: Default checksum variables to source hashes.
+            max_workers: Worker threads.
+
+        Yields:
+            Tuples of (resources, module JSON, elapsed seconds).
+        """
+
+        def build(config: TerraformMethodConfig) -> TerraformModuleResources:
+            return config.to_module_resources(
+                terraform_modules_dir,
+                binary_name,
+                checksum=(
+                    config.get_source_checksum()
+                    if source_checksum and not config.members
+                    else None
+                ),
+            )
+
+        def build_member(method_name: str) -> TerraformModuleResources:
+            config = self._methods.get(method_name)
+            if config is None:
+                raise RuntimeError(f"Composite member not found: {method_name}")
+
+            return build(config)
+
+        return iter_rendered_resources(
+            list(self._get_methods().values()),
+            build=build,
+            build_member=build_member,
+            max_workers=max_workers,
+        )
 
 
 # Global default registry
@@ -0,0 +1,280 @@
+"""Out-of-band result files for large external data results.
+
+Terraform stores every external data result in state and reads it back on
+each refresh. Methods with ``result_mode: file`` keep large payloads out of
+state: the runtime writes the encoded result to a content-addressed file
+and returns only its location::
+
+    {"result_path": "/tmp/terraform-bridge-results-1000/<sha256>.json",
+     "result_sha256": "<sha256>"}
+
+The generated module reads the file with ``file()`` into a local, and a
+postcondition on the data source checks its ``filesha256()`` against the
+hash. Locals are not stored in state (unlike a ``local_file`` data
+source's content), so only the path and hash are.
+
+Identical results share one file. Writing a result refreshes its file's
+age, and files not written for ``TERRAFORM_BRIDGE_RESULT_MAX_AGE`` seconds
+(a day by default) are removed whenever a result is written. Files go to
+``TERRAFORM_BRIDGE_RESULT_DIR``, by default ``terraform-bridge-results-<uid>``
+in the system temporary directory. Results may be sensitive, so the
+directory must belong to the current user and be private to them (mode
+0700); others are refused. It must also keep files for as long as a saved
+plan may be applied.
+
+Example:
+    @registry.data_source(key="inventory", result_mode="file")
+    def get_inventory() -> dict: ...
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import stat
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import TextIO
+
+
+RESULT_MODES = ("inline", "file")
+
+RESULT_DIR_ENV = "TERRAFORM_BRIDGE_RESULT_DIR"
+RESULT_MAX_AGE_ENV = "TERRAFORM_BRIDGE_RESULT_MAX_AGE"
+DEFAULT_MAX_AGE = 24 * 60 * 60
+
+# Keys of the external data result pointing at the file
+PATH_KEY = "result_path"
+HASH_KEY = "result_sha256"
+
+RESULT_SUFFIX = ".json"
+PARTIAL_SUFFIX = ".partial"
+
+
+def get_result_mode(mode: Any) -> str:
+    """Validate a result mode.
+
+    Args:
+        mode: ``inline``, ``file``, or None/empty for ``inline``.
+
+    Returns:
+        The result mode.
+
+    Raises:
+        ValueError: If the mode is not supported.
+    """
+    if mode is None or mode == "":
+        return "inline"
+
+    if mode not in RESULT_MODES:
+        raise ValueError(
+            f"Invalid result mode {mode!r}; expected one of {', '.join(RESULT_MODES)}"
+        )
+
+    return mode
+
+
+def get_result_dir() -> Path:
+    """Return the directory result files are written to.
+
+    The default is per user, so users sharing a temporary directory never
+    share result files.
+    """
+    directory = os.environ.get(RESULT_DIR_ENV)
+    if directory:
+        return Path(directory)
+
+    name = "terraform-bridge-results"
+    if hasattr(os, "getuid"):
+        name = f"{name}-{os.getuid()}"
+
+    return Path(tempfile.gettempdir(), name)
+
+
+def check_result_dir(directory: Path | str) -> None:
+    """Refuse a result directory other users could read or write.
+
+    Args:
+        directory: Result file directory.
+
+    Raises:
+        RuntimeError: If the directory is a symlink, is owned by another
+            user, or grants group or other permissions.
+    """
+    if not hasattr(os, "getuid"):
+        # No POSIX ownership to check
+        return
+
+    info = os.lstat(directory)
+    if stat.S_ISLNK(info.st_mode):
+        raise RuntimeError(f"Result directory {directory} is a symlink")
+
+    if info.st_uid != os.getuid():
+        raise RuntimeError(
+            f"Result directory {directory} is owned by uid {info.st_uid}, "
+            f"not the current user ({os.getuid()})"
+        )
+
+    mode = stat.S_IMODE(info.st_mode)
+    if mode & 0o077:
+        raise RuntimeError(
+            f"Result directory {directory} has mode {mode:04o}; expected 0700"
+        )
+
+
+def get_max_age() -> float:
+    """Return the age in seconds after which result files are removed.
+
+    Raises:
+        ValueError: If the environment variable is not a number.
+    """
+    max_age = os.environ.get(RESULT_MAX_AGE_ENV)
+    if not max_age:
+        return DEFAULT_MAX_AGE
+
+    try:
+        return float(max_age)
+    except ValueError as exc:
+        raise ValueError(
+            f"{RESULT_MAX_AGE_ENV} must be a number of seconds, not {max_age!r}"
+        ) from exc
+
+
+def remove_stale_result_files(directory: Path | str, max_age: float) -> int:
+    """Remove result files not written for longer than ``max_age``.
+
+    Leftovers of interrupted writes are removed on the same schedule.
+
+    Args:
+        directory: Result file directory.
+        max_age: Age in seconds.
+
+    Returns:
+        Number of files removed.
+    """
+    cutoff = time.time() - max_age
+    removed = 0
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.endswith((RESULT_SUFFIX, PARTIAL_SUFFIX)):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+            except FileNotFoundError:
+                # Removed by a concurrent run
+                continue
+
+    return removed
+
+
+class ResultFile:
+    """Text stream writing an external data result to a content-addressed file.
+
+    Text is written to a partial file while its hash is computed, then the
+    partial file is renamed to ``<sha256>.json``, replacing an identical
+    earlier copy.
+
+    Attributes:
+        directory: Result file directory.
+        max_age: Age in seconds after which result files are removed.
+        path: Final path, once closed.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str | None = None,
+        max_age: float | None = None,
+    ) -> None:
+        """Open a partial result file.
+
+        Args:
+            directory: Result file directory (default ``get_result_dir()``).
+            max_age: Age in seconds after which result files are removed
+                (default ``get_max_age()``).
+
+        Raises:
+            RuntimeError: If the directory is not private to the current
+                user (see ``check_result_dir``).
+        """
+        self.directory = Path(directory) if directory else get_result_dir()
+        self.max_age = get_max_age() if max_age is None else max_age
+        self.path: Path | None = None
+
+        # Results may be sensitive: keep them private to the user, and do
+        # not trust a directory someone else created first
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        check_result_dir(self.directory)
+        fd, partial_path = tempfile.mkstemp(
+            dir=self.directory, prefix=".", suffix=PARTIAL_SUFFIX
+        )
+        self._partial_path = Path(partial_path)
+        self._file = os.fdopen(fd, "wb")
+        self._digest = hashlib.sha256()
+
+    def write(self, text: str) -> int:
+        """Write text to the file."""
+        data = text.encode()
+        self._digest.update(data)
+        self._file.write(data)
+        return len(text)
+
+    def close(self) -> dict[str, str]:
+        """Move the file into place and remove stale result files.
+
+        Returns:
+            External data result pointing at the file.
+        """
+        self._file.close()
+
+        content_hash = self._digest.hexdigest()
+        self.path = self.directory.joinpath(content_hash + RESULT_SUFFIX).resolve()
+        os.replace(self._partial_path, self.path)
+
+        remove_stale_result_files(self.directory, self.max_age)
+
+        return {PATH_KEY: str(self.path), HASH_KEY: content_hash}
+
+    def discard(self) -> None:
+        """Close and remove the partial file."""
+        self._file.close()
+        self._partial_path.unlink(missing_ok=True)
+
+
+@contextlib.contextmanager
+def open_result_output(result_mode: str = "inline") -> Iterator[TextIO]:
+    """Open the stream an external data result is written to.
+
+    Inline results are written to stdout. File results are written to a
+    ``ResultFile``, and its location is written to stdout on exit.
+
+    Args:
+        result_mode: ``inline`` or ``file``.
+
+    Yields:
+        Text stream for the encoded result.
+    """
+    if result_mode != "file":
+        yield sys.stdout
+        return
+
+    result_file = ResultFile()
+    try:
+        yield result_file  # type: ignore[misc]
+    except BaseException:
+        result_file.discard()
+        raise
+
+    print(json.dumps(result_file.close()))
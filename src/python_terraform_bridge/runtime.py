@@ -7,14 +7,25 @@ The runtime can be invoked either by:
 1. Running `python -m python_terraform_bridge <method_name>`
 2. Using the `terraform-bridge` CLI
 3. Programmatically via TerraformRuntime.invoke()
+
+Methods may be ``async def``. ``invoke`` runs them on an event loop kept per
+thread, so long-lived processes (warm Lambda containers, servers) reuse one
+loop and the clients bound to it; ``ainvoke`` awaits them on the caller's
+loop instead. Methods may also return a (sync or async) generator of result
+items, which is encoded as it is consumed; see ``streaming``.
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import concurrent.futures
+import inspect
 import json
+import re
 import secrets
 import sys
+import threading
 
 from typing import TYPE_CHECKING, Any
 
@@ -22,9 +33,35 @@ from directed_inputs_class import DirectedInputsClass
 from extended_data_types import get_available_methods
 from lifecyclelogging import Logging
 
+from python_terraform_bridge.inputs import resolve_file_inputs
+from python_terraform_bridge.projection import (
+    PROJECTION_VARIABLE,
+    parse_projection,
+    project,
+)
+from python_terraform_bridge.result_files import open_result_output
+from python_terraform_bridge.streaming import (
+    acollect_result,
+    awrite_result_stream,
+    collect_result,
+    dumps_result_stream,
+    is_result_stream,
+    write_result_stream,
+)
+
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable, Iterable, Mapping
+
+    from python_terraform_bridge.module_resources import TerraformModuleResources
+    from python_terraform_bridge.projection import Projection
+
+
+# Docstring lines that change what the runtime writes to stdout
+OUTPUT_ANNOTATIONS = ("generator=", "extra_output=", "sub_key=")
+
+# generator= option listing the members of a composite
+COMPOSITE_MEMBERS = re.compile(r"\bmembers\s*:")
 
 
 class TerraformRuntime:
@@ -71,6 +108,7 @@ class TerraformRuntime:
         self._null_resource_methods = (
             get_available_methods(null_resource_class) if null_resource_class else {}
         )
+        self._module_resources: dict[str, TerraformModuleResources] = {}
 
     def get_available_methods(self) -> dict[str, str]:
         """Get all available method names and descriptions.
@@ -99,8 +137,137 @@ class TerraformRuntime:
             **kwargs: Method arguments.
 
         Returns:
-            Method result.
+            Method result, or a dict of member results for composites. A
+            result stream is returned unconsumed, or None once it has been
+            written to stdout.
+        """
+        members = self._get_member_names(method_name)
+        if members:
+            return self._invoke_composite(
+                method_name,
+                members,
+                from_stdin=from_stdin,
+                to_stdout=to_stdout,
+                **kwargs,
+            )
+
+        method = self._get_bound_method(method_name, from_stdin, to_stdout)
+        projection = self._get_projection(method_name, method, kwargs)
+        result = call_method(method, **kwargs)
+
+        if to_stdout and is_result_stream(result):
+            with open_result_output(self._get_result_mode(method_name)) as out:
+                write_result_stream(
+                    result,
+                    out,
+                    projection=projection,
+                    logger=self.logger,
+                    label=method_name,
+                    **self._get_output_plan(method_name),
+                )
+            return None
+
+        if to_stdout:
+            self._output_result(result, method_name, projection)
+
+        return result
+
+    async def ainvoke(
+        self,
+        method_name: str,
+        from_stdin: bool = False,
+        to_stdout: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        """Invoke a method by name from a coroutine.
+
+        Async methods are awaited on the running event loop; sync methods
+        run in a worker thread so they do not block it.
+
+        Args:
+            method_name: Name of the method to invoke.
+            from_stdin: Read additional args from stdin.
+            to_stdout: Write result to stdout.
+            **kwargs: Method arguments.
+
+        Returns:
+            Method result, or a dict of member results for composites. A
+            result stream is returned unconsumed, or None once it has been
+            written to stdout.
         """
+        members = self._get_member_names(method_name)
+        if members:
+            return await self._ainvoke_composite(
+                method_name,
+                members,
+                from_stdin=from_stdin,
+                to_stdout=to_stdout,
+                **kwargs,
+            )
+
+        method = self._get_bound_method(method_name, from_stdin, to_stdout)
+        projection = self._get_projection(method_name, method, kwargs)
+        result = await acall_method(method, **kwargs)
+
+        if to_stdout and is_result_stream(result):
+            with open_result_output(self._get_result_mode(method_name)) as out:
+                await awrite_result_stream(
+                    result,
+                    out,
+                    projection=projection,
+                    logger=self.logger,
+                    label=method_name,
+                    **self._get_output_plan(method_name),
+                )
+            return None
+
+        if to_stdout:
+            self._output_result(result, method_name, projection)
+
+        return result
+
+    def _get_projection(
+        self,
+        method_name: str,
+        method: Callable[..., Any],
+        kwargs: dict[str, Any],
+    ) -> Projection | None:
+        """Take the projection spec from the call or the instance's inputs.
+
+        Only methods with ``projection: true`` on their ``generator=`` line
+        are projected. For those, an explicit ``bridge_fields`` keyword is
+        removed from ``kwargs``, so it never reaches the method.
+
+        Raises:
+            ValueError: If the projection spec is malformed.
+        """
+        if not self._get_module_resources(method_name).has_projection():
+            return None
+
+        spec = kwargs.pop(PROJECTION_VARIABLE, None)
+        if spec is None:
+            instance = getattr(method, "__self__", None)
+            if instance is not None and not isinstance(instance, DirectedInputsClass):
+                # @directed_inputs classes keep their inputs on a provider
+                instance = getattr(instance, "directed_inputs", None)
+            inputs = getattr(instance, "inputs", None) or {}
+            spec = inputs.get(PROJECTION_VARIABLE)
+
+        return parse_projection(spec)
+
+    def _get_bound_method(
+        self,
+        method_name: str,
+        from_stdin: bool,
+        to_stdout: bool,
+    ) -> Callable[..., Any]:
+        """Instantiate the class serving a method and return the bound method.
+
+        Raises:
+            ValueError: If the method is unknown.
+            AttributeError: If the instance lacks the method.
+        """
+        self._check_method(method_name)
         if method_name in self._data_source_methods:
             instance = self._instantiate_target(
                 self.data_source_class,
@@ -116,46 +283,234 @@ class TerraformRuntime:
                 resource_type="null_resource",
             )
         else:
-            available = list(self._data_source_methods.keys()) + list(
-                self._null_resource_methods.keys()
-            )
-            raise ValueError(f"Unknown method: {method_name}. Available: {available}")
+            raise ValueError(f"{method_name} has no class to run it on")
 
         method = getattr(instance, method_name, None)
         if method is None:
             raise AttributeError(f"Method {method_name} not found on {instance}")
 
-        # Invoke the method
-        result = method(**kwargs)
+        return method  # type: ignore[no-any-return]
+
+    def _invoke_composite(
+        self,
+        method_name: str,
+        members: list[str],
+        from_stdin: bool,
+        to_stdout: bool,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Run the members of a composite method on one shared instance.
+
+        Each member receives its namespaced query entries as keyword
+        arguments. If any member is async, all of them run on the event
+        loop, so async members overlap without a thread each. Streamed
+        member results are assembled, since all members share one response.
+        """
+        instance, member_inputs = self._prepare_composite(
+            method_name, members, from_stdin, to_stdout, **kwargs
+        )
+
+        if any(is_async_method(getattr(instance, m)) for m in members):
+            results = run_sync(
+                ainvoke_composite(
+                    lambda member, member_kwargs: acall_member(
+                        getattr(instance, member), **member_kwargs
+                    ),
+                    member_inputs,
+                )
+            )
+        else:
+            results = invoke_composite(
+                lambda member, member_kwargs: collect_result(
+                    getattr(instance, member)(**member_kwargs)
+                ),
+                member_inputs,
+            )
 
         if to_stdout:
-            self._output_result(result, method_name)
+            self._output_composite(results)
 
-        return result
+        return results
 
-    def _output_result(self, result: Any, method_name: str) -> None:
-        """Format and output result to stdout for Terraform.
+    async def _ainvoke_composite(
+        self,
+        method_name: str,
+        members: list[str],
+        from_stdin: bool,
+        to_stdout: bool,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Run the members of a composite method on the running event loop."""
+        instance, member_inputs = self._prepare_composite(
+            method_name, members, from_stdin, to_stdout, **kwargs
+        )
+
+        results = await ainvoke_composite(
+            lambda member, member_kwargs: acall_member(
+                getattr(instance, member), **member_kwargs
+            ),
+            member_inputs,
+        )
+
+        if to_stdout:
+            self._output_composite(results)
+
+        return results
+
+    def _prepare_composite(
+        self,
+        method_name: str,
+        members: list[str],
+        from_stdin: bool,
+        to_stdout: bool,
+        **kwargs: Any,
+    ) -> tuple[Any, dict[str, dict[str, Any]]]:
+        """Read a composite's inputs and create the instance its members share.
+
+        Returns:
+            The shared instance and the inputs of each member.
+
+        Raises:
+            ValueError: If a member is not a known data source method.
+        """
+        unknown = [m for m in members if m not in self._data_source_methods]
+        if unknown:
+            raise ValueError(f"Composite {method_name} has unknown members: {unknown}")
+
+        inputs: dict[str, Any] = {}
+        if from_stdin:
+            raw = sys.stdin.read()
+            if raw.strip():
+                inputs.update(json.loads(raw))
+        inputs.update(kwargs)
+
+        # Stdin has been consumed; members share one instance (and session)
+        instance = self._instantiate_target(
+            self.data_source_class,
+            from_stdin=False,
+            to_stdout=to_stdout,
+            resource_type="data_source",
+        )
+
+        return instance, split_composite_inputs(inputs, members)
 
-        Terraform external data requires string values, so we base64 encode
-        complex data structures.
+    def _output_composite(self, results: Mapping[str, Any]) -> None:
+        """Encode the member results of a composite and write them to stdout."""
+        outputs = {
+            member: encode_result(result, **self._get_output_plan(member))
+            for member, result in results.items()
+        }
+        print(json.dumps(merge_composite_outputs(outputs)))
+
+    def _output_result(
+        self,
+        result: Any,
+        method_name: str,
+        projection: Projection | None = None,
+    ) -> None:
+        """Format and output result to stdout for Terraform.
 
         Args:
             result: Method result to output.
-            method_name: Name of the method (used as output key).
+            method_name: Name of the method (used to look up its outputs).
+            projection: Projection applied to the primary value.
         """
-        if isinstance(result, dict) and all(
-            isinstance(v, str) for v in result.values()
-        ):
-            # Already a string dict, output directly
-            output = result
-        else:
-            # Encode as base64 JSON
-            encoded = base64.b64encode(
-                json.dumps(result, default=str).encode()
-            ).decode()
-            output = {method_name: encoded}
+        output = encode_result(
+            result,
+            projection=projection,
+            **self._get_output_plan(method_name),
+        )
+        with open_result_output(self._get_result_mode(method_name)) as out:
+            print(json.dumps(output), file=out)
+
+    def _get_output_plan(self, method_name: str) -> dict[str, Any]:
+        """Return the output keys the method's generated module reads.
+
+        Args:
+            method_name: Name of the method.
+
+        Returns:
+            Keyword arguments for ``encode_result``.
+        """
+        return self._get_module_resources(method_name).get_output_plan()
 
-        print(json.dumps(output))
+    def _get_result_mode(self, method_name: str) -> str:
+        """Return how the method's generated module reads its result.
+
+        Args:
+            method_name: Name of the method.
+
+        Returns:
+            ``inline`` or ``file``.
+        """
+        return self._get_module_resources(method_name).get_result_mode()
+
+    def _check_method(self, method_name: str) -> None:
+        """Raise if the runtime does not serve a method.
+
+        Raises:
+            ValueError: If the method is unknown.
+        """
+        if method_name not in self.get_available_methods():
+            available = list(self._data_source_methods.keys()) + list(
+                self._null_resource_methods.keys()
+            )
+            raise ValueError(f"Unknown method: {method_name}. Available: {available}")
+
+    def _get_member_names(self, method_name: str) -> list[str]:
+        """Return the members of a composite method, or [] for other methods.
+
+        Only docstrings declaring ``members`` on their ``generator=`` line
+        are parsed here.
+
+        Raises:
+            ValueError: If the method is unknown.
+        """
+        self._check_method(method_name)
+        docstring = self.get_available_methods().get(method_name)
+        if not _declares_composite(docstring):
+            return []
+
+        return self._get_module_resources(method_name).get_member_names()
+
+    def _get_module_resources(self, method_name: str) -> TerraformModuleResources:
+        """Return the parsed docstring configuration of a method.
+
+        Args:
+            method_name: Name of the method.
+
+        Returns:
+            TerraformModuleResources for the method, parsed once. Docstrings
+            without output annotations are not parsed.
+
+        Raises:
+            ValueError: If the method is unknown.
+        """
+        resources = self._module_resources.get(method_name)
+        if resources is None:
+            # Validate before caching, so unknown names are never stored
+            self._check_method(method_name)
+
+            from python_terraform_bridge.module_resources import (
+                TerraformModuleResources,
+            )
+
+            docstring = self.get_available_methods().get(method_name)
+            if not _has_annotation(docstring, *OUTPUT_ANNOTATIONS):
+                # Plain prose: the default plan, keyed by the method name
+                docstring = None
+
+            # Sealed, so threads serving requests can share it; if two
+            # threads race to parse, setdefault keeps the first
+            resources = self._module_resources.setdefault(
+                method_name,
+                TerraformModuleResources(
+                    module_name=method_name,
+                    docstring=docstring,
+                ).seal(),
+            )
+
+        return resources
 
     def run(self, args: list[str] | None = None) -> None:
         """Run the runtime as a CLI.
@@ -224,42 +579,18 @@ class TerraformRuntime:
     ) -> Any:
         """Instantiate either a legacy DirectedInputsClass or decorator-based class."""
 
-        if issubclass(target_class, DirectedInputsClass):
-            return target_class(
-                to_console=not to_stdout,
-                to_file=True,
-                from_stdin=from_stdin,
-                logging=self.logging,
-            )
-
-        if getattr(target_class, "__directed_inputs_enabled__", False):
-            return target_class(
-                _directed_inputs_config={"from_stdin": from_stdin},
-                _directed_inputs_runtime_logging=self.logging,
-                _directed_inputs_runtime_settings={
-                    "to_console": not to_stdout,
-                    "to_file": True,
-                    "resource_type": resource_type,
-                },
-            )
-
-        raise TypeError(
-            f"{target_class.__name__} must inherit from DirectedInputsClass "
-            "or be decorated with @directed_inputs"
+        return instantiate_target(
+            target_class,
+            logging=self.logging,
+            from_stdin=from_stdin,
+            to_stdout=to_stdout,
+            resource_type=resource_type,
         )
 
     def _handle_exception(self, method_name: str, error: Exception) -> str:
         """Log exceptions and return a public-safe error reference."""
 
-        error_id = secrets.token_hex(8)
-        self.logger.error(
-            "Method %s failed (error_id=%s): %s",
-            method_name,
-            error_id,
-            error,
-            exc_info=True,
-        )
-        return error_id
+        return log_exception(self.logger, method_name, error)
 
     @staticmethod
     def _format_public_error(error_id: str) -> dict[str, str]:
@@ -272,6 +603,428 @@ class TerraformRuntime:
         }
 
 
+def _has_annotation(docstring: str | None, *prefixes: str) -> bool:
+    """Whether a docstring has a line starting with one of the prefixes."""
+    if not docstring:
+        return False
+
+    return any(line.strip().startswith(prefixes) for line in docstring.splitlines())
+
+
+def _declares_composite(docstring: str | None) -> bool:
+    """Whether a docstring's ``generator=`` line lists composite members."""
+    if not docstring:
+        return False
+
+    return any(
+        line.strip().startswith("generator=") and COMPOSITE_MEMBERS.search(line)
+        for line in docstring.splitlines()
+    )
+
+
+def _encode_value(value: Any) -> str:
+    """Encode a single output value as base64 JSON."""
+    return base64.b64encode(json.dumps(value, default=str).encode()).decode()
+
+
+def encode_result(
+    result: Any,
+    key: str,
+    extra_outputs: Iterable[str] = (),
+    sub_keys: Iterable[str] = (),
+    plaintext_output: bool = False,
+    projection: Projection | None = None,
+    columnar: bool = False,
+) -> dict[str, str]:
+    """Encode a method result as a Terraform external data result.
+
+    Terraform external data requires string values, so complex data
+    structures are base64 encoded JSON. One entry is written for every key
+    the generated module reads: the primary ``key``, each extra output and,
+    optionally, pre-split sub keys of the primary result.
+
+    When extra outputs are configured the result must be a dict: each extra
+    output is taken from its entry, and the primary value is ``result[key]``
+    if present or the remaining entries otherwise.
+
+    Args:
+        result: Method result.
+        key: Primary output key.
+        extra_outputs: Additional output keys taken from the result.
+        sub_keys: Keys of the primary value to emit as their own entries.
+        plaintext_output: Write the primary value as a plain string.
+        projection: Keep only these parts of the primary value (see
+            ``projection.parse_projection``). Sub keys are split off first.
+        columnar: Send the (projected) primary value as column arrays (see
+            ``columnar.to_columnar``).
+
+    Returns:
+        Flat string dictionary for the external data protocol.
+
+    Raises:
+        ValueError: If ``columnar`` is set and the primary value is not a
+            list or dict of records.
+    """
+    extra_outputs = list(extra_outputs)
+    sub_keys = list(sub_keys)
+
+    if (
+        isinstance(result, dict)
+        and key in result
+        and all(isinstance(v, str) for v in result.values())
+        and all(k in result for k in (*extra_outputs, *sub_keys))
+    ):
+        # Already a complete string response, output directly
+        return result
+
+    primary = result
+    extras: dict[str, Any] = {}
+    if extra_outputs and isinstance(result, dict):
+        extras = {k: result[k] for k in extra_outputs if k in result}
+        if key in result:
+            primary = result[key]
+        else:
+            primary = {k: v for k, v in result.items() if k not in extras}
+
+    projected = project(primary, projection)
+    if columnar:
+        from python_terraform_bridge.columnar import to_columnar
+
+        projected = to_columnar(projected)
+
+    output: dict[str, str] = {}
+    if plaintext_output:
+        output[key] = (
+            projected
+            if isinstance(projected, str)
+            else json.dumps(projected, default=str)
+        )
+    else:
+        output[key] = _encode_value(projected)
+
+    for extra_key in extra_outputs:
+        output[extra_key] = _encode_value(extras.get(extra_key))
+
+    for sub_key in sub_keys:
+        sub_value = primary.get(sub_key) if isinstance(primary, dict) else None
+        output[sub_key] = _encode_value(sub_value)
+
+    return output
+
+
+def split_composite_inputs(
+    inputs: Mapping[str, Any],
+    members: Iterable[str],
+) -> dict[str, dict[str, Any]]:
+    """Split a composite query into the inputs of each member.
+
+    Composite modules namespace every query entry as ``<member>.<name>``.
+
+    Args:
+        inputs: Raw composite inputs.
+        members: Member method names.
+
+    Returns:
+        Dict mapping each member to its own inputs.
+    """
+    member_inputs: dict[str, dict[str, Any]] = {member: {} for member in members}
+
+    for name, value in inputs.items():
+        member, sep, param = name.partition(".")
+        if sep and member in member_inputs:
+            member_inputs[member][param] = value
+
+    return member_inputs
+
+
+def invoke_composite(
+    call: Callable[[str, dict[str, Any]], Any],
+    member_inputs: Mapping[str, dict[str, Any]],
+) -> dict[str, Any]:
+    """Run the members of a composite concurrently.
+
+    Args:
+        call: Invokes one member with its inputs.
+        member_inputs: Inputs for each member, in member order.
+
+    Returns:
+        Dict mapping each member to its result, in member order.
+
+    Raises:
+        RuntimeError: If any member fails; pending members are cancelled.
+    """
+    results: dict[str, Any] = {}
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        futures = {
+            member: executor.submit(call, member, inputs)
+            for member, inputs in member_inputs.items()
+        }
+
+        for member, future in futures.items():
+            try:
+                results[member] = future.result()
+            except Exception as exc:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise RuntimeError(f"Composite member {member} failed") from exc
+
+    return results
+
+
+async def ainvoke_composite(
+    call: Callable[[str, dict[str, Any]], Awaitable[Any]],
+    member_inputs: Mapping[str, dict[str, Any]],
+) -> dict[str, Any]:
+    """Run the members of a composite concurrently on the running event loop.
+
+    Args:
+        call: Coroutine function invoking one member with its inputs.
+        member_inputs: Inputs for each member, in member order.
+
+    Returns:
+        Dict mapping each member to its result, in member order.
+
+    Raises:
+        RuntimeError: If any member fails; pending members are cancelled.
+    """
+    tasks = {
+        member: asyncio.ensure_future(call(member, inputs))
+        for member, inputs in member_inputs.items()
+    }
+    results: dict[str, Any] = {}
+
+    try:
+        for member, task in tasks.items():
+            try:
+                results[member] = await task
+            except Exception as exc:
+                raise RuntimeError(f"Composite member {member} failed") from exc
+    finally:
+        pending = [task for task in tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    return results
+
+
+_event_loops = threading.local()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return this thread's event loop for running async methods.
+
+    The loop is created on first use and kept, so clients and sessions an
+    async method caches stay bound to a live loop across invocations.
+    """
+    loop: asyncio.AbstractEventLoop | None = getattr(_event_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _event_loops.loop = loop
+
+    return loop
+
+
+def run_sync(awaitable: Awaitable[Any]) -> Any:
+    """Run an awaitable to completion on this thread's event loop.
+
+    Args:
+        awaitable: Coroutine or other awaitable.
+
+    Returns:
+        Its result.
+
+    Raises:
+        RuntimeError: If called while an event loop is running in this
+            thread; await ``ainvoke`` there instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise RuntimeError(
+            "Cannot run an async method from a running event loop; use ainvoke"
+        )
+
+    return get_event_loop().run_until_complete(awaitable)
+
+
+def is_async_method(method: Callable[..., Any]) -> bool:
+    """Whether a method is ``async def``, as a coroutine or async generator."""
+    return inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(method)
+
+
+def call_method(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call a sync or async method from synchronous code.
+
+    Args:
+        method: Method to call.
+        *args: Positional arguments.
+        **kwargs: Keyword arguments.
+
+    Returns:
+        The method result, awaited with ``run_sync`` if it is awaitable.
+    """
+    result = method(*args, **kwargs)
+    if inspect.isawaitable(result):
+        result = run_sync(result)
+
+    return result
+
+
+async def acall_method(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call a sync or async method from a coroutine.
+
+    Coroutine functions are awaited on the running loop. Other callables
+    run in a worker thread so they do not block it; an awaitable they
+    return is awaited as well.
+
+    Args:
+        method: Method to call.
+        *args: Positional arguments.
+        **kwargs: Keyword arguments.
+
+    Returns:
+        The method result.
+    """
+    if inspect.isasyncgenfunction(method):
+        return method(*args, **kwargs)
+
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+
+    result = await asyncio.to_thread(method, *args, **kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+
+    return result
+
+
+async def acall_member(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call a composite member from a coroutine, assembling a streamed result.
+
+    Args:
+        method: Member method to call.
+        *args: Positional arguments.
+        **kwargs: Keyword arguments.
+
+    Returns:
+        The member result.
+    """
+    return await acollect_result(await acall_method(method, *args, **kwargs))
+
+
+def merge_composite_outputs(outputs: Mapping[str, dict[str, str]]) -> dict[str, str]:
+    """Merge the encoded results of composite members into one response.
+
+    Args:
+        outputs: Encoded result of each member.
+
+    Returns:
+        Flat string dictionary for the external data protocol.
+
+    Raises:
+        ValueError: If two members write the same result key.
+    """
+    merged: dict[str, str] = {}
+
+    for member, output in outputs.items():
+        collisions = set(output) & set(merged)
+        if collisions:
+            raise ValueError(
+                f"Composite member {member} reuses result keys: {sorted(collisions)}"
+            )
+        merged.update(output)
+
+    return merged
+
+
+def log_exception(logger: Any, method_name: str, error: Exception) -> str:
+    """Log an exception and return a public-safe error reference.
+
+    Args:
+        logger: Logger to record the full traceback on.
+        method_name: Name of the method that failed.
+        error: The raised exception.
+
+    Returns:
+        Random reference to correlate the public error with the logs.
+    """
+    error_id = secrets.token_hex(8)
+    logger.error(
+        "Method %s failed (error_id=%s): %s",
+        method_name,
+        error_id,
+        error,
+        exc_info=True,
+    )
+    return error_id
+
+
+def is_directed_inputs_class(target_class: type[Any]) -> bool:
+    """Whether a class receives its inputs through directed-inputs-class."""
+    return issubclass(target_class, DirectedInputsClass) or getattr(
+        target_class, "__directed_inputs_enabled__", False
+    )
+
+
+def instantiate_target(
+    target_class: type[Any],
+    *,
+    logging: Logging,
+    from_stdin: bool,
+    to_stdout: bool,
+    resource_type: str,
+) -> Any:
+    """Instantiate either a legacy DirectedInputsClass or decorator-based class.
+
+    Args:
+        target_class: Class to instantiate.
+        logging: Logging configuration handed to the instance.
+        from_stdin: Whether the instance reads inputs from stdin.
+        to_stdout: Whether results are written to stdout.
+        resource_type: data_source or null_resource.
+
+    Returns:
+        Instance of ``target_class``, with spilled inputs read from their
+        files.
+
+    Raises:
+        TypeError: If the class does not use directed inputs.
+        ValueError: If a spilled input file cannot be read.
+    """
+    if issubclass(target_class, DirectedInputsClass):
+        instance = target_class(
+            to_console=not to_stdout,
+            to_file=True,
+            from_stdin=from_stdin,
+            logging=logging,
+        )
+        resolve_file_inputs(instance.inputs)
+        return instance
+
+    if getattr(target_class, "__directed_inputs_enabled__", False):
+        instance = target_class(
+            _directed_inputs_config={"from_stdin": from_stdin},
+            _directed_inputs_runtime_logging=logging,
+            _directed_inputs_runtime_settings={
+                "to_console": not to_stdout,
+                "to_file": True,
+                "resource_type": resource_type,
+            },
+        )
+        resolve_file_inputs(instance.directed_inputs.inputs)
+        return instance
+
+    raise TypeError(
+        f"{target_class.__name__} must inherit from DirectedInputsClass "
+        "or be decorated with @directed_inputs"
+    )
+
+
 def invoke_method_with_kwargs(
     data_source_class: type[Any],
     method_name: str,
@@ -331,14 +1084,16 @@ def lambda_handler_factory(
         null_resource_class=null_resource_class,
     )
 
-    def handler(event: dict[str, Any], context: Any = None) -> dict[str, Any]:
-        logging = Logging(
-            enable_console=True,
-            enable_file=False,
-            logger_name="lambda_handler",
-        )
-        logger = logging.logger
+    # Created once: warm containers reuse the handler, and a Logging per
+    # invocation would keep adding handlers to the same logger
+    logging = Logging(
+        enable_console=True,
+        enable_file=False,
+        logger_name="lambda_handler",
+    )
+    logger = logging.logger
 
+    def handler(event: dict[str, Any], context: Any = None) -> dict[str, Any]:
         logger.info("Lambda invoked", extra={"keys": sorted(event.keys())})
 
         try:
@@ -364,12 +1119,15 @@ def lambda_handler_factory(
                 **kwargs,
             )
 
-            return {
-                "statusCode": 200,
-                "body": json.dumps(result, default=str)
-                if not isinstance(result, str)
-                else result,
-            }
+            if is_result_stream(result):
+                # Encoded page by page, without assembling the result first
+                body = dumps_result_stream(result, logger=logger, label=method_name)
+            elif isinstance(result, str):
+                body = result
+            else:
+                body = json.dumps(result, default=str)
+
+            return {"statusCode": 200, "body": body}
 
         except Exception as e:
             error_id = runtime._handle_exception(method_name or "unknown", e)
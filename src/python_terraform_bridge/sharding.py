@@ -0,0 +1,272 @@
+"""Deterministic sharding of module generation across CI nodes.
+
+Every node builds the resources for all methods (paths and composite
+members need the full set), then renders and writes only the modules of
+its own shard. Modules are assigned by a stable hash of their path relative
+to the output directory, or, given timings from an earlier run, by
+balancing those timings across shards. Either way the assignment depends
+only on the module paths, so every node computes the same split.
+
+Each shard writes ``.terraform-bridge-shard.json`` next to its modules,
+listing what it generated and how long each module took. ``merge_shards``
+combines the shard output directories, checks that the shards are complete
+and that no module path was generated twice, and returns the combined
+timings for weighting the next run.
+
+Example:
+    # On node i of n
+    registry.generate_modules("modules", shard=(i, n))
+
+    # After collecting every node's "modules" directory
+    timings = merge_shards(["shard-0/modules", "shard-1/modules"], "modules")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Union
+
+
+if TYPE_CHECKING:
+    from python_terraform_bridge.module_resources import TerraformModuleResources
+
+
+SHARD_MANIFEST_NAME = ".terraform-bridge-shard.json"
+
+ShardSpec = Union[str, tuple[int, int]]
+
+
+def parse_shard(shard: ShardSpec) -> tuple[int, int]:
+    """Parse a shard given as ``"INDEX/COUNT"`` or ``(index, count)``.
+
+    Indexes start at 0.
+
+    Args:
+        shard: Shard specification.
+
+    Returns:
+        Tuple of (index, count).
+
+    Raises:
+        ValueError: If the specification is malformed or out of range.
+    """
+    if isinstance(shard, str):
+        index_text, _, count_text = shard.partition("/")
+        try:
+            index, count = int(index_text), int(count_text)
+        except ValueError as exc:
+            raise ValueError(
+                f"Invalid shard {shard!r}; expected INDEX/COUNT, e.g. 0/4"
+            ) from exc
+    else:
+        index, count = shard
+
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(
+            f"Invalid shard {index}/{count}; index must be from 0 to count - 1"
+        )
+
+    return index, count
+
+
+def get_shard_key(module_path: str) -> int:
+    """Stable hash of a relative module path (unlike ``hash``, not salted)."""
+    return int(hashlib.sha256(module_path.encode()).hexdigest()[:16], 16)
+
+
+def assign_shards(
+    module_paths: Iterable[str],
+    count: int,
+    weights: Mapping[str, float] | None = None,
+) -> dict[str, int]:
+    """Assign relative module paths to shards.
+
+    Without weights each path goes to ``hash % count``. With weights, paths
+    are placed heaviest first on the least loaded shard; paths missing from
+    the weights count as the average known weight.
+
+    Args:
+        module_paths: Relative module paths.
+        count: Number of shards.
+        weights: Cost of each module path, e.g. seconds from an earlier run.
+
+    Returns:
+        Dict mapping each path to its shard index.
+    """
+    module_paths = sorted(set(module_paths))
+
+    if not weights:
+        return {path: get_shard_key(path) % count for path in module_paths}
+
+    default_weight = sum(weights.values()) / len(weights)
+    loads = [0.0] * count
+    assignment = {}
+
+    for path in sorted(
+        module_paths,
+        key=lambda path: (-weights.get(path, default_weight), get_shard_key(path)),
+    ):
+        shard_index = min(range(count), key=lambda index: (loads[index], index))
+        assignment[path] = shard_index
+        loads[shard_index] += weights.get(path, default_weight)
+
+    return assignment
+
+
+def get_relative_module_path(
+    resources: TerraformModuleResources, output_dir: Path | str
+) -> str:
+    """Module file path relative to the output directory, POSIX style."""
+    return resources.get_module_path().relative_to(output_dir).as_posix()
+
+
+def select_shard(
+    all_resources: Iterable[TerraformModuleResources],
+    output_dir: Path | str,
+    shard: ShardSpec,
+    weights: Mapping[str, float] | None = None,
+) -> list[TerraformModuleResources]:
+    """Return the resources whose modules belong to a shard.
+
+    Args:
+        all_resources: Resources of every method.
+        output_dir: Directory the modules are generated in.
+        shard: Shard as ``"INDEX/COUNT"`` or ``(index, count)``.
+        weights: Cost of each relative module path.
+
+    Returns:
+        Resources of the shard, in their original order.
+    """
+    index, count = parse_shard(shard)
+    resources_by_path = {
+        get_relative_module_path(resources, output_dir): resources
+        for resources in all_resources
+        if not resources.generation_forbidden
+    }
+    assignment = assign_shards(resources_by_path, count, weights)
+
+    return [
+        resources
+        for path, resources in resources_by_path.items()
+        if assignment[path] == index
+    ]
+
+
+def load_timings(timings_path: Path | str) -> dict[str, float]:
+    """Load per-module timings written by ``merge_shards``/``write_timings``."""
+    with Path(timings_path).open() as f:
+        return {path: float(seconds) for path, seconds in json.load(f).items()}
+
+
+def write_timings(timings: Mapping[str, float], timings_path: Path | str) -> None:
+    """Write per-module timings for weighting a later run."""
+    with Path(timings_path).open("w") as f:
+        json.dump(dict(sorted(timings.items())), f, indent=2)
+
+
+def write_shard_manifest(
+    output_dir: Path | str,
+    shard: ShardSpec,
+    timings: Mapping[str, float],
+) -> Path:
+    """Record which modules a shard generated and how long each took.
+
+    Args:
+        output_dir: Directory the shard generated its modules in.
+        shard: Shard as ``"INDEX/COUNT"`` or ``(index, count)``.
+        timings: Seconds spent on each relative module path.
+
+    Returns:
+        Path of the written manifest.
+    """
+    index, count = parse_shard(shard)
+    manifest_path = Path(output_dir, SHARD_MANIFEST_NAME)
+
+    with manifest_path.open("w") as f:
+        json.dump(
+            {"index": index, "count": count, "modules": dict(sorted(timings.items()))},
+            f,
+            indent=2,
+        )
+
+    return manifest_path
+
+
+def merge_shards(
+    shard_dirs: Iterable[Path | str],
+    output_dir: Path | str,
+) -> dict[str, float]:
+    """Combine the output directories of every shard into one.
+
+    Args:
+        shard_dirs: Output directories of the shards, in any order.
+        output_dir: Directory to copy the modules into. It may be one of
+            the shard directories.
+
+    Returns:
+        Combined timings of every module.
+
+    Raises:
+        RuntimeError: If a shard is missing, duplicated or inconsistent, or
+            two shards generated the same module path.
+    """
+    output_dir = Path(output_dir)
+    owners: dict[str, int] = {}
+    timings: dict[str, float] = {}
+    sources: list[tuple[Path, str]] = []
+    seen: dict[int, Path] = {}
+    counts = set()
+
+    for shard_dir in map(Path, shard_dirs):
+        manifest_path = shard_dir.joinpath(SHARD_MANIFEST_NAME)
+        try:
+            with manifest_path.open() as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as exc:
+            raise RuntimeError(f"No shard manifest in {shard_dir}: {exc}") from exc
+
+        index = manifest["index"]
+        counts.add(manifest["count"])
+        if index in seen:
+            raise RuntimeError(
+                f"Shard {index} appears in both {seen[index]} and {shard_dir}"
+            )
+        seen[index] = shard_dir
+
+        for module_path, seconds in manifest["modules"].items():
+            if module_path in owners:
+                raise RuntimeError(
+                    f"Module path {module_path} generated by shards "
+                    f"{owners[module_path]} and {index}"
+                )
+            owners[module_path] = index
+            timings[module_path] = seconds
+            sources.append((shard_dir, module_path))
+
+    if len(counts) > 1:
+        raise RuntimeError(f"Shards were generated with different counts: {counts}")
+
+    count = counts.pop() if counts else 0
+    missing = sorted(set(range(count)) - set(seen))
+    if missing:
+        raise RuntimeError(f"Missing shards {missing} of {count}")
+
+    for shard_dir, module_path in sources:
+        source = shard_dir.joinpath(module_path)
+        target = output_dir.joinpath(module_path)
+        if source.resolve() == target.resolve():
+            continue
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, target)
+
+    manifest_path = output_dir.joinpath(SHARD_MANIFEST_NAME)
+    if manifest_path.exists():
+        manifest_path.unlink()
+
+    return timings
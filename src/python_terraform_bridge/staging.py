@@ -0,0 +1,179 @@
+"""Staged, atomic writing of generated module trees.
+
+Writing ``main.tf.json`` files in place lets a concurrent Terraform run, or
+a crash part-way through, see truncated JSON or a mix of old and new
+modules. ``StagedTree`` writes every file to a temporary sibling of the
+output directory first, flushes the files to disk, and then moves them
+into place:
+
+- If the output directory does not exist yet (or is empty), the staged
+  tree is renamed onto it in a single atomic step.
+- Otherwise each file is moved over its target with ``os.replace``, so
+  every individual module is always either the old or the new version,
+  and files that were not regenerated are left alone.
+
+Example:
+    with StagedTree("terraform-modules") as stage:
+        for resources in all_resources:
+            stage.write_json(resources.get_module_path(), resources.get_mixed())
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import secrets
+import shutil
+
+from pathlib import Path
+from typing import Any
+
+
+class StagedTree:
+    """Collects files for a directory and moves them in when committed.
+
+    Used as a context manager, the stage is committed when the block exits
+    normally and discarded if it raises.
+
+    Attributes:
+        output_dir: Directory the files are destined for.
+        staging_dir: Temporary sibling directory holding the staged files.
+        durable: Flush staged files to disk before moving them in.
+        files: Staged files, relative to the output directory.
+    """
+
+    def __init__(self, output_dir: Path | str, durable: bool = True) -> None:
+        """Initialize the stage.
+
+        Args:
+            output_dir: Directory the files are destined for.
+            durable: Flush staged files to disk before moving them in.
+        """
+        self.output_dir = Path(output_dir)
+        self.durable = durable
+        self.files: set[Path] = set()
+
+        # A sibling, so renames stay on one filesystem. Not mkdtemp: its
+        # 0700 mode would end up on the output directory after a rename.
+        self.output_dir.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            self.staging_dir = self.output_dir.parent.joinpath(
+                f".{self.output_dir.name}.staging-{secrets.token_hex(4)}"
+            )
+            try:
+                self.staging_dir.mkdir()
+                break
+            except FileExistsError:
+                continue
+
+    def __enter__(self) -> StagedTree:
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+    def write_text(self, path: Path | str, content: str) -> Path:
+        """Stage a file.
+
+        Args:
+            path: Final path of the file, inside the output directory.
+            content: File content.
+
+        Returns:
+            The final path.
+        """
+        path = Path(path)
+        relative_path = path.relative_to(self.output_dir)
+
+        staged_path = self.staging_dir.joinpath(relative_path)
+        staged_path.parent.mkdir(parents=True, exist_ok=True)
+        # One buffered write per file; syncing happens in commit()
+        with staged_path.open("w") as f:
+            f.write(content)
+
+        self.files.add(relative_path)
+        return path
+
+    def write_json(self, path: Path | str, data: Any) -> Path:
+        """Stage a JSON file, formatted like ``json.dump(data, f, indent=2)``.
+
+        Args:
+            path: Final path of the file, inside the output directory.
+            data: JSON-serializable data.
+
+        Returns:
+            The final path.
+        """
+        return self.write_text(path, json.dumps(data, indent=2))
+
+    def _directories(self, root: Path) -> set[Path]:
+        """Return ``root`` and every directory under it holding a staged file."""
+        return {
+            root.joinpath(parent)
+            for relative_path in self.files
+            for parent in relative_path.parents
+        } | {root}
+
+    def _sync_files(self) -> None:
+        """Flush the staged files' contents to disk."""
+        for relative_path in self.files:
+            fd = os.open(self.staging_dir.joinpath(relative_path), os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def _sync_directory(self, directory: Path) -> None:
+        """Persist renames in a directory where the platform supports it."""
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def commit(self) -> None:
+        """Move the staged files into the output directory.
+
+        When durable, only the staged files and the directories whose
+        entries change are flushed, not the whole filesystem.
+        """
+        if self.durable:
+            self._sync_files()
+
+        if self.output_dir.is_dir() and not any(self.output_dir.iterdir()):
+            self.output_dir.rmdir()
+
+        if not self.output_dir.exists():
+            if self.durable:
+                # Entries created while staging move in with the tree
+                for directory in self._directories(self.staging_dir):
+                    self._sync_directory(directory)
+
+            os.replace(self.staging_dir, self.output_dir)
+        else:
+            for relative_path in self.files:
+                target = self.output_dir.joinpath(relative_path)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(self.staging_dir.joinpath(relative_path), target)
+
+            if self.durable:
+                for directory in self._directories(self.output_dir):
+                    self._sync_directory(directory)
+
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+        if self.durable:
+            self._sync_directory(self.output_dir.parent)
+
+    def discard(self) -> None:
+        """Delete the staged files without touching the output directory."""
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
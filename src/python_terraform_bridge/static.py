@@ -0,0 +1,654 @@
+"""Static (import-free) discovery of Terraform methods.
+
+This module reads Python source files with :mod:`ast` instead of importing
+them, so modules can be generated without pulling in the target's dependency
+tree (cloud SDKs, credentials, etc.).
+
+Both registration styles are supported:
+1. Docstring annotations on public methods
+2. ``@registry.data_source`` / ``@registry.null_resource`` decorators whose
+   arguments are literals
+
+Example:
+    from python_terraform_bridge.static import load_static_methods
+
+    methods = load_static_methods("mypackage.connectors:MyDataSource")
+    for name, method in methods.items():
+        resources = method.to_module_resources(terraform_modules_dir="modules")
+"""
+
+from __future__ import annotations
+
+import ast
+import copy
+import hashlib
+import inspect
+import re
+import sys
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from python_terraform_bridge.module_resources import TerraformModuleResources
+from python_terraform_bridge.parameter import TerraformModuleParameter
+from python_terraform_bridge.registry import TerraformMethodConfig, TerraformRegistry
+
+
+REGISTRY_DECORATORS = ("data_source", "null_resource", "register")
+
+# Docstring lines the module generator reads (``generator=...``,
+# ``name: x, type: string``, ``# noterraform``), as opposed to prose
+_ANNOTATION_LINE = re.compile(r"^(?:\w+=|\w+:\s*\S|#\s*noterraform\b)", re.IGNORECASE)
+
+# Names resolvable without importing anything, mirroring what
+# TerraformModuleParameter.from_type_hint understands.
+_BUILTIN_TYPE_HINTS: dict[str, Any] = {
+    "str": str,
+    "bool": bool,
+    "int": int,
+    "float": float,
+    "list": list,
+    "dict": dict,
+    "set": set,
+    "frozenset": frozenset,
+    "tuple": tuple,
+    "List": list,
+    "Dict": dict,
+    "Set": set,
+    "Tuple": tuple,
+    "Sequence": Sequence,
+    "Mapping": Mapping,
+    "Any": Any,
+    "None": type(None),
+}
+
+
+class _NotLiteral:
+    """Marker for decorator arguments that cannot be evaluated statically."""
+
+
+_NOT_LITERAL = _NotLiteral()
+
+
+@dataclass
+class StaticMethod:
+    """A method discovered by reading source code.
+
+    Attributes:
+        name: Method name.
+        docstring: Raw docstring, as ``__doc__`` would report it.
+        parameters: Parameters inferred from the signature.
+        decorator: Registry decorator name, if the method is decorated.
+        decorator_options: Literal decorator arguments.
+        unresolved_options: Decorator arguments that were not literals.
+    """
+
+    name: str
+    docstring: str | None = None
+    parameters: list[TerraformModuleParameter] = field(default_factory=list)
+    decorator: str | None = None
+    decorator_options: dict[str, Any] = field(default_factory=dict)
+    unresolved_options: list[str] = field(default_factory=list)
+
+    def to_method_config(self) -> TerraformMethodConfig:
+        """Build the registry configuration the decorator would have created.
+
+        Returns:
+            TerraformMethodConfig without a bound callable.
+        """
+        options = dict(self.decorator_options)
+        module_type = options.pop("module_type", None)
+        if module_type is None:
+            module_type = (
+                "null_resource" if self.decorator == "null_resource" else "data_source"
+            )
+
+        method_name = options.pop("method_name", None) or self.name
+        parameters = options.pop("parameters", None)
+        if parameters is None:
+            parameters = self.parameters
+
+        description = options.pop("description", None)
+        if description is None and self.docstring:
+            description = self.docstring.strip().split("\n")[0]
+
+        try:
+            return TerraformMethodConfig(
+                method=None,
+                method_name=method_name,
+                module_type=module_type,
+                description=description,
+                parameters=parameters,
+                **options,
+            )
+        except TypeError as exc:
+            raise RuntimeError(
+                f"Failed to build registry config for {self.name}: {options}"
+            ) from exc
+
+    def to_module_resources(
+        self,
+        terraform_modules_dir: str | None = None,
+        terraform_modules_class: str | None = None,
+        binary_name: str | None = None,
+        checksum: str | None = None,
+    ) -> TerraformModuleResources:
+        """Convert to TerraformModuleResources.
+
+        Decorated methods go through the same path as
+        ``TerraformRegistry.generate_modules``; everything else is parsed
+        from its docstring like the import-based CLI does.
+
+        Args:
+            terraform_modules_dir: Output directory for modules.
+            terraform_modules_class: Fallback module class prefix.
+            binary_name: Command to invoke the Python runtime.
+            checksum: Default for the module's checksum variable.
+
+        Returns:
+            TerraformModuleResources instance.
+        """
+        if self.decorator is None:
+            return TerraformModuleResources(
+                module_name=self.name,
+                docstring=self.docstring,
+                terraform_modules_dir=terraform_modules_dir,
+                terraform_modules_class=terraform_modules_class,
+                binary_name=binary_name,
+                checksum=checksum,
+            )
+
+        config = self.to_method_config()
+        if config.module_class is None and terraform_modules_class:
+            config.module_class = terraform_modules_class
+
+        return config.to_module_resources(
+            terraform_modules_dir=(
+                terraform_modules_dir or TerraformModuleResources.DEFAULT_MODULES_DIR
+            ),
+            binary_name=binary_name or TerraformModuleResources.DEFAULT_BINARY_NAME,
+            checksum=checksum,
+        )
+
+
+def find_module_source(
+    module_path: str,
+    search_paths: list[str] | None = None,
+) -> Path:
+    """Locate the source file for a module without importing it.
+
+    Unlike ``importlib.util.find_spec``, this never executes parent package
+    ``__init__`` modules.
+
+    Args:
+        module_path: Dotted module path or a path to a ``.py`` file.
+        search_paths: Directories to search (defaults to ``sys.path``).
+
+    Returns:
+        Path to the module's source file.
+
+    Raises:
+        ImportError: If no source file can be found.
+    """
+    if module_path.endswith(".py"):
+        source = Path(module_path)
+        if source.is_file():
+            return source
+        raise ImportError(f"No source file at {module_path}")
+
+    if search_paths is None:
+        search_paths = sys.path
+
+    parts = module_path.split(".")
+    for base in search_paths:
+        base_dir = Path(base or ".")
+        candidate = base_dir.joinpath(*parts[:-1], f"{parts[-1]}.py")
+        if candidate.is_file():
+            return candidate
+
+        candidate = base_dir.joinpath(*parts, "__init__.py")
+        if candidate.is_file():
+            return candidate
+
+    raise ImportError(f"No module source found for {module_path}")
+
+
+def _literal(node: ast.expr) -> Any:
+    """Evaluate a decorator argument, or return the not-literal marker."""
+    if isinstance(node, ast.Call):
+        func_name = _callable_name(node.func)
+        if func_name != "TerraformModuleParameter" or node.args:
+            return _NOT_LITERAL
+
+        kwargs = {}
+        for keyword in node.keywords:
+            value = _literal(keyword.value)
+            if keyword.arg is None or value is _NOT_LITERAL:
+                return _NOT_LITERAL
+            kwargs[keyword.arg] = value
+
+        return TerraformModuleParameter(**kwargs)
+
+    if isinstance(node, (ast.List, ast.Tuple)):
+        values = [_literal(elt) for elt in node.elts]
+        if any(value is _NOT_LITERAL for value in values):
+            return _NOT_LITERAL
+        return values
+
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return _NOT_LITERAL
+
+
+def _callable_name(node: ast.expr) -> str | None:
+    """Return the trailing name of a call target (``a.b.c`` -> ``c``)."""
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return None
+
+
+def _resolve_annotation(node: ast.expr | None) -> Any:
+    """Resolve an annotation to a type hint without importing anything."""
+    if node is None:
+        return str
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        try:
+            node = ast.parse(node.value, mode="eval").body
+        except SyntaxError:
+            return node.value
+
+    if isinstance(node, ast.Constant) and node.value is None:
+        return type(None)
+
+    if isinstance(node, (ast.Name, ast.Attribute)):
+        name = _callable_name(node)
+        if name in _BUILTIN_TYPE_HINTS:
+            return _BUILTIN_TYPE_HINTS[name]
+    elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        return Union[_resolve_annotation(node.left), _resolve_annotation(node.right)]
+    elif isinstance(node, ast.Subscript):
+        name = _callable_name(node.value)
+        elts = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+        args = tuple(
+            Ellipsis
+            if isinstance(elt, ast.Constant) and elt.value is Ellipsis
+            else _resolve_annotation(elt)
+            for elt in elts
+        )
+
+        if name == "Optional":
+            return Optional[args[0]]
+        if name == "Union":
+            return Union[args]
+        if name in _BUILTIN_TYPE_HINTS and name not in ("Any", "None"):
+            origin = _BUILTIN_TYPE_HINTS[name]
+            return origin[args if len(args) > 1 else args[0]]
+
+    # Unknown annotations are kept as source text, which maps to "any"
+    return ast.unparse(node)
+
+
+def _infer_parameters(
+    func: ast.FunctionDef | ast.AsyncFunctionDef,
+) -> list[TerraformModuleParameter]:
+    """Infer Terraform parameters from a function definition node."""
+    args = func.args
+    positional = [*args.posonlyargs, *args.args]
+    defaults: list[ast.expr | None] = [None] * (
+        len(positional) - len(args.defaults)
+    ) + list(args.defaults)
+
+    pairs = [
+        *zip(positional, defaults),
+        *zip(args.kwonlyargs, args.kw_defaults),
+    ]
+
+    parameters = []
+    for arg, default_node in pairs:
+        if arg.arg in ("self", "cls"):
+            continue
+
+        if default_node is None:
+            default: Any = inspect.Parameter.empty
+        else:
+            default = _literal(default_node)
+            if default is _NOT_LITERAL or isinstance(default, TerraformModuleParameter):
+                default = None
+
+        parameters.append(
+            TerraformModuleParameter.from_type_hint(
+                name=arg.arg,
+                type_hint=_resolve_annotation(arg.annotation),
+                default=default,
+            )
+        )
+
+    return parameters
+
+
+def _parse_decorator(
+    func: ast.FunctionDef | ast.AsyncFunctionDef,
+) -> tuple[str | None, dict[str, Any], list[str]]:
+    """Extract literal registry decorator arguments from a method."""
+    for decorator in func.decorator_list:
+        if not isinstance(decorator, ast.Call):
+            continue
+
+        decorator_name = _callable_name(decorator.func)
+        if decorator_name not in REGISTRY_DECORATORS:
+            continue
+
+        signature = inspect.signature(getattr(TerraformRegistry, decorator_name))
+        args = [_literal(arg) for arg in decorator.args]
+        kwargs = {
+            keyword.arg: _literal(keyword.value)
+            for keyword in decorator.keywords
+            if keyword.arg is not None
+        }
+
+        try:
+            bound = signature.bind(None, *args, **kwargs)
+        except TypeError as exc:
+            raise RuntimeError(
+                f"Invalid @{decorator_name} arguments on {func.name}"
+            ) from exc
+
+        options: dict[str, Any] = {}
+        for name, value in bound.arguments.items():
+            if name == "self":
+                continue
+            if name == "kwargs":
+                options.update(value)
+            else:
+                options[name] = value
+
+        unresolved = sorted(k for k, v in options.items() if v is _NOT_LITERAL)
+        options = {k: v for k, v in options.items() if v is not _NOT_LITERAL}
+
+        if decorator_name == "data_source":
+            options["module_type"] = "data_source"
+        elif decorator_name == "null_resource":
+            options["module_type"] = "null_resource"
+
+        return decorator_name, options, unresolved
+
+    return None, {}, []
+
+
+def _is_plain_function(func: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
+    """Whether the method would be a plain function on the class object."""
+    for decorator in func.decorator_list:
+        if _callable_name(decorator) in ("classmethod", "property"):
+            return False
+        if isinstance(decorator, ast.Attribute) and decorator.attr in (
+            "setter",
+            "getter",
+            "deleter",
+        ):
+            return False
+    return True
+
+
+def get_static_methods(
+    source: str,
+    class_name: str,
+) -> dict[str, StaticMethod]:
+    """Discover available methods of a class from its source code.
+
+    Mirrors ``extended_data_types.get_available_methods``: methods whose
+    name contains ``__`` or whose docstring contains ``NOPARSE`` are skipped,
+    and methods inherited from base classes defined in the same source are
+    included.
+
+    Args:
+        source: Python source code.
+        class_name: Name of the class to inspect.
+
+    Returns:
+        Dict mapping method names to StaticMethod, sorted by name.
+
+    Raises:
+        AttributeError: If the class is not defined in the source.
+    """
+    tree = ast.parse(source)
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+
+    if class_name not in classes:
+        raise AttributeError(f"Class {class_name} not found in source")
+
+    def collect(class_node: ast.ClassDef, seen: set[str]) -> dict[str, StaticMethod]:
+        methods: dict[str, StaticMethod] = {}
+
+        # Walk bases in reverse so earlier bases win, as in the MRO
+        for base in reversed(class_node.bases):
+            base_name = _callable_name(base)
+            if base_name in classes and base_name not in seen:
+                methods.update(collect(classes[base_name], seen | {base_name}))
+
+        for node in class_node.body:
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+
+            if not _is_plain_function(node):
+                methods.pop(node.name, None)
+                continue
+
+            decorator, options, unresolved = _parse_decorator(node)
+            methods[node.name] = StaticMethod(
+                name=node.name,
+                docstring=ast.get_docstring(node, clean=False),
+                parameters=_infer_parameters(node),
+                decorator=decorator,
+                decorator_options=options,
+                unresolved_options=unresolved,
+            )
+
+        return methods
+
+    methods = collect(classes[class_name], {class_name})
+
+    return {
+        name: methods[name]
+        for name in sorted(methods)
+        if "__" not in name and "NOPARSE" not in (methods[name].docstring or "")
+    }
+
+
+def load_static_methods(
+    target: str,
+    search_paths: list[str] | None = None,
+) -> dict[str, StaticMethod]:
+    """Discover methods for a ``module:Class`` target without importing it.
+
+    Args:
+        target: Target in ``module.path:ClassName`` or ``file.py:ClassName`` form.
+        search_paths: Directories to search (defaults to ``sys.path``).
+
+    Returns:
+        Dict mapping method names to StaticMethod.
+
+    Raises:
+        ImportError: If the module source cannot be found.
+        AttributeError: If the class is not defined in the module.
+    """
+    module_path, class_name = target.rsplit(":", 1)
+    source_path = find_module_source(module_path, search_paths)
+    source = source_path.read_text(encoding="utf-8")
+
+    return get_static_methods(source, class_name)
+
+
+def _strip_docstring(node: ast.AST) -> ast.AST:
+    """Return a copy of a definition whose docstring keeps only annotations."""
+    if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return node
+
+    docstring = ast.get_docstring(node)
+    if docstring is None:
+        return node
+
+    # The first line is the module description, however it is worded
+    annotations = [
+        line.strip()
+        for line in docstring.splitlines()[1:]
+        if _ANNOTATION_LINE.match(line.strip())
+    ]
+
+    node = copy.copy(node)
+    node.body = node.body[1:]
+    if annotations:
+        node.body.insert(0, ast.Expr(ast.Constant("\n".join(annotations))))
+    return node
+
+
+def _module_definitions(tree: ast.Module) -> dict[str, ast.AST]:
+    """Map module-level names to the statements that define them."""
+    definitions: dict[str, ast.AST] = {}
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            definitions[node.name] = node
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                for name_node in ast.walk(target):
+                    if isinstance(name_node, ast.Name):
+                        definitions[name_node.id] = node
+
+    return definitions
+
+
+def _find_class_member(
+    classes: dict[str, ast.ClassDef],
+    class_name: str,
+    member: str,
+    seen: frozenset[str] = frozenset(),
+) -> tuple[str, ast.AST] | None:
+    """Find a class attribute, following base classes in the same source."""
+    class_node = classes.get(class_name)
+    if class_node is None or class_name in seen:
+        return None
+
+    for node in class_node.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            if node.name == member:
+                return f"{class_name}.{member}", node
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            if any(
+                isinstance(target, ast.Name) and target.id == member
+                for target in targets
+            ):
+                return f"{class_name}.{member}", node
+
+    for base in class_node.bases:
+        base_name = _callable_name(base)
+        if base_name is not None:
+            found = _find_class_member(classes, base_name, member, seen | {class_name})
+            if found is not None:
+                return found
+
+    return None
+
+
+def get_source_checksum(source: str, qualname: str) -> str:
+    """Hash a function's code together with its same-module dependencies.
+
+    Module-level functions, classes and constants the function refers to by
+    name, and methods or attributes it reaches through ``self``/``cls``, are
+    followed transitively. Definitions are hashed as ASTs, so comments and
+    formatting do not alter the hash. Docstring prose is dropped, but
+    annotation lines (``generator=``, ``env=``, parameters) change what the
+    module does and are hashed. Imported names are not followed.
+
+    Args:
+        source: Python source code of the module.
+        qualname: ``function`` or ``Class.method`` to hash.
+
+    Returns:
+        Hex SHA-256 digest.
+
+    Raises:
+        AttributeError: If ``qualname`` is not defined in the source.
+    """
+    tree = ast.parse(source)
+    definitions = _module_definitions(tree)
+    classes = {
+        name: node
+        for name, node in definitions.items()
+        if isinstance(node, ast.ClassDef)
+    }
+
+    class_name, _, func_name = qualname.rpartition(".")
+    if class_name:
+        found = _find_class_member(classes, class_name, func_name)
+    elif func_name in definitions:
+        found = (func_name, definitions[func_name])
+    else:
+        found = None
+
+    if found is None:
+        raise AttributeError(f"{qualname} not found in source")
+
+    collected: dict[str, ast.AST] = {}
+    pending = [found]
+
+    while pending:
+        key, node = pending.pop()
+        if key in collected:
+            continue
+        collected[key] = node
+
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and child.id in definitions:
+                if child.id not in collected:
+                    pending.append((child.id, definitions[child.id]))
+            elif (
+                class_name
+                and isinstance(child, ast.Attribute)
+                and isinstance(child.value, ast.Name)
+                and child.value.id in ("self", "cls")
+            ):
+                member = _find_class_member(classes, class_name, child.attr)
+                if member is not None and member[0] not in collected:
+                    pending.append(member)
+
+    digest = hashlib.sha256()
+    for key in sorted(collected):
+        digest.update(key.encode())
+        digest.update(
+            ast.dump(
+                _strip_docstring(collected[key]), include_attributes=False
+            ).encode()
+        )
+
+    return digest.hexdigest()
+
+
+def get_method_checksum(
+    import_path: str,
+    search_paths: list[str] | None = None,
+) -> str:
+    """Hash a method's source from its ``module:qualname`` without importing it.
+
+    Args:
+        import_path: ``module.path:qualname`` or ``file.py:qualname``.
+        search_paths: Directories to search (defaults to ``sys.path``).
+
+    Returns:
+        Hex SHA-256 digest from ``get_source_checksum``.
+
+    Raises:
+        ImportError: If the module source cannot be found.
+        AttributeError: If the method is not defined in the module.
+    """
+    module_path, qualname = import_path.rsplit(":", 1)
+    source_path = find_module_source(module_path, search_paths)
+
+    return get_source_checksum(source_path.read_text(encoding="utf-8"), qualname)
@@ -0,0 +1,173 @@
+"""Content-addressed storage of generated modules.
+
+Methods with the same parameters and outputs render the same module apart
+from the method name passed to the runtime. ``ModuleStore`` renders each
+method with that name read from a variable
+(``TerraformModuleResources.get_shared_module``), writes every distinct
+module once under ``<output>/_store/<hash>/`` and puts a thin wrapper
+module at the method's usual path. The wrapper declares the same variables
+and outputs and forwards them to the stored module, so callers keep using
+the per-method path unchanged while ``terraform init`` only reads each
+shared module once.
+
+Example:
+    store = ModuleStore("./terraform-modules")
+    for resources in registry.get_all_resources("./terraform-modules"):
+        store.add(resources)
+    store.dedup_ratio  # modules per stored copy
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from python_terraform_bridge.module_resources import TerraformModuleResources
+    from python_terraform_bridge.staging import StagedTree
+
+
+STORE_DIR_NAME = "_store"
+
+# Name of the module block in each wrapper
+WRAPPED_MODULE_NAME = "default"
+
+
+def get_content_hash(module_json: dict[str, Any]) -> str:
+    """Return a short, order-independent hash of a module's content."""
+    content = json.dumps(module_json, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+
+def get_wrapper_module(
+    module_json: dict[str, Any],
+    source: str,
+    method_name: str,
+    method_variable: str = "bridge_method",
+) -> dict[str, Any]:
+    """Generate a module that forwards to a shared module.
+
+    Args:
+        module_json: The shared module, as from ``get_shared_module``.
+        source: Relative path from the wrapper to the shared module.
+        method_name: Runtime method the wrapper invokes.
+        method_variable: Variable of the shared module holding the method.
+
+    Returns:
+        Wrapper module JSON.
+    """
+    variables = {
+        name: variable
+        for name, variable in module_json.get("variable", {}).items()
+        if name != method_variable
+    }
+
+    module_call: dict[str, Any] = {"source": source, method_variable: method_name}
+    module_call.update({name: f"${{var.{name}}}" for name in variables})
+
+    outputs = {}
+    for name, output in module_json.get("output", {}).items():
+        forwarded = {"value": f"${{module.{WRAPPED_MODULE_NAME}.{name}}}"}
+        forwarded.update(
+            {k: v for k, v in output.items() if k in ("description", "sensitive")}
+        )
+        outputs[name] = forwarded
+
+    wrapper: dict[str, Any] = {}
+    if variables:
+        wrapper["variable"] = variables
+    wrapper["module"] = {WRAPPED_MODULE_NAME: module_call}
+    if outputs:
+        wrapper["output"] = outputs
+
+    return wrapper
+
+
+@dataclass
+class ModuleStore:
+    """Writes generated modules once per distinct content.
+
+    Attributes:
+        output_dir: Root directory of the generated modules.
+        method_variable: Variable of the shared modules holding the method.
+        modules: Wrapper path of each added method.
+        stored: Directory of each distinct module, by content hash.
+        stage: Stage to write through instead of writing in place.
+    """
+
+    output_dir: Path | str
+    method_variable: str = "bridge_method"
+    modules: dict[str, Path] = field(default_factory=dict)
+    stored: dict[str, Path] = field(default_factory=dict)
+    stage: StagedTree | None = None
+
+    def __post_init__(self) -> None:
+        self.output_dir = Path(self.output_dir)
+
+    @property
+    def store_dir(self) -> Path:
+        """Directory holding the shared modules."""
+        return Path(self.output_dir, STORE_DIR_NAME)
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Generated modules per stored module (1.0 means no sharing)."""
+        if not self.stored:
+            return 1.0
+
+        return len(self.modules) / len(self.stored)
+
+    def add(self, resources: TerraformModuleResources) -> Path:
+        """Store a method's module and write its wrapper.
+
+        Args:
+            resources: Resources of the method. Their modules directory
+                should be ``output_dir``.
+
+        Returns:
+            Path of the written wrapper module file.
+        """
+        module_json = resources.get_shared_module(self.method_variable)
+        content_hash = get_content_hash(module_json)
+
+        shared_dir = self.stored.get(content_hash)
+        if shared_dir is None:
+            shared_dir = self.store_dir.joinpath(content_hash)
+            shared_path = shared_dir.joinpath("main.tf.json")
+            # Same hash, same content: keep earlier runs' files untouched
+            if not shared_path.exists():
+                self._write(shared_path, module_json)
+            self.stored[content_hash] = shared_dir
+
+        module_path = resources.get_module_path()
+
+        source = Path(os.path.relpath(shared_dir, module_path.parent)).as_posix()
+        if not source.startswith("../"):
+            source = f"./{source}"
+
+        wrapper = get_wrapper_module(
+            module_json,
+            source=source,
+            method_name=str(resources.module_name),
+            method_variable=self.method_variable,
+        )
+        self._write(module_path, wrapper)
+
+        self.modules[resources.module_name] = module_path
+        return module_path
+
+    def _write(self, path: Path, module_json: dict[str, Any]) -> None:
+        """Write a module file, through the stage if there is one."""
+        if self.stage is not None:
+            self.stage.write_json(path, module_json)
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as f:
+            json.dump(module_json, f, indent=2)
@@ -0,0 +1,512 @@
+"""Incremental encoding of streamed method results.
+
+Paginated methods can return a generator (or async generator) instead of
+building their whole result first. Each item is either a ``(key, value)``
+pair or a page: a dict of entries or a list of elements. The runtime
+encodes items as they arrive, so only the current page is held in memory:
+
+- Pairs and dict pages assemble into one JSON object. A key may only
+  appear once in the whole stream.
+- List pages assemble into one JSON array.
+- An empty stream is an empty object.
+
+Entries named like one of the method's extra outputs fill that output
+instead of the primary value, and split sub keys are kept aside to be
+written as their own outputs. Both are emitted after the primary value.
+
+Example:
+    @registry.data_source(key="users")
+    def list_users(domain: str) -> Iterator[tuple[str, dict]]:
+        for page in client.paginate("users", domain=domain):
+            for user in page:
+                yield user["id"], user
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+
+from collections.abc import AsyncIterator, Iterator, Mapping
+from typing import TYPE_CHECKING, Any
+
+from python_terraform_bridge.columnar import ColumnarBuilder, to_columnar
+from python_terraform_bridge.projection import MISSING, project_entry
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Iterable
+    from typing import TextIO
+
+    from python_terraform_bridge.projection import Projection
+
+
+# Pairs logged per progress message; pages are logged one by one
+PAIR_PROGRESS_INTERVAL = 1000
+
+
+def is_result_stream(result: Any) -> bool:
+    """Whether a method result is a stream to be consumed incrementally."""
+    return isinstance(result, (Iterator, AsyncIterator))
+
+
+def iter_stream(result: Iterable[Any] | AsyncIterable[Any]) -> Iterator[Any]:
+    """Iterate a result stream from synchronous code.
+
+    Async iterators are driven on this thread's event loop, the one that
+    ``invoke`` runs async methods on.
+
+    Args:
+        result: Iterable or async iterable of result items.
+
+    Yields:
+        The stream's items.
+    """
+    if not isinstance(result, AsyncIterator):
+        yield from result  # type: ignore[misc]
+        return
+
+    from python_terraform_bridge.runtime import run_sync
+
+    try:
+        while True:
+            try:
+                yield run_sync(result.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        aclose = getattr(result, "aclose", None)
+        if aclose is not None:
+            run_sync(aclose())
+
+
+async def aiter_stream(
+    result: Iterable[Any] | AsyncIterable[Any],
+) -> AsyncIterator[Any]:
+    """Iterate a result stream from a coroutine.
+
+    Sync iterators are advanced in a worker thread so slow pages do not
+    block the event loop.
+
+    Args:
+        result: Iterable or async iterable of result items.
+
+    Yields:
+        The stream's items.
+    """
+    if isinstance(result, AsyncIterator):
+        async for item in result:
+            yield item
+        return
+
+    iterator = iter(result)  # type: ignore[arg-type]
+    done = object()
+    while True:
+        item = await asyncio.to_thread(next, iterator, done)
+        if item is done:
+            return
+        yield item
+
+
+class ResultStreamEncoder:
+    """Encodes the items of a result stream into JSON text, one at a time.
+
+    The concatenated output of ``feed`` and ``finish`` equals
+    ``json.dumps(result, default=str)`` of the assembled result.
+
+    Attributes:
+        extra_outputs: Entry keys to hold as extra outputs.
+        sub_keys: Entry keys to keep aside as split outputs.
+        extras: Values of the extra outputs seen so far.
+        sub_values: Values of the split sub keys seen so far.
+        items: Number of items consumed.
+    """
+
+    def __init__(
+        self,
+        extra_outputs: Iterable[str] = (),
+        sub_keys: Iterable[str] = (),
+        projection: Projection | None = None,
+        logger: Any = None,
+        label: str = "result",
+    ) -> None:
+        """Initialize the encoder.
+
+        Args:
+            extra_outputs: Entry keys to hold as extra outputs.
+            sub_keys: Entry keys to keep aside as split outputs.
+            projection: Projection applied to each entry as it is encoded.
+            logger: Optional logger for progress messages.
+            label: Name of the stream in progress messages.
+        """
+        self.extra_outputs = set(extra_outputs)
+        self.sub_keys = set(sub_keys)
+        self.projection = projection
+        self.extras: dict[str, Any] = {}
+        self.sub_values: dict[str, Any] = {}
+        self.items = 0
+        self._logger = logger
+        self._label = label
+        self._kind: str | None = None
+        # Entries read, and entries written into the primary value
+        self._total = 0
+        self._entries = 0
+        self._seen: set[Any] = set()
+
+    def feed(self, item: Any) -> str:
+        """Encode one item of the stream.
+
+        Args:
+            item: A ``(key, value)`` pair, a dict page or a list page.
+
+        Returns:
+            JSON text for the item's entries.
+
+        Raises:
+            ValueError: If the item is malformed (see ``read``).
+        """
+        chunks = []
+        if self._kind is None:
+            chunks.append("[" if self.is_list(item) else "{")
+
+        for name, value in self.select(item):
+            if name is None:
+                chunk = json.dumps(value, default=str)
+            else:
+                # One-entry dict: same key coercion and spacing as json.dumps
+                chunk = json.dumps({name: value}, default=str)[1:-1]
+
+            chunks.append(chunk if not self._entries else f", {chunk}")
+            self._entries += 1
+
+        return "".join(chunks)
+
+    def select(self, item: Any) -> Iterator[tuple[Any, Any]]:
+        """Return the entries of one item that belong to the primary value.
+
+        Extra outputs and split sub keys are held aside, and the projection
+        is applied.
+
+        Args:
+            item: A ``(key, value)`` pair, a dict page or a list page.
+
+        Yields:
+            ``(key, value)`` pairs; the key is None for list elements.
+
+        Raises:
+            ValueError: If the item is malformed (see ``read``).
+        """
+        # Index of the first element of a list page within the whole stream
+        index = self._total
+        for entry in self.read(item):
+            if self._kind == "list":
+                if self.projection is not None:
+                    entry = project_entry(index, entry, self.projection)
+                    index += 1
+                    if entry is MISSING:
+                        continue
+                yield None, entry
+            else:
+                name, value = entry
+                if name in self.extra_outputs:
+                    self.extras[name] = value
+                    continue
+                if name in self.sub_keys:
+                    self.sub_values[name] = value
+                if self.projection is not None:
+                    value = project_entry(name, value, self.projection)
+                    if value is MISSING:
+                        continue
+                yield name, value
+
+    @staticmethod
+    def is_list(item: Any) -> bool:
+        """Whether an item is a list page, which makes the result an array."""
+        return isinstance(item, list)
+
+    def read(self, item: Any) -> list[Any]:
+        """Validate one item and return its entries.
+
+        Args:
+            item: A ``(key, value)`` pair, a dict page or a list page.
+
+        Returns:
+            Elements of a list page, otherwise ``(key, value)`` pairs.
+
+        Raises:
+            ValueError: If the item has an unsupported type, its kind differs
+                from earlier items, or a key repeats.
+        """
+        if isinstance(item, tuple) and len(item) == 2:
+            kind, entries = "pairs", [item]
+        elif isinstance(item, Mapping):
+            kind, entries = "pages", list(item.items())
+        elif isinstance(item, list):
+            kind, entries = "list", item
+        else:
+            raise ValueError(
+                f"{self._label} stream items must be (key, value) pairs, dicts "
+                f"or lists, not {type(item).__name__}"
+            )
+
+        if self._kind is None:
+            self._kind = "list" if kind == "list" else "object"
+        elif (kind == "list") != (self._kind == "list"):
+            raise ValueError(f"{self._label} stream mixes list pages with entries")
+
+        if kind != "list":
+            for name, _ in entries:
+                if name in self._seen:
+                    raise ValueError(f"{self._label} stream repeats key {name!r}")
+                self._seen.add(name)
+
+        self.items += 1
+        self._log_progress(kind, len(entries))
+        return entries
+
+    def finish(self) -> str:
+        """Return the JSON text closing the stream."""
+        if self._logger is not None:
+            self._logger.info(
+                "Streamed %s: %d items, %d entries",
+                self._label,
+                self.items,
+                self._total,
+            )
+
+        if self._kind is None:
+            return "{}"
+
+        return "]" if self._kind == "list" else "}"
+
+    def _log_progress(self, kind: str, entries: int) -> None:
+        """Log progress for every page, or every thousand pairs."""
+        self._total += entries
+        if self._logger is None:
+            return
+
+        if kind != "pairs" or self.items % PAIR_PROGRESS_INTERVAL == 0:
+            self._logger.debug(
+                "Streaming %s: %d items, %d entries",
+                self._label,
+                self.items,
+                self._total,
+            )
+
+
+class _Base64Encoder:
+    """Base64-encodes text pieces, carrying partial 3-byte groups over."""
+
+    def __init__(self) -> None:
+        self._pending = b""
+
+    def encode(self, text: str) -> str:
+        data = self._pending + text.encode()
+        cut = len(data) - len(data) % 3
+        self._pending = data[cut:]
+        return base64.b64encode(data[:cut]).decode()
+
+    def flush(self) -> str:
+        data, self._pending = self._pending, b""
+        return base64.b64encode(data).decode()
+
+
+class StreamedResponse:
+    """Writes the external data response for a result stream as it arrives.
+
+    The output matches ``print(json.dumps(encode_result(result, ...)))`` for
+    the assembled result, except that an entry named like the primary key
+    stays part of the primary value.
+
+    Columnar values are built column by column as records arrive and
+    written when the stream closes.
+    """
+
+    def __init__(
+        self,
+        out: TextIO,
+        key: str,
+        extra_outputs: Iterable[str] = (),
+        sub_keys: Iterable[str] = (),
+        plaintext_output: bool = False,
+        projection: Projection | None = None,
+        columnar: bool = False,
+        logger: Any = None,
+        label: str = "result",
+    ) -> None:
+        """Start the response.
+
+        Args:
+            out: Text stream to write to.
+            key: Primary output key.
+            extra_outputs: Additional output keys taken from the stream.
+            sub_keys: Keys of the primary value to emit as their own entries.
+            plaintext_output: Write the primary value as a plain string.
+            projection: Projection filtering the primary value entry by entry.
+            columnar: Send the primary value as column arrays.
+            logger: Optional logger for progress messages.
+            label: Name of the stream in progress messages.
+        """
+        self.out = out
+        self.extra_outputs = list(extra_outputs)
+        self.sub_keys = list(sub_keys)
+        self.encoder = ResultStreamEncoder(
+            self.extra_outputs,
+            self.sub_keys,
+            projection=projection,
+            logger=logger,
+            label=label,
+        )
+        self._base64 = None if plaintext_output else _Base64Encoder()
+        self._columns = ColumnarBuilder() if columnar else None
+
+        out.write(f'{{{json.dumps(key)}: "')
+
+    def feed(self, item: Any) -> None:
+        """Encode and write one item of the stream."""
+        if self._columns is None:
+            self._write_primary(self.encoder.feed(item))
+            return
+
+        for name, record in self.encoder.select(item):
+            self._columns.add(record, key=name)
+
+    def close(self) -> None:
+        """Write the end of the primary value and the held outputs."""
+        closing = self.encoder.finish()
+        if self._columns is None:
+            self._write_primary(closing)
+        elif self.encoder.items:
+            self._write_primary(json.dumps(self._columns.get(), default=str))
+        else:
+            # An empty stream is an empty dict
+            self._write_primary(json.dumps(to_columnar({})))
+        if self._base64 is not None:
+            self.out.write(self._base64.flush())
+        self.out.write('"')
+
+        from python_terraform_bridge.runtime import _encode_value
+
+        for extra_key in self.extra_outputs:
+            value = _encode_value(self.encoder.extras.get(extra_key))
+            self.out.write(f', {json.dumps(extra_key)}: "{value}"')
+
+        for sub_key in self.sub_keys:
+            value = _encode_value(self.encoder.sub_values.get(sub_key))
+            self.out.write(f', {json.dumps(sub_key)}: "{value}"')
+
+        self.out.write("}\n")
+
+    def _write_primary(self, text: str) -> None:
+        if self._base64 is not None:
+            self.out.write(self._base64.encode(text))
+        else:
+            # Escaping is per character, so pieces can be escaped separately
+            self.out.write(json.dumps(text)[1:-1])
+
+
+def write_result_stream(
+    result: Iterable[Any] | AsyncIterable[Any],
+    out: TextIO,
+    **kwargs: Any,
+) -> None:
+    """Consume a result stream, writing its external data response.
+
+    Args:
+        result: Iterable or async iterable of result items.
+        out: Text stream to write to.
+        **kwargs: ``StreamedResponse`` options (output plan, logger, label).
+    """
+    response = StreamedResponse(out, **kwargs)
+    for item in iter_stream(result):
+        response.feed(item)
+    response.close()
+
+
+async def awrite_result_stream(
+    result: Iterable[Any] | AsyncIterable[Any],
+    out: TextIO,
+    **kwargs: Any,
+) -> None:
+    """Consume a result stream from a coroutine, writing its response.
+
+    Args:
+        result: Iterable or async iterable of result items.
+        out: Text stream to write to.
+        **kwargs: ``StreamedResponse`` options (output plan, logger, label).
+    """
+    response = StreamedResponse(out, **kwargs)
+    async for item in aiter_stream(result):
+        response.feed(item)
+    response.close()
+
+
+def dumps_result_stream(
+    result: Iterable[Any] | AsyncIterable[Any],
+    **kwargs: Any,
+) -> str:
+    """Encode a result stream as JSON text without assembling the result.
+
+    Args:
+        result: Iterable or async iterable of result items.
+        **kwargs: ``ResultStreamEncoder`` options (logger, label).
+
+    Returns:
+        Same text as ``json.dumps(collect_result(result), default=str)``.
+    """
+    encoder = ResultStreamEncoder(**kwargs)
+    chunks = [encoder.feed(item) for item in iter_stream(result)]
+    chunks.append(encoder.finish())
+    return "".join(chunks)
+
+
+def _assemble(encoder: ResultStreamEncoder, item: Any, result: Any) -> Any:
+    """Add one item's entries to a result being assembled."""
+    entries = encoder.read(item)
+    if result is None:
+        result = [] if encoder.is_list(item) else {}
+
+    if isinstance(result, list):
+        result.extend(entries)
+    else:
+        result.update(entries)
+
+    return result
+
+
+def collect_result(result: Any, **kwargs: Any) -> Any:
+    """Assemble a result stream into the dict or list it represents.
+
+    Args:
+        result: Method result.
+        **kwargs: ``ResultStreamEncoder`` options (logger, label).
+
+    Returns:
+        The assembled result, or ``result`` itself if it is not a stream.
+
+    Raises:
+        ValueError: If the stream is malformed.
+    """
+    if not is_result_stream(result):
+        return result
+
+    encoder = ResultStreamEncoder(**kwargs)
+    assembled = None
+    for item in iter_stream(result):
+        assembled = _assemble(encoder, item, assembled)
+
+    return {} if assembled is None else assembled
+
+
+async def acollect_result(result: Any, **kwargs: Any) -> Any:
+    """Assemble a result stream from a coroutine; see ``collect_result``."""
+    if not is_result_stream(result):
+        return result
+
+    encoder = ResultStreamEncoder(**kwargs)
+    assembled = None
+    async for item in aiter_stream(result):
+        assembled = _assemble(encoder, item, assembled)
+
+    return {} if assembled is None else assembled
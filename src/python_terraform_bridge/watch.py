@@ -0,0 +1,417 @@
+"""Continuous module regeneration for ``terraform-bridge generate --watch``.
+
+``ModuleWatcher`` keeps the statically parsed methods of a target and their
+rendered modules in memory. On every refresh the source is re-read with
+:mod:`ast` (see :mod:`python_terraform_bridge.static`), only methods whose
+docstring, decorator or signature changed are rebuilt, and only module files
+whose content changed are rewritten.
+
+File changes are detected with inotify on Linux, through ``ctypes`` so no
+extra dependency is needed, and by polling modification times elsewhere.
+
+Example:
+    watcher = ModuleWatcher("mypackage.connectors:MyDataSource", "modules")
+    watcher.refresh()
+    with get_file_watcher([watcher.source_path]) as files:
+        while True:
+            if files.wait():
+                watcher.refresh()
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import select
+import struct
+import sys
+import time
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from python_terraform_bridge.module_resources import TerraformModuleResources
+    from python_terraform_bridge.static import StaticMethod
+
+
+# inotify event masks, from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+# Editors save in several steps; collect them into one change
+DEBOUNCE_SECONDS = 0.05
+
+
+class PollingWatcher:
+    """Detects file changes by comparing modification times and sizes."""
+
+    def __init__(self, paths: Iterable[Path | str], interval: float = 0.5) -> None:
+        """Initialize the watcher.
+
+        Args:
+            paths: Files to watch.
+            interval: Seconds between checks.
+        """
+        self.paths = [Path(path) for path in paths]
+        self.interval = interval
+        self._stats = {path: self._stat(path) for path in self.paths}
+
+    @staticmethod
+    def _stat(path: Path) -> tuple[int, int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Block until a watched file changes.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            Changed files, empty if the timeout expired.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            changed = set()
+            for path in self.paths:
+                stat = self._stat(path)
+                if stat != self._stats[path]:
+                    self._stats[path] = stat
+                    changed.add(path)
+
+            if changed:
+                return changed
+
+            if deadline is None:
+                time.sleep(self.interval)
+                continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+
+            time.sleep(min(self.interval, remaining))
+
+    def close(self) -> None:
+        """Release resources (nothing to release when polling)."""
+
+    def __enter__(self) -> PollingWatcher:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class InotifyWatcher:
+    """Detects file changes with Linux inotify.
+
+    The containing directories are watched rather than the files, so
+    changes are still seen when an editor replaces a file by renaming a new
+    one over it.
+    """
+
+    def __init__(self, paths: Iterable[Path | str]) -> None:
+        """Initialize the watcher.
+
+        Args:
+            paths: Files to watch.
+
+        Raises:
+            OSError: If inotify is unavailable.
+        """
+        import ctypes
+        import ctypes.util
+
+        self.paths = {Path(path).resolve() for path in paths}
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        self._directories: dict[int, Path] = {}
+        for directory in {path.parent for path in self.paths}:
+            descriptor = libc.inotify_add_watch(
+                self._fd, os.fsencode(directory), IN_WATCH_MASK
+            )
+            if descriptor < 0:
+                errno = ctypes.get_errno()
+                os.close(self._fd)
+                raise OSError(errno, os.strerror(errno), str(directory))
+            self._directories[descriptor] = directory
+
+    def _read_events(self) -> set[Path]:
+        """Drain pending events and return the watched files they touch."""
+        changed = set()
+
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+
+            offset = 0
+            while offset < len(data):
+                descriptor, _mask, _cookie, length = _INOTIFY_EVENT.unpack_from(
+                    data, offset
+                )
+                offset += _INOTIFY_EVENT.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+
+                directory = self._directories.get(descriptor)
+                if directory is None or not name:
+                    continue
+
+                path = directory.joinpath(os.fsdecode(name))
+                if path in self.paths:
+                    changed.add(path)
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Block until a watched file changes.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            Changed files, empty if the timeout expired.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            remaining = (
+                None if deadline is None else max(deadline - time.monotonic(), 0)
+            )
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if not readable:
+                return set()
+
+            changed = self._read_events()
+            if changed:
+                time.sleep(DEBOUNCE_SECONDS)
+                return changed | self._read_events()
+
+    def close(self) -> None:
+        """Close the inotify descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self) -> InotifyWatcher:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def get_file_watcher(
+    paths: Iterable[Path | str],
+    interval: float = 0.5,
+) -> InotifyWatcher | PollingWatcher:
+    """Return an inotify watcher where available, otherwise a polling one.
+
+    Args:
+        paths: Files to watch.
+        interval: Seconds between checks when polling.
+
+    Returns:
+        File watcher with ``wait()`` and ``close()``.
+    """
+    paths = list(paths)
+
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths)
+        except OSError:
+            pass
+
+    return PollingWatcher(paths, interval=interval)
+
+
+class ModuleWatcher:
+    """Regenerates a target's modules incrementally from its source.
+
+    Attributes:
+        target: ``module.path:ClassName`` or ``file.py:ClassName``.
+        source_path: Source file the target is read from.
+        methods: Methods parsed on the last refresh.
+        resources: Module resources of each method.
+        rendered: Module file path and content last written for each method.
+    """
+
+    def __init__(
+        self,
+        target: str,
+        terraform_modules_dir: str = "terraform-modules",
+        terraform_modules_class: str | None = None,
+        binary_name: str | None = None,
+        source_checksum: bool = False,
+        search_paths: list[str] | None = None,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            target: Target in ``module.path:ClassName`` or ``file.py:ClassName``
+                form.
+            terraform_modules_dir: Output directory for modules.
+            terraform_modules_class: Fallback module class prefix.
+            binary_name: Command to invoke the Python runtime.
+            source_checksum: Default each checksum variable to a hash of the
+                method's source.
+            search_paths: Directories to search (defaults to ``sys.path``).
+
+        Raises:
+            ImportError: If the module source cannot be found.
+        """
+        from python_terraform_bridge.static import find_module_source
+
+        self.target = target
+        self.terraform_modules_dir = terraform_modules_dir
+        self.terraform_modules_class = terraform_modules_class
+        self.binary_name = binary_name
+        self.source_checksum = source_checksum
+
+        module_path, self.class_name = target.rsplit(":", 1)
+        self.source_path = find_module_source(module_path, search_paths)
+
+        self.methods: dict[str, tuple[StaticMethod, str | None]] = {}
+        self.resources: dict[str, TerraformModuleResources] = {}
+        self.rendered: dict[str, tuple[Path, str]] = {}
+
+    def _parse(self) -> dict[str, tuple[StaticMethod, str | None]]:
+        """Read the source and return each method with its checksum."""
+        from python_terraform_bridge.static import (
+            get_source_checksum,
+            get_static_methods,
+        )
+
+        source = self.source_path.read_text(encoding="utf-8")
+        methods = get_static_methods(source, self.class_name)
+
+        return {
+            name: (
+                method,
+                get_source_checksum(source, f"{self.class_name}.{name}")
+                if self.source_checksum
+                else None,
+            )
+            for name, method in methods.items()
+            if not name.startswith("_")
+        }
+
+    def refresh(self) -> list[Path]:
+        """Re-read the source and rewrite the modules that changed.
+
+        Returns:
+            Module files written or removed.
+
+        Raises:
+            SyntaxError: If the source does not parse; nothing is changed.
+            RuntimeError: If a module cannot be generated; nothing is changed.
+        """
+        from python_terraform_bridge.module_resources import TerraformModuleResources
+
+        methods = self._parse()
+
+        resources = {
+            name: self.resources[name]
+            for name in methods
+            if name in self.resources and self.methods.get(name) == methods[name]
+        }
+        for name in methods.keys() - resources.keys():
+            method, checksum = methods[name]
+            resources[name] = method.to_module_resources(
+                terraform_modules_dir=self.terraform_modules_dir,
+                terraform_modules_class=self.terraform_modules_class,
+                binary_name=self.binary_name,
+                checksum=checksum,
+            )
+
+        TerraformModuleResources.link_composites(resources.values())
+
+        # Composites render their members, so re-render them on any change
+        stale = {
+            name
+            for name, module_resources in resources.items()
+            if module_resources is not self.resources.get(name)
+            or module_resources.get_member_names()
+        }
+
+        rendered: dict[str, tuple[Path, str]] = {}
+        for name in stale:
+            module_resources = resources[name]
+            if module_resources.generation_forbidden:
+                continue
+
+            rendered[name] = (
+                module_resources.get_module_path(),
+                json.dumps(module_resources.get_mixed(), indent=2),
+            )
+
+        writes: dict[Path, str] = {}
+        moved: list[Path] = []
+        for name, (module_path, content) in rendered.items():
+            if self.rendered.get(name) == (module_path, content):
+                continue
+
+            previous = self.rendered.get(name)
+            if previous is None:
+                # Skip files already up to date from an earlier run
+                try:
+                    if module_path.read_text() == content:
+                        continue
+                except OSError:
+                    pass
+            elif previous[0] != module_path:
+                moved.append(previous[0])
+
+            writes[module_path] = content
+
+        written = []
+        if writes:
+            from python_terraform_bridge.staging import StagedTree
+
+            # Terraform runs never see a half-written module
+            with StagedTree(self.terraform_modules_dir) as stage:
+                for module_path, content in writes.items():
+                    written.append(stage.write_text(module_path, content))
+
+        written.extend(self._remove(module_path) for module_path in moved)
+
+        for name in stale | (self.rendered.keys() - resources.keys()):
+            if name in self.rendered and name not in rendered:
+                written.append(self._remove(self.rendered.pop(name)[0]))
+
+        self.methods = methods
+        self.resources = resources
+        self.rendered.update(rendered)
+        return written
+
+    @staticmethod
+    def _remove(module_path: Path) -> Path:
+        """Delete a module file written earlier, and its directory if empty."""
+        module_path.unlink(missing_ok=True)
+        try:
+            module_path.parent.rmdir()
+        except OSError:
+            pass
+
+        return module_path
@@ -0,0 +1,16 @@
+"""Shared test configuration."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def log_to_tmp_path(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Write runtime file logs to a temporary directory, not the repo root."""
+    log_dir = tmp_path_factory.mktemp("logs")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("LOG_FILE_NAME", str(log_dir / "terraform_bridge.log"))
+        yield
@@ -0,0 +1,166 @@
+"""Tests for columnar output."""
+
+from __future__ import annotations
+
+import base64
+import io
+import json
+
+from collections.abc import Iterator
+
+import pytest
+
+from python_terraform_bridge.columnar import get_records_expression, to_columnar
+from python_terraform_bridge.module_resources import TerraformModuleResources
+from python_terraform_bridge.projection import parse_projection
+from python_terraform_bridge.registry import TerraformRegistry
+from python_terraform_bridge.runtime import encode_result
+from python_terraform_bridge.streaming import write_result_stream
+
+
+USERS = [
+    {"id": index, "email": f"user{index}@example.com", "admin": index == 0}
+    for index in range(50)
+]
+
+columnar_registry = TerraformRegistry("columnar")
+
+
+@columnar_registry.data_source(key="users", module_class="directory", columnar=True)
+def list_users() -> list:
+    """List users."""
+    return USERS
+
+
+@columnar_registry.data_source(key="users", module_class="directory", columnar=True)
+def iter_users() -> Iterator[tuple[str, dict]]:
+    """List users by email, one by one."""
+    for user in USERS:
+        yield user["email"], user
+
+
+def decode(value: str) -> object:
+    """Undo the runtime's base64 JSON encoding."""
+    return json.loads(base64.b64decode(value))
+
+
+def rebuild(value: dict) -> object:
+    """Rebuild records the way the generated module's locals do."""
+    columns = value["columns"]
+    if "keys" in value:
+        return {
+            key: {name: column[i] for name, column in columns.items()}
+            for i, key in enumerate(value["keys"])
+        }
+    if not columns:
+        return []
+    return [
+        {name: column[i] for name, column in columns.items()}
+        for i in range(len(next(iter(columns.values()))))
+    ]
+
+
+class TestColumnar:
+    """Tests for converting records to columns."""
+
+    def test_list_round_trip(self) -> None:
+        """Test a list of records converts to columns and back."""
+        value = to_columnar(USERS)
+
+        assert list(value) == ["columns"]
+        assert value["columns"]["id"] == list(range(50))
+        assert rebuild(value) == USERS
+        assert len(json.dumps(value)) < len(json.dumps(USERS)) * 0.6
+
+    def test_dict_keeps_keys(self) -> None:
+        """Test a dict of records keeps its keys in order."""
+        value = to_columnar({"b": {"id": 2}, "a": {"id": 1}})
+
+        assert value == {"columns": {"id": [2, 1]}, "keys": ["b", "a"]}
+        assert to_columnar({}) == {"columns": {}, "keys": []}
+        assert to_columnar([]) == {"columns": {}}
+
+    def test_missing_fields_become_null(self) -> None:
+        """Test fields absent from some records are filled with None."""
+        value = to_columnar([{"a": 1}, {"b": 2}, {"a": 3, "b": 4}])
+
+        assert value["columns"] == {"a": [1, None, 3], "b": [None, 2, 4]}
+
+    @pytest.mark.parametrize("result", [[1, 2], {"a": "text"}, "text", 3])
+    def test_rejects_non_records(self, result: object) -> None:
+        """Test results other than lists or dicts of records are rejected."""
+        with pytest.raises(ValueError, match="Columnar output needs"):
+            to_columnar(result)
+
+    def test_encode_result_projects_before_columns(self) -> None:
+        """Test the projection applies to records before columns are built."""
+        output = encode_result(
+            USERS, key="users", columnar=True, projection=parse_projection("*.id")
+        )
+
+        assert decode(output["users"]) == {"columns": {"id": list(range(50))}}
+
+
+class TestColumnarModules:
+    """Tests for columnar generated modules and runtime output."""
+
+    def test_generated_locals_rebuild_records(self) -> None:
+        """Test the module decodes the columns once and rebuilds records."""
+        resources = TerraformModuleResources(
+            module_name="list_users",
+            docstring="List users.\n\ngenerator=key: users, columnar: true\n",
+        )
+
+        module_json = resources.get_external_data()
+
+        assert resources.get_output_plan()["columnar"] is True
+        local_values = module_json["locals"]
+        assert "base64decode" in local_values["results_columns"]
+        assert local_values["results"] == get_records_expression("results_columns")
+        assert "range(" not in local_values["results"]
+        assert module_json["output"]["users"]["value"] == "${local.results}"
+
+    def test_registry_option(self) -> None:
+        """Test the registry option reaches the generated module."""
+        config = columnar_registry.get_method("list_users")
+
+        resources = config.to_module_resources()
+
+        assert resources.generator_parameters["columnar"] is True
+        assert "results_columns" in resources.get_external_data()["locals"]
+
+    def test_rejects_plaintext_output(self) -> None:
+        """Test columnar output cannot be combined with plaintext output."""
+        with pytest.raises(ValueError, match="plaintext_output"):
+            TerraformModuleResources(
+                module_name="list_users",
+                docstring=(
+                    "List users.\n\n"
+                    "generator=key: users, columnar: true, plaintext_output: true\n"
+                ),
+            )
+        with pytest.raises(ValueError, match="plaintext_output"):
+            columnar_registry.data_source(
+                key="users", columnar=True, plaintext_output=True
+            )
+
+    def test_registry_run_outputs_columns(self, capsys: pytest.CaptureFixture) -> None:
+        """Test the external data result carries the columns."""
+        columnar_registry.invoke("list_users", to_stdout=True)
+
+        output = json.loads(capsys.readouterr().out)
+        assert rebuild(decode(output["users"])) == USERS
+
+    def test_stream_matches_encode_result(self) -> None:
+        """Test streamed records are gathered into the same columns."""
+        expected = encode_result(
+            {user["email"]: user for user in USERS}, key="users", columnar=True
+        )
+
+        out = io.StringIO()
+        write_result_stream(iter_users(), out, key="users", columnar=True)
+        assert out.getvalue() == json.dumps(expected) + "\n"
+
+        out = io.StringIO()
+        write_result_stream(iter([]), out, key="users", columnar=True)
+        assert decode(json.loads(out.getvalue())["users"]) == to_columnar({})
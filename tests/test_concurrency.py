@@ -0,0 +1,150 @@
+"""Stress tests for concurrent registration, rendering and invocation.
+
+These run on every build but matter most on free-threaded Python, where
+nothing serializes the threads.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import sys
+import threading
+
+from collections.abc import Callable, Iterator
+
+import pytest
+
+from python_terraform_bridge.inputs import InputDecoder
+from python_terraform_bridge.module_resources import TerraformModuleResources
+from python_terraform_bridge.parameter import TerraformModuleParameter
+from python_terraform_bridge.registry import TerraformRegistry
+
+
+THREADS = 16
+ROUNDS = 50
+
+
+@pytest.fixture(autouse=True)
+def frequent_switches() -> Iterator[None]:
+    """Switch between threads as often as possible on GIL builds."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def hammer(target: Callable[[int], None]) -> None:
+    """Run target(thread index) in THREADS threads at once, re-raising errors."""
+    barrier = threading.Barrier(THREADS)
+    errors: list[BaseException] = []
+
+    def run(index: int) -> None:
+        barrier.wait()
+        try:
+            target(index)
+        except BaseException as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+class TestConcurrency:
+    """Tests that shared state survives many threads."""
+
+    def test_register_while_reading(self) -> None:
+        """Test registering methods while others list, export and render."""
+        registry = TerraformRegistry()
+
+        def work(index: int) -> None:
+            for round_index in range(ROUNDS):
+                name = f"list_items_{index}_{round_index}"
+
+                def method(limit: int = 1) -> dict:
+                    """List items."""
+                    return {"limit": limit}
+
+                registry.register(method_name=name, key=name)(method)
+
+                registry.list_methods()
+                registry.export_manifest()
+                if round_index % 10 == 0:
+                    registry.get_all_resources()
+
+                assert registry.invoke(name, limit="3") == {"limit": 3}
+
+        hammer(work)
+
+        assert len(registry.list_methods()) == THREADS * ROUNDS
+
+    def test_shared_sealed_resources(self) -> None:
+        """Test threads rendering one sealed resources object agree."""
+        resources = TerraformModuleResources(
+            module_name="list_users",
+            docstring=(
+                "List users.\n\ngenerator=key: users, refresh: 1h\n\n"
+                "name: domain, type: string\nname: tags, type: map(any), "
+                "json_encode: true\n"
+            ),
+        ).seal()
+        expected = json.dumps(
+            TerraformModuleResources(
+                module_name="list_users", docstring=resources.docstring
+            ).get_mixed(),
+            sort_keys=True,
+        )
+
+        def work(index: int) -> None:
+            for _ in range(ROUNDS):
+                assert json.dumps(resources.get_mixed(), sort_keys=True) == expected
+                assert resources.get_module_path().name == "main.tf.json"
+
+        hammer(work)
+
+    def test_shared_decoder(self) -> None:
+        """Test one compiled decoder decodes inputs from many threads."""
+        decoder = InputDecoder(
+            [
+                TerraformModuleParameter(
+                    name=f"filters_{i}",
+                    type="map(any)",
+                    json_encode=True,
+                    base64_encode=True,
+                )
+                for i in range(20)
+            ]
+        )
+        raw = {
+            f"filters_{i}": base64.b64encode(json.dumps({"index": i}).encode()).decode()
+            for i in range(20)
+        }
+        expected = {f"filters_{i}": {"index": i} for i in range(20)}
+
+        def work(index: int) -> None:
+            for _ in range(ROUNDS):
+                assert decoder.decode(raw) == expected
+
+        hammer(work)
+
+    def test_interning_from_many_threads(self) -> None:
+        """Test interning the same definition concurrently yields one object."""
+        results: list[object] = []
+
+        def work(index: int) -> None:
+            for _ in range(ROUNDS):
+                results.append(
+                    TerraformModuleParameter(
+                        name="shared_domain", type="string"
+                    ).freeze()
+                )
+
+        hammer(work)
+
+        assert len({id(param) for param in results}) == 1
@@ -0,0 +1,260 @@
+"""Tests for typed input decoding."""
+
+from __future__ import annotations
+
+import base64
+import json
+
+from pathlib import Path
+
+import pytest
+
+from directed_inputs_class import directed_inputs
+
+from python_terraform_bridge import inputs
+from python_terraform_bridge.inputs import (
+    InputDecoder,
+    get_base_type,
+    read_input_file,
+    resolve_file_inputs,
+)
+from python_terraform_bridge.parameter import TerraformModuleParameter
+from python_terraform_bridge.registry import TerraformRegistry
+from python_terraform_bridge.runtime import TerraformRuntime
+
+
+def encode(value: object) -> str:
+    """Encode a value the way base64encode(jsonencode(...)) does."""
+    return base64.b64encode(json.dumps(value).encode()).decode()
+
+
+class TestInputDecoder:
+    """Tests for InputDecoder."""
+
+    def test_get_base_type(self) -> None:
+        """Test outer Terraform type extraction."""
+        assert get_base_type("map(string)") == "map"
+        assert get_base_type("object({a = string})") == "object"
+        assert get_base_type("number") == "number"
+        assert get_base_type(None) == "any"
+
+    def test_scalar_coercion(self) -> None:
+        """Test stringified scalars are converted back to Python types."""
+        decoder = InputDecoder(
+            [
+                TerraformModuleParameter(name="limit", type="number"),
+                TerraformModuleParameter(name="ratio", type="number"),
+                TerraformModuleParameter(name="enabled", type="bool"),
+                TerraformModuleParameter(name="domain", type="string"),
+            ]
+        )
+
+        decoded = decoder.decode(
+            {"limit": "10", "ratio": "0.5", "enabled": "true", "domain": "a.com"}
+        )
+
+        assert dict(decoded) == {
+            "limit": 10,
+            "ratio": 0.5,
+            "enabled": True,
+            "domain": "a.com",
+        }
+
+    def test_encoded_values_decode(self) -> None:
+        """Test base64/JSON payloads are decoded."""
+        decoder = InputDecoder(
+            [
+                TerraformModuleParameter(
+                    name="filters",
+                    type="map(any)",
+                    json_encode=True,
+                    base64_encode=True,
+                )
+            ]
+        )
+
+        decoded = decoder.decode({"filters": encode({"team": "infra"})})
+
+        assert decoded == {"filters": {"team": "infra"}}
+
+    def test_structured_types_parse_json(self) -> None:
+        """Test list/map inputs passed as JSON strings are parsed."""
+        decoder = InputDecoder([TerraformModuleParameter(name="ids", type="list(any)")])
+
+        assert decoder.decode({"ids": '["a", "b"]'})["ids"] == ["a", "b"]
+
+    def test_decoded_values_pass_through(self) -> None:
+        """Test already-decoded values from programmatic callers are kept."""
+        decoder = InputDecoder(
+            [
+                TerraformModuleParameter(
+                    name="filters", type="map(any)", json_encode=True
+                ),
+                TerraformModuleParameter(name="limit", type="number"),
+            ]
+        )
+
+        decoded = decoder.decode({"filters": {"a": 1}, "limit": 5})
+
+        assert dict(decoded) == {"filters": {"a": 1}, "limit": 5}
+
+    def test_missing_and_invalid_inputs_fail_together(self) -> None:
+        """Test validation reports every problem at once."""
+        decoder = InputDecoder(
+            [
+                TerraformModuleParameter(name="org_id"),
+                TerraformModuleParameter(name="limit", type="number"),
+                TerraformModuleParameter(name="enabled", type="bool"),
+            ]
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            decoder.decode({"limit": "ten", "enabled": "maybe"})
+
+        message = str(exc_info.value)
+        assert "org_id" in message
+        assert "limit" in message
+        assert "enabled" in message
+
+    def test_optional_inputs_may_be_absent(self) -> None:
+        """Test absent optional inputs are left to the function default."""
+        decoder = InputDecoder(
+            [TerraformModuleParameter(name="limit", type="number", required=False)]
+        )
+
+        assert dict(decoder.decode({})) == {}
+
+    def test_invalid_payload_fails(self) -> None:
+        """Test a corrupt payload is reported as an invalid input."""
+        decoder = InputDecoder(
+            [
+                TerraformModuleParameter(
+                    name="filters", json_encode=True, base64_encode=True
+                )
+            ]
+        )
+
+        with pytest.raises(ValueError, match="invalid inputs.*filters"):
+            decoder.decode({"filters": "not base64!"})
+
+
+class TestRegistryDecoding:
+    """Tests for decoding in the registry runtime."""
+
+    def test_invoke_decodes_typed_inputs(self) -> None:
+        """Test invoke hands the method Python values, not strings."""
+        registry = TerraformRegistry()
+
+        @registry.data_source(key="users")
+        def list_users(limit: int, filters: dict, active: bool = True) -> dict:
+            """List users."""
+            return {"limit": limit, "filters": filters, "active": active}
+
+        result = registry.invoke(
+            "list_users", limit="3", filters=encode({"team": "infra"}), active="false"
+        )
+
+        assert result == {"limit": 3, "filters": {"team": "infra"}, "active": False}
+
+    def test_invalid_inputs_fail_before_instantiation(self) -> None:
+        """Test bad calls fail before the owner class is built."""
+        registry = TerraformRegistry()
+        instances: list[object] = []
+
+        class Expensive:
+            def __init__(self) -> None:
+                instances.append(self)
+
+            @registry.data_source(key="users")
+            def list_users(self, limit: int) -> dict:
+                """List users."""
+                return {}
+
+        with pytest.raises(ValueError, match="limit"):
+            registry.invoke("list_users", limit="lots")
+
+        assert instances == []
+
+
+@directed_inputs(inputs={})
+class PolicyResource:
+    """Null resource class reading a spilled input."""
+
+    def sync_policies(self, policies: str) -> dict:
+        """Sync policies.
+
+        generator=type: null_resource, spill_inputs: true
+
+        name: policies, required: true, type: any, json_encode: true
+        """
+        return json.loads(policies)
+
+
+class TestFileInputs:
+    """Tests for inputs spilled to files."""
+
+    @pytest.mark.parametrize("threshold", [1, 1024 * 1024])
+    def test_read_input_file(
+        self, threshold: int, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test small files are read and large ones memory-mapped alike."""
+        monkeypatch.setattr(inputs, "MMAP_THRESHOLD", threshold)
+        path = tmp_path / "policies"
+        text = json.dumps({"policy": "ünïcode" * 1000})
+        path.write_text(text, encoding="utf-8")
+        empty = tmp_path / "empty"
+        empty.write_text("")
+
+        assert read_input_file(path) == text
+        assert read_input_file(empty) == ""
+
+    def test_resolve_file_inputs(self, tmp_path: Path) -> None:
+        """Test file inputs are replaced by their content."""
+        path = tmp_path / "policies"
+        path.write_text('{"a": 1}')
+        raw = {"policies__file": str(path), "target__file": str(path), "target": "x"}
+
+        resolve_file_inputs(raw)
+
+        assert raw == {"policies": '{"a": 1}', "target": "x"}
+
+        with pytest.raises(ValueError, match="input file for policies"):
+            resolve_file_inputs({"policies__file": str(tmp_path / "missing")})
+
+    def test_registry_reads_spilled_env_input(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test null resources receive spilled inputs like environment ones."""
+        registry = TerraformRegistry()
+
+        @registry.null_resource(spill_inputs=True)
+        def sync_policies(target: str, policies: dict) -> dict:
+            """Sync policies."""
+            return {"target": target, "policies": policies}
+
+        # Written by Terraform as base64encode(jsonencode(var.policies))
+        path = tmp_path / "policies"
+        path.write_text(encode({"deny": ["*"]}))
+        monkeypatch.setenv("target", "prod")
+        monkeypatch.setenv("policies__file", str(path))
+
+        assert registry.invoke("sync_policies") == {
+            "target": "prod",
+            "policies": {"deny": ["*"]},
+        }
+        resources = registry.get_method("sync_policies").to_module_resources()
+        assert "local_sensitive_file" in resources.get_null_resource()["resource"]
+
+    def test_runtime_reads_spilled_env_input(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test TerraformRuntime resolves spilled inputs on the instance."""
+        path = tmp_path / "policies"
+        path.write_text(json.dumps({"deny": ["*"]}))
+        monkeypatch.setenv("policies__file", str(path))
+        monkeypatch.delenv("policies", raising=False)
+
+        runtime = TerraformRuntime(PolicyResource, null_resource_class=PolicyResource)
+        result = runtime.invoke("sync_policies", from_stdin=False, to_stdout=False)
+
+        assert result == {"deny": ["*"]}
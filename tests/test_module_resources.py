@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
+import json
+import os
+import sys
+
 from pathlib import Path
 
-from python_terraform_bridge.module_resources import TerraformModuleResources
+import pytest
+
+from python_terraform_bridge.module_resources import (
+    PROCESS_EXECUTOR_THRESHOLD,
+    TerraformModuleResources,
+    get_default_executor,
+    get_refresh_trigger,
+    iter_rendered_resources,
+)
 
 
 class TestTerraformModuleResources:
@@ -162,6 +174,50 @@ class TestTerraformModuleResources:
         assert "triggers_replace" in resource
         assert "provisioner" in resource
 
+    def test_null_resource_spills_encoded_inputs(self) -> None:
+        """Test spill_inputs passes encoded inputs through files."""
+        docstring = """Sync policies.
+
+        generator=type: null_resource, spill_inputs: true
+
+        name: target, required: true, type: string
+        name: policies, required: true, type: any, json_encode: true
+        """
+
+        resources = TerraformModuleResources(
+            module_name="sync_policies",
+            docstring=docstring,
+        )
+
+        module_json = resources.get_null_resource()
+
+        policies = (
+            "try(nonsensitive(jsonencode(var.policies)), jsonencode(var.policies))"
+        )
+        assert module_json["resource"]["local_sensitive_file"] == {
+            "policies": {
+                "content": f"${{{policies}}}",
+                "filename": (
+                    "${abspath(path.module)}/.bridge-inputs/"
+                    f"policies-${{sha256({policies})}}"
+                ),
+                "file_permission": "0600",
+            }
+        }
+        resource = module_json["resource"]["terraform_data"]["default"]
+        assert resource["triggers_replace"]["policies"] == (
+            "${local_sensitive_file.policies.filename}"
+        )
+        environment = resource["provisioner"][0]["local-exec"]["environment"]
+        assert environment["target"] == "${self.triggers_replace.target}"
+        assert environment["policies__file"] == "${self.triggers_replace.policies}"
+        assert "policies" not in environment
+        providers = module_json["terraform"]["required_providers"]
+        assert providers["local"]["source"] == "hashicorp/local"
+        # Shared trigger expressions are left untouched
+        assert "${" in resources.get_triggers()["policies"]
+        assert "local_sensitive_file" not in resources.get_triggers()["policies"]
+
     def test_get_mixed_data_source(self) -> None:
         """Test get_mixed for data_source type."""
         docstring = """List items.
@@ -271,6 +327,62 @@ class TestTerraformModuleResources:
         assert "always" in triggers
         assert "timestamp()" in triggers["always"]
 
+    def test_refresh_interval(self) -> None:
+        """Test refresh intervals trigger once per time bucket."""
+        docstring = """Rotate keys.
+
+        generator=key: keys, type: null_resource, refresh: 6h
+        """
+
+        resources = TerraformModuleResources(
+            module_name="rotate_keys",
+            docstring=docstring,
+        )
+
+        module_json = resources.get_null_resource()
+        triggers = module_json["resource"]["terraform_data"]["default"][
+            "triggers_replace"
+        ]
+
+        assert "always" not in triggers
+        assert triggers["refresh"] == (
+            '${formatdate("YYYYMMDD", local.plan_time)}-'
+            '${floor(tonumber(formatdate("h", local.plan_time)) / 6)}'
+        )
+        assert module_json["locals"] == {"plan_time": "${plantimestamp()}"}
+
+    def test_refresh_is_known_at_plan_time(self) -> None:
+        """Test refreshing data sources never read the apply-time timestamp()."""
+        resources = TerraformModuleResources(
+            module_name="list_keys",
+            docstring="List keys.\n\ngenerator=key: keys, refresh: 1h\n",
+        )
+
+        module_json = resources.get_external_data()
+
+        rendered = json.dumps(module_json)
+        assert "timestamp()" not in rendered.replace("plantimestamp()", "")
+        assert rendered.count("plantimestamp()") == 1
+        query = module_json["data"]["external"]["default"]["query"]
+        assert query["refresh"] == '${formatdate("YYYYMMDDhh", local.plan_time)}'
+        assert module_json["locals"]["plan_time"] == "${plantimestamp()}"
+
+    @pytest.mark.parametrize(
+        ("interval", "layout"),
+        [("1m", "YYYYMMDDhhmm"), ("1h", "YYYYMMDDhh"), ("1d", "YYYYMMDD")],
+    )
+    def test_single_unit_refresh(self, interval: str, layout: str) -> None:
+        """Test single-unit intervals format the timestamp at that precision."""
+        assert get_refresh_trigger(interval) == (
+            '${formatdate("' + layout + '", local.plan_time)}'
+        )
+
+    @pytest.mark.parametrize("interval", ["7h", "45m", "2d", "0h", "hourly"])
+    def test_invalid_refresh_interval(self, interval: str) -> None:
+        """Test uneven or malformed intervals are rejected."""
+        with pytest.raises(ValueError, match="refresh interval"):
+            get_refresh_trigger(interval)
+
     def test_extra_outputs(self) -> None:
         """Test extra output definitions."""
         docstring = """Get data with multiple outputs.
@@ -361,6 +473,36 @@ class TestTerraformModuleResources:
         assert resources.module_name == "no_docs"
         assert resources.descriptor is None
 
+    def test_split_sub_key_reads_own_result_entry(self) -> None:
+        """Test split sub keys read the runtime's pre-split entry."""
+        docstring = """Get data.
+
+        generator=key: data
+
+        extra_output=key: count
+        sub_key=key: nested, split: true
+        sub_key=key: inline
+        """
+
+        resources = TerraformModuleResources(
+            module_name="get_data",
+            docstring=docstring,
+        )
+
+        outputs = resources.get_external_data()["output"]
+
+        assert outputs["nested"]["value"] == (
+            '${jsondecode(base64decode(data.external.default.result["nested"]))}'
+        )
+        assert outputs["inline"]["value"] == "${local.results.inline}"
+        assert resources.get_output_plan() == {
+            "key": "data",
+            "extra_outputs": ["count"],
+            "sub_keys": ["nested"],
+            "plaintext_output": False,
+            "columnar": False,
+        }
+
     def test_get_variables(self) -> None:
         """Test variable block generation."""
         docstring = """Get data.
@@ -391,3 +533,255 @@ class TestTerraformModuleResources:
 
         # Check sensitive flag
         assert variables["sensitive_param"]["sensitive"] is True
+
+    def test_foreach_filters(self) -> None:
+        """Test foreach_only and foreach_forbidden parameter filters."""
+        docstring = """Get data.
+
+        generator=key: data
+
+        name: shared, type: string
+        name: iterator, type: string, foreach_only: true
+        name: single, type: string, foreach_forbidden: true
+        """
+
+        resources = TerraformModuleResources(
+            module_name="get_data",
+            docstring=docstring,
+        )
+
+        assert list(resources.get_variables()) == ["shared", "single", "checksum"]
+        assert list(resources.get_triggers(filter_foreach_forbidden=True)) == [
+            "shared",
+            "checksum",
+        ]
+        assert "iterator" in resources.get_variables(filter_foreach_only=False)
+
+    def test_rendered_providers_are_independent(self) -> None:
+        """Test edits to a rendered module do not leak into the resources."""
+        resources = TerraformModuleResources(
+            module_name="get_data",
+            docstring="Get data.\n\ngenerator=key: data",
+        )
+
+        terraform = resources.get_terraform("external", "2.3.1")
+        terraform["required_providers"]["env"]["version"] = "changed"
+
+        assert resources.required_providers["env"]["version"] == ">=0.2.0"
+
+    def test_docstring_parameters_are_parsed_once(self) -> None:
+        """Test each docstring parameter is stored a single time."""
+        docstring = """Get data.
+
+        generator=key: data
+
+        name: first, type: string
+        name: second, type: string, foreach_only: true
+        """
+
+        resources = TerraformModuleResources(
+            module_name="get_data",
+            docstring=docstring,
+        )
+
+        assert [p.name for p in resources.module_parameters] == [
+            "first",
+            "second",
+            "checksum",
+        ]
+
+
+class TestSealedResources:
+    """Tests for sealed, memoized resources."""
+
+    DOCSTRING = """Get data.
+
+    generator=key: data, module_class: svc
+
+    name: domain, type: string
+    name: filters, type: map(any), json_encode: true, required: false
+
+    env=name: API_TOKEN, sensitive: true
+    extra_output=key: count
+    """
+
+    def make(self) -> TerraformModuleResources:
+        return TerraformModuleResources(
+            module_name="get_data",
+            docstring=self.DOCSTRING,
+        )
+
+    def test_sealed_output_matches_unsealed(self) -> None:
+        """Test sealing does not change what is rendered."""
+        sealed = self.make().seal()
+        unsealed = self.make()
+
+        assert sealed.sealed
+        assert not unsealed.sealed
+        assert sealed.get_mixed() == unsealed.get_mixed()
+        assert sealed.get_mixed("null_resource") == unsealed.get_mixed("null_resource")
+        assert sealed.get_module_path() == unsealed.get_module_path()
+        json.dumps(sealed.get_mixed())
+
+    def test_rendering_is_memoized(self) -> None:
+        """Test repeated calls return the cached result."""
+        resources = self.make().seal()
+
+        assert resources.get_mixed() is resources.get_mixed()
+        assert resources.get_variables() is resources.get_variables()
+        assert resources.get_triggers(True) is resources.get_triggers(True)
+        assert resources.get_triggers(True) is not resources.get_triggers()
+        assert resources.get_module_path() is resources.get_module_path()
+
+    def test_unsealed_rendering_tracks_changes(self) -> None:
+        """Test unsealed resources re-render after configuration changes."""
+        resources = self.make()
+        resources.get_mixed()
+
+        resources.extra_outputs["total"] = {}
+
+        assert "total" in resources.get_mixed()["output"]
+
+    def test_sealed_configuration_is_read_only(self) -> None:
+        """Test sealed configuration cannot be changed."""
+        resources = self.make().seal()
+
+        with pytest.raises(TypeError):
+            resources.extra_outputs["total"] = {}
+        with pytest.raises(TypeError):
+            resources.generator_parameters["key"] = "other"
+        with pytest.raises(AttributeError):
+            resources.module_parameters.append(None)
+        with pytest.raises(AttributeError, match="sealed"):
+            resources.module_name = "other"
+
+    def test_seal_is_idempotent(self) -> None:
+        """Test sealing twice keeps the cache."""
+        resources = self.make().seal()
+        rendered = resources.get_mixed()
+
+        assert resources.seal() is resources
+        assert resources.get_mixed() is rendered
+
+
+class TestIterResources:
+    """Tests for streaming resource generation."""
+
+    @staticmethod
+    def docstrings(count: int) -> dict[str, str]:
+        """Docstrings of count simple data sources."""
+        return {
+            f"list_items_{index}": f"List items.\n\ngenerator=key: items_{index}\n"
+            for index in range(count)
+        }
+
+    def test_yields_rendered_modules(self) -> None:
+        """Test every module is yielded with its JSON and timing."""
+        docstrings = self.docstrings(20)
+        docstrings["hidden"] = "Hidden.\n\n# NOTERRAFORM\ngenerator=key: hidden\n"
+
+        streamed = {
+            resources.module_name: (module_json, elapsed)
+            for resources, module_json, elapsed in TerraformModuleResources.iter_resources(
+                docstrings
+            )
+        }
+
+        assert set(streamed) == set(self.docstrings(20))
+        module_json, elapsed = streamed["list_items_3"]
+        assert "items_3" in module_json["output"]
+        assert elapsed > 0
+
+    def test_pending_work_is_bounded(self) -> None:
+        """Test items are only pulled from the input as results are consumed."""
+        consumed = []
+
+        def items():
+            for item in self.docstrings(50).items():
+                consumed.append(item[0])
+                yield item
+
+        stream = iter_rendered_resources(
+            items(),
+            build=lambda item: TerraformModuleResources(
+                module_name=item[0], docstring=item[1]
+            ),
+            build_member=lambda name: None,
+            max_workers=2,
+            max_pending=4,
+        )
+
+        next(stream)
+        assert len(consumed) <= 5
+        stream.close()
+
+    def test_composites_resolve_members(self) -> None:
+        """Test composites are rendered with freshly built members."""
+        docstrings = self.docstrings(2)
+        docstrings["inventory"] = (
+            "Inventory.\n\ngenerator=key: inventory, "
+            "members: list_items_0|list_items_1\n"
+        )
+
+        streamed = {
+            resources.module_name: module_json
+            for resources, module_json, _ in TerraformModuleResources.iter_resources(
+                docstrings
+            )
+        }
+
+        assert {"items_0", "items_1"} <= set(streamed["inventory"]["output"])
+
+    def test_failures_stop_the_stream(self) -> None:
+        """Test an item that fails to build raises RuntimeError."""
+        docstrings = self.docstrings(5)
+        docstrings["inventory"] = "Inventory.\n\ngenerator=key: x, members: missing\n"
+
+        with pytest.raises(RuntimeError, match="Failed to get resources"):
+            list(TerraformModuleResources.iter_resources(docstrings))
+
+
+class TestGetAllResources:
+    """Tests for batch resource generation."""
+
+    DOCSTRINGS = {
+        f"list_items_{index}": f"List items.\n\ngenerator=key: items_{index}\n"
+        for index in range(25)
+    }
+
+    @pytest.mark.parametrize("executor", ["thread", "process", "serial"])
+    def test_results_keep_input_order(self, executor: str) -> None:
+        """Test every executor returns resources in input order."""
+        resources, elapsed = TerraformModuleResources.get_all_resources(
+            self.DOCSTRINGS, executor=executor, max_workers=2, chunksize=3
+        )
+
+        assert [r.module_name for r in resources] == list(self.DOCSTRINGS)
+        assert resources[7].get_mixed()["output"]["items_7"]
+        assert elapsed > 0
+
+    def test_unknown_executor(self) -> None:
+        """Test an unknown executor is rejected."""
+        with pytest.raises(ValueError, match="Unknown executor"):
+            TerraformModuleResources.get_all_resources({}, executor="fibers")
+
+    def test_failures_raise_runtime_error(self) -> None:
+        """Test a module that fails to parse raises RuntimeError."""
+        docstrings = {**self.DOCSTRINGS, "broken": "Broken.\n\ngenerator=key\n"}
+
+        with pytest.raises(RuntimeError, match="Failed to get resources"):
+            TerraformModuleResources.get_all_resources(docstrings, executor="thread")
+
+    def test_default_executor(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test threads are the default without the GIL."""
+        monkeypatch.setattr(os, "cpu_count", lambda: 8)
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: True, raising=False)
+
+        assert get_default_executor(10) == "serial"
+        assert get_default_executor(PROCESS_EXECUTOR_THRESHOLD) == "process"
+
+        monkeypatch.setattr(os, "cpu_count", lambda: 1)
+        assert get_default_executor(PROCESS_EXECUTOR_THRESHOLD) == "serial"
+
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+        assert get_default_executor(10) == "thread"
@@ -2,9 +2,43 @@
 
 from __future__ import annotations
 
+import dataclasses
 import inspect
+import pickle
+import sys
 
-from python_terraform_bridge.parameter import TerraformModuleParameter
+from dataclasses import dataclass, field
+from typing import Any, Literal, Optional, TypedDict, Union
+
+import pytest
+
+from python_terraform_bridge.parameter import (
+    FrozenModuleParameter,
+    TerraformModuleParameter,
+    get_terraform_type,
+)
+
+
+class UserFilter(TypedDict, total=False):
+    """TypedDict with only optional keys."""
+
+    team: str
+    min_age: int
+
+
+class Group(TypedDict):
+    """TypedDict with a nested collection."""
+
+    name: str
+    members: list[str]
+
+
+@dataclass
+class Target:
+    """Dataclass with a defaulted field."""
+
+    region: str
+    tags: dict[str, str] = field(default_factory=dict)
 
 
 class TestTerraformModuleParameter:
@@ -170,3 +204,170 @@ class TestTerraformModuleParameter:
 
         assert param.type == "list(any)"
         assert param.required is False
+
+
+class TestTerraformTypeInference:
+    """Tests for precise Terraform type inference."""
+
+    @pytest.mark.parametrize(
+        ("type_hint", "expected"),
+        [
+            (str, ("string", 0)),
+            (bool, ("bool", 0)),
+            (float, ("number", 0)),
+            (Any, ("any", 0)),
+            (Optional[int], ("number", 0)),
+            (Union[str, None], ("string", 0)),
+            (Union[str, int], ("any", 0)),
+            (Literal["a", "b"], ("string", 0)),
+            (Literal[1, 2], ("number", 0)),
+            (list[str], ("list(string)", 1)),
+            (list[int], ("list(number)", 1)),
+            (set[str], ("set(string)", 1)),
+            (tuple[str, ...], ("list(string)", 1)),
+            (tuple[str, int], ("tuple([string, number])", 1)),
+            (dict[str, int], ("map(number)", 1)),
+            (dict[str, list[str]], ("map(list(string))", 2)),
+            (dict, ("map(any)", -1)),
+            (dict[str, Any], ("map(any)", -1)),
+            (list, ("list(any)", -1)),
+        ],
+    )
+    def test_get_terraform_type(self, type_hint: Any, expected: tuple) -> None:
+        """Test Python hints translate to precise Terraform types."""
+        assert get_terraform_type(type_hint) == expected
+
+    def test_typeddict_object(self) -> None:
+        """Test TypedDicts become objects with optional attributes."""
+        assert get_terraform_type(UserFilter) == (
+            "object({team = optional(string), min_age = optional(number)})",
+            1,
+        )
+        assert get_terraform_type(Group) == (
+            "object({name = string, members = list(string)})",
+            2,
+        )
+
+    def test_dataclass_object(self) -> None:
+        """Test dataclasses become objects; defaulted fields are optional."""
+        assert get_terraform_type(Target) == (
+            "object({region = string, tags = optional(map(string))})",
+            2,
+        )
+
+    def test_flat_collections_skip_base64(self) -> None:
+        """Test flat collections are only JSON encoded."""
+        param = TerraformModuleParameter.from_type_hint(
+            name="tags",
+            type_hint=dict[str, str],
+            default=inspect.Parameter.empty,
+        )
+
+        assert param.type == "map(string)"
+        assert param.json_encode is True
+        assert param.base64_encode is False
+
+    def test_nested_collections_keep_base64(self) -> None:
+        """Test nested collections keep JSON and base64 encoding."""
+        param = TerraformModuleParameter.from_type_hint(
+            name="groups",
+            type_hint=list[Group],
+            default=inspect.Parameter.empty,
+        )
+
+        assert param.json_encode is True
+        assert param.base64_encode is True
+
+    def test_optional_scalar_is_unencoded(self) -> None:
+        """Test Optional scalars keep their type and skip encoding."""
+        param = TerraformModuleParameter.from_type_hint(
+            name="domain",
+            type_hint=Optional[str],
+            default=None,
+        )
+
+        assert param.type == "string"
+        assert param.required is False
+        assert param.json_encode is False
+        assert param.base64_encode is False
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10")
+def test_parameters_are_slotted() -> None:
+    """Test parameters carry no per-instance __dict__."""
+    param = TerraformModuleParameter(name="domain")
+
+    assert not hasattr(param, "__dict__")
+    with pytest.raises(AttributeError):
+        param.unknown = True  # type: ignore[attr-defined]
+
+
+class TestFrozenModuleParameter:
+    """Tests for FrozenModuleParameter."""
+
+    def test_compatible_with_constructor(self) -> None:
+        """Test frozen parameters render like regular ones."""
+        kwargs = {"name": "filters", "default": {"a": 1}, "required": False}
+
+        frozen = FrozenModuleParameter(**kwargs)
+        regular = TerraformModuleParameter(**kwargs)
+
+        assert isinstance(frozen, TerraformModuleParameter)
+        assert frozen.type == "map(any)"
+        assert frozen.get_variable() == regular.get_variable()
+        assert frozen.get_trigger() == regular.get_trigger()
+        assert frozen.get_trigger(True) == regular.get_trigger(True)
+        assert dataclasses.asdict(frozen) == dataclasses.asdict(regular)
+
+    def test_fields_are_read_only(self) -> None:
+        """Test fields cannot be reassigned."""
+        param = FrozenModuleParameter(name="domain")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            param.name = "other"
+
+    def test_rendering_is_cached(self) -> None:
+        """Test variable and trigger blocks are computed once."""
+        param = FrozenModuleParameter(name="domain", json_encode=True)
+
+        assert param.get_variable() is param.get_variable()
+        assert param.get_trigger() is param.get_trigger()
+        assert param.get_trigger(True) != param.get_trigger()
+
+    def test_intern_shares_identical_definitions(self) -> None:
+        """Test identical definitions resolve to one instance."""
+        first = FrozenModuleParameter.intern(name="tags", default=["a"], required=False)
+        second = FrozenModuleParameter.intern("tags", default=["a"], required=False)
+        explicit = FrozenModuleParameter.intern(
+            name="tags", default=["a"], required=False, type="list(any)"
+        )
+
+        assert first is second
+        assert first is explicit
+        assert TerraformModuleParameter(name="tags", default=["a"]).freeze() is not (
+            first
+        )
+
+    def test_intern_keeps_value_types_apart(self) -> None:
+        """Test equal but differently typed defaults are not merged."""
+        flag = FrozenModuleParameter.intern(name="limit", default=True)
+        number = FrozenModuleParameter.intern(name="limit", default=1)
+
+        assert flag is not number
+        assert (flag.type, number.type) == ("bool", "number")
+
+    def test_pickle_reinterns(self) -> None:
+        """Test unpickled parameters resolve to the interned instance."""
+        param = FrozenModuleParameter.intern(name="domain", type="string")
+
+        assert pickle.loads(pickle.dumps(param)) is param
+
+    def test_freeze(self) -> None:
+        """Test regular parameters can be converted to interned ones."""
+        param = TerraformModuleParameter(name="region", default="us-east-1")
+
+        frozen = param.freeze()
+
+        assert isinstance(frozen, FrozenModuleParameter)
+        assert frozen is param.freeze()
+        assert frozen.get_variable() == param.get_variable()
@@ -0,0 +1,242 @@
+"""Tests for result projection."""
+
+from __future__ import annotations
+
+import base64
+import io
+import json
+
+import pytest
+
+from directed_inputs_class import directed_inputs
+
+from python_terraform_bridge.module_resources import TerraformModuleResources
+from python_terraform_bridge.projection import (
+    PROJECTION_VARIABLE,
+    parse_projection,
+    project,
+)
+from python_terraform_bridge.registry import TerraformRegistry
+from python_terraform_bridge.runtime import TerraformRuntime, encode_result
+from python_terraform_bridge.streaming import write_result_stream
+
+
+USERS = {
+    f"u{index}": {
+        "id": index,
+        "email": f"user{index}@example.com",
+        "profile": {"name": f"User {index}", "bio": "x" * 200},
+        "groups": [{"name": "admins", "id": 1}, {"name": "staff", "id": 2}],
+    }
+    for index in range(20)
+}
+
+projection_registry = TerraformRegistry("projection")
+
+
+@projection_registry.data_source(key="users", module_class="directory", projection=True)
+def list_users(domain: str = "") -> dict:
+    """List users."""
+    return USERS
+
+
+@projection_registry.data_source(key="users", module_class="directory", projection=True)
+def iter_users(domain: str = "") -> object:
+    """List users one by one."""
+    yield from USERS.items()
+
+
+@directed_inputs(inputs={"region": "us-east-1"})
+class ZoneDataSource:
+    """Docstring-configured data source."""
+
+    def list_zones(self, region: str) -> dict:
+        """List availability zones.
+
+        generator=key: zones, projection: true
+
+        extra_output=key: zone_count
+        """
+        return {
+            "zones": {"primary": f"{region}a", "secondary": f"{region}b"},
+            "zone_count": 2,
+        }
+
+
+def decode(value: str) -> object:
+    """Undo the runtime's base64 JSON encoding."""
+    return json.loads(base64.b64decode(value))
+
+
+class TestProjection:
+    """Tests for parsing and applying projections."""
+
+    def test_parse_spec_forms(self) -> None:
+        """Test comma-separated and JSON specs parse to the same tree."""
+        expected = {"*": {"email": None, "profile": {"name": None}}}
+
+        assert parse_projection("*.email, *.profile.name") == expected
+        assert parse_projection('["*.email", "*.profile.name"]') == expected
+        assert parse_projection(["*.email", "*.profile.name"]) == expected
+        assert parse_projection("") is None
+        assert parse_projection(None) is None
+
+    def test_shorter_path_keeps_whole_value(self) -> None:
+        """Test a path selecting a whole value wins over deeper paths."""
+        assert parse_projection("a.b,a") == {"a": None}
+        assert parse_projection("a,a.b") == {"a": None}
+
+    @pytest.mark.parametrize("spec", ["a..b", ".a", "[1]", "[not json"])
+    def test_invalid_specs(self, spec: str) -> None:
+        """Test malformed specs raise ValueError."""
+        with pytest.raises(ValueError, match="[Pp]rojection"):
+            parse_projection(spec)
+
+    def test_project_inventory(self) -> None:
+        """Test wildcards select fields of every entry and element."""
+        projected = project(USERS, parse_projection("*.email,*.groups.*.name"))
+
+        assert projected["u3"] == {
+            "email": "user3@example.com",
+            "groups": [{"name": "admins"}, {"name": "staff"}],
+        }
+        assert len(json.dumps(projected)) * 3 < len(json.dumps(USERS))
+
+    def test_project_exact_and_wildcard_merge(self) -> None:
+        """Test an exact key combines with a wildcard at the same level."""
+        projected = project(USERS, parse_projection("*.id,u1.email,u2.groups.0"))
+
+        assert projected["u0"] == {"id": 0}
+        assert projected["u1"] == {"id": 1, "email": "user1@example.com"}
+        assert projected["u2"] == {"id": 2, "groups": [{"name": "admins", "id": 1}]}
+
+    def test_missing_paths_and_scalars(self) -> None:
+        """Test missing paths are skipped and scalars are left alone."""
+        projection = parse_projection("missing,id.deeper,id")
+
+        assert project({"id": 1, "other": 2}, projection) == {"id": 1}
+        assert project("text", projection) == "text"
+        assert project({"id": 1}, None) == {"id": 1}
+
+
+class TestProjectedOutput:
+    """Tests for projection in generated modules and the runtime."""
+
+    def test_encode_result_projects_primary_only(self) -> None:
+        """Test sub keys are split from the full result, extras untouched."""
+        result = {"users": USERS, "count": 20}
+
+        output = encode_result(
+            result,
+            key="users",
+            extra_outputs=["count"],
+            sub_keys=["u1"],
+            projection=parse_projection("*.id"),
+        )
+
+        assert decode(output["users"]) == {
+            name: {"id": u["id"]} for name, u in USERS.items()
+        }
+        assert decode(output["count"]) == 20
+        assert decode(output["u1"]) == USERS["u1"]
+
+    def test_stream_projection_matches_encode_result(self) -> None:
+        """Test streamed results are filtered entry by entry the same way."""
+        projection = parse_projection("*.profile.name,u4")
+
+        out = io.StringIO()
+        write_result_stream(
+            iter(USERS.items()), out, key="users", projection=projection
+        )
+
+        expected = encode_result(USERS, key="users", projection=projection)
+        assert out.getvalue() == json.dumps(expected) + "\n"
+
+        out = io.StringIO()
+        write_result_stream(
+            iter([list(USERS.values())[:3], list(USERS.values())[3:]]),
+            out,
+            key="users",
+            projection=parse_projection("4.id,*.email"),
+        )
+        assert decode(json.loads(out.getvalue())["users"])[4] == {
+            "id": 4,
+            "email": "user4@example.com",
+        }
+
+    def test_generated_module_passes_projection(self) -> None:
+        """Test projecting modules declare and forward bridge_fields."""
+        resources = TerraformModuleResources(
+            module_name="list_users",
+            docstring="List users.\n\ngenerator=key: users, projection: true\n",
+        )
+
+        module_json = resources.get_external_data()
+
+        assert module_json["variable"][PROJECTION_VARIABLE]["default"] == ""
+        query = module_json["data"]["external"]["default"]["query"]
+        assert query[PROJECTION_VARIABLE] == "${var.bridge_fields}"
+
+    def test_projection_is_opt_in(self) -> None:
+        """Test other modules have no bridge_fields and may use the name."""
+        resources = TerraformModuleResources(
+            module_name="list_users",
+            docstring=(
+                "List users.\n\ngenerator=key: users\n\n"
+                "name: bridge_fields, type: string\n"
+            ),
+        )
+
+        module_json = resources.get_external_data()
+
+        assert module_json["variable"][PROJECTION_VARIABLE]["type"] == "string"
+        assert "default" not in module_json["variable"][PROJECTION_VARIABLE]
+        registered = projection_registry.get_method("list_users")
+        assert registered.to_module_resources().has_projection()
+
+    def test_reserved_parameter_name(self) -> None:
+        """Test a parameter named bridge_fields is rejected at generation."""
+        resources = TerraformModuleResources(
+            module_name="list_users",
+            docstring=(
+                "List users.\n\ngenerator=key: users, projection: true\n\n"
+                "name: bridge_fields, type: string\n"
+            ),
+        )
+
+        with pytest.raises(RuntimeError, match="reserved"):
+            resources.get_external_data()
+
+    @pytest.mark.parametrize("method_name", ["list_users", "iter_users"])
+    def test_registry_run_projects_output(
+        self,
+        method_name: str,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,
+    ) -> None:
+        """Test the query's bridge_fields projects the external data result."""
+        query = {"domain": "example.com", PROJECTION_VARIABLE: "*.email"}
+        monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(query)))
+
+        projection_registry.invoke(method_name, from_stdin=True, to_stdout=True)
+
+        output = json.loads(capsys.readouterr().out)
+        assert decode(output["users"]) == {
+            name: {"email": user["email"]} for name, user in USERS.items()
+        }
+
+    def test_runtime_projects_output(self, capsys: pytest.CaptureFixture) -> None:
+        """Test TerraformRuntime applies bridge_fields before encoding."""
+        runtime = TerraformRuntime(ZoneDataSource)
+
+        result = runtime.invoke(
+            "list_zones",
+            from_stdin=False,
+            to_stdout=True,
+            **{PROJECTION_VARIABLE: "primary"},
+        )
+
+        assert result["zones"]["secondary"] == "us-east-1b"
+        output = json.loads(capsys.readouterr().out)
+        assert decode(output["zones"]) == {"primary": "us-east-1a"}
+        assert decode(output["zone_count"]) == 2
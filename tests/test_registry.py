@@ -2,9 +2,129 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import io
+import json
 import tempfile
+import time
 
-from python_terraform_bridge.registry import TerraformMethodConfig, TerraformRegistry
+from pathlib import Path
+
+import pytest
+
+from python_terraform_bridge.cli import main
+from python_terraform_bridge.parameter import TerraformModuleParameter
+from python_terraform_bridge.registry import (
+    MANIFEST_VERSION,
+    TerraformMethodConfig,
+    TerraformRegistry,
+)
+
+
+manifest_registry = TerraformRegistry("manifest")
+
+
+@manifest_registry.data_source(
+    key="accounts",
+    module_class="aws",
+    env_variables={"AWS_PROFILE": {"required": True}},
+    required_providers={"aws": {"source": "hashicorp/aws"}},
+    always_run=True,
+)
+def list_accounts(org_id: str, limit: int = 10) -> dict:
+    """List AWS accounts."""
+    return {"org_id": org_id, "limit": limit}
+
+
+class RegionService:
+    """Plain class with a registered instance method."""
+
+    def __init__(self) -> None:
+        self.regions = ["us-east-1", "eu-west-1"]
+
+    @manifest_registry.data_source(key="regions", module_class="aws")
+    def list_regions(self, prefix: str = "us") -> list:
+        """List AWS regions."""
+        return [region for region in self.regions if region.startswith(prefix)]
+
+
+composite_registry = TerraformRegistry("composite")
+
+
+@composite_registry.data_source(key="users", module_class="directory")
+def list_users(domain: str) -> dict:
+    """List directory users."""
+    return {"alice": {"domain": domain}}
+
+
+class GroupService:
+    """Owner class counting how often it is instantiated."""
+
+    instances = 0
+
+    def __init__(self) -> None:
+        GroupService.instances += 1
+
+    @composite_registry.data_source(
+        key="groups",
+        module_class="directory",
+        extra_outputs={"group_count": {}},
+    )
+    def list_groups(self, domain: str, limit: int = 10) -> dict:
+        """List directory groups."""
+        return {"groups": {"admins": domain}, "group_count": limit}
+
+    @composite_registry.data_source(key="roles", module_class="directory")
+    def list_roles(self) -> list:
+        """List directory roles."""
+        return ["owner"]
+
+
+composite_registry.composite(
+    "directory_inventory",
+    ["list_users", "list_groups", "list_roles"],
+    module_class="directory",
+)
+
+
+async_registry = TerraformRegistry("async")
+
+
+@async_registry.data_source(key="pages", module_class="crawler")
+async def fetch_pages(count: int, delay: float = 0.0) -> dict:
+    """Fetch pages concurrently."""
+
+    async def fetch(index: int) -> int:
+        await asyncio.sleep(delay)
+        return index
+
+    pages = await asyncio.gather(*(fetch(index) for index in range(count)))
+    return {"pages": len(pages), "loop": id(asyncio.get_running_loop())}
+
+
+@async_registry.data_source(key="pages", module_class="crawler")
+def fetch_pages_sync(count: int, delay: float = 0.0) -> dict:
+    """Fetch pages one by one."""
+    return {"pages": count}
+
+
+class CrawlerService:
+    """Owner class mixing async and sync members."""
+
+    @async_registry.data_source(key="links", module_class="crawler")
+    async def list_links(self, url: str) -> list:
+        """List the links of a page."""
+        await asyncio.sleep(0)
+        return [f"{url}/a", f"{url}/b"]
+
+    @async_registry.data_source(key="title", module_class="crawler")
+    def get_title(self, url: str) -> str:
+        """Get the title of a page."""
+        return url.upper()
+
+
+async_registry.composite("crawl", ["list_links", "get_title"], module_class="crawler")
 
 
 class TestTerraformMethodConfig:
@@ -56,6 +176,18 @@ class TestTerraformMethodConfig:
 
         assert config.key == "users"
 
+    def test_resolve_owner_checks_qualname(self) -> None:
+        """Test dotted module paths do not make functions look like methods."""
+        function_config = manifest_registry.get_method("list_accounts")
+        method_config = manifest_registry.get_method("list_regions")
+        assert function_config is not None
+        assert method_config is not None
+
+        assert function_config.import_path == "tests.test_registry:list_accounts"
+        with pytest.raises(RuntimeError, match="not defined on an importable class"):
+            function_config.resolve_owner()
+        assert method_config.resolve_owner() is RegionService
+
 
 class TestTerraformRegistry:
     """Tests for TerraformRegistry."""
@@ -213,6 +345,62 @@ class TestTerraformRegistry:
         assert resources.module_name == "list_users"
         assert resources.generator_parameters["key"] == "users"
 
+    def test_refresh_interval(self) -> None:
+        """Test refresh intervals are passed through to the triggers."""
+        registry = TerraformRegistry()
+
+        @registry.null_resource(refresh="1d")
+        def rotate_keys() -> None:
+            """Rotate keys."""
+
+        resources = registry.get_method("rotate_keys").to_module_resources()
+
+        assert resources.get_triggers()["refresh"] == (
+            '${formatdate("YYYYMMDD", local.plan_time)}'
+        )
+
+        with pytest.raises(ValueError, match="refresh interval"):
+            registry.null_resource(refresh="5h")
+
+    def test_source_checksum_default(self) -> None:
+        """Test source checksums become the checksum variable default."""
+        from python_terraform_bridge.static import get_method_checksum
+
+        resources = {
+            r.module_name: r
+            for r in manifest_registry.get_all_resources(source_checksum=True)
+        }
+
+        variable = resources["list_regions"].get_variables()["checksum"]
+        assert variable["default"] == get_method_checksum(
+            "tests.test_registry:RegionService.list_regions"
+        )
+        assert (
+            resources["list_accounts"].get_variables()["checksum"]["default"]
+            != (variable["default"])
+        )
+
+    def test_generated_module_keeps_precise_types(self) -> None:
+        """Test inferred types, defaults and encodings reach the module."""
+        registry = TerraformRegistry()
+
+        @registry.data_source(key="users")
+        def list_users(tags: dict[str, str], active: bool = True) -> dict:
+            """List users."""
+            return {}
+
+        module_json = (
+            registry.get_method("list_users").to_module_resources().get_mixed()
+        )
+
+        assert module_json["variable"]["tags"] == {"type": "map(string)"}
+        assert module_json["variable"]["active"] == {"type": "bool", "default": True}
+
+        query = module_json["data"]["external"]["default"]["query"]
+        assert query["tags"] == (
+            "${try(nonsensitive(jsonencode(var.tags)), jsonencode(var.tags))}"
+        )
+
     def test_wrapper_preserves_function(self) -> None:
         """Test that decorated function still works."""
         registry = TerraformRegistry()
@@ -265,3 +453,410 @@ class TestTerraformRegistry:
         names = {r.module_name for r in resources}
         assert "list_users" in names
         assert "list_groups" in names
+
+
+class TestRegistryManifest:
+    """Tests for manifest export and import."""
+
+    def test_export_manifest(self) -> None:
+        """Test the manifest records config and import path, not the callable."""
+        manifest = manifest_registry.export_manifest()
+
+        assert manifest["version"] == MANIFEST_VERSION
+        assert manifest["name"] == "manifest"
+
+        entry = manifest["methods"]["list_accounts"]
+        assert "method" not in entry
+        assert entry["import_path"] == "tests.test_registry:list_accounts"
+        assert entry["key"] == "accounts"
+        assert entry["always_run"] is True
+        assert entry["env_variables"] == {"AWS_PROFILE": {"required": True}}
+        assert [p["name"] for p in entry["parameters"]] == ["org_id", "limit"]
+
+        # Must survive a JSON round trip
+        json.dumps(manifest)
+
+    def test_round_trip_generates_identical_modules(self, tmp_path: Path) -> None:
+        """Test a loaded manifest renders the same modules as the original."""
+        manifest_path = tmp_path / "manifest.json"
+        manifest_registry.export_manifest(manifest_path)
+
+        loaded = TerraformRegistry.from_manifest(manifest_path)
+
+        original = manifest_registry.get_all_resources()
+        restored = loaded.get_all_resources()
+
+        assert loaded.list_methods() == manifest_registry.list_methods()
+        assert [r.get_mixed() for r in restored] == [r.get_mixed() for r in original]
+        assert loaded.get_method("list_accounts").method is None
+
+    def test_resolve_method_lazily(self) -> None:
+        """Test callables are imported from the manifest on first use."""
+        loaded = TerraformRegistry.from_manifest(manifest_registry.export_manifest())
+        config = loaded.get_method("list_accounts")
+
+        method = config.resolve_method()
+
+        assert method(org_id="o-1") == {"org_id": "o-1", "limit": 10}
+        assert config.method is method
+
+    def test_local_functions_have_no_import_path(self) -> None:
+        """Test functions defined in a local scope are not importable."""
+        registry = TerraformRegistry()
+
+        @registry.data_source(key="users")
+        def list_users() -> dict:
+            """List users."""
+            return {}
+
+        config = TerraformRegistry.from_manifest(registry.export_manifest()).get_method(
+            "list_users"
+        )
+
+        assert config.import_path is None
+        with pytest.raises(RuntimeError):
+            config.resolve_method()
+
+    def test_explicit_parameters_round_trip(self) -> None:
+        """Test explicit parameter definitions survive serialization."""
+        registry = TerraformRegistry()
+
+        @registry.data_source(
+            key="secret",
+            parameters=[
+                TerraformModuleParameter(
+                    name="token", sensitive=True, description="API token"
+                )
+            ],
+        )
+        def get_secret(token: str) -> dict:
+            """Get a secret."""
+            return {}
+
+        loaded = TerraformRegistry.from_manifest(registry.export_manifest())
+
+        assert loaded.get_method("get_secret").parameters == (
+            registry.get_method("get_secret").parameters
+        )
+
+    def test_unsupported_version(self) -> None:
+        """Test unknown manifest versions are rejected."""
+        with pytest.raises(ValueError):
+            TerraformRegistry.from_manifest({"version": 999, "methods": {}})
+
+    def test_cli_manifest_list_and_generate(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test the CLI can export, list and generate from a manifest."""
+        manifest_path = tmp_path / "manifest.json"
+        output = tmp_path / "modules"
+
+        assert (
+            main(
+                [
+                    "manifest",
+                    "tests.test_registry:manifest_registry",
+                    "-o",
+                    str(manifest_path),
+                ]
+            )
+            == 0
+        )
+        capsys.readouterr()
+
+        assert main(["list", "--manifest", str(manifest_path), "--json"]) == 0
+        assert json.loads(capsys.readouterr().out) == {
+            "list_accounts": "List AWS accounts.",
+            "list_regions": "List AWS regions.",
+        }
+
+        assert (
+            main(["generate", "--manifest", str(manifest_path), "-o", str(output)]) == 0
+        )
+        assert (output / "aws" / "aws-list-accounts" / "main.tf.json").exists()
+
+
+class TestRegistryRuntime:
+    """Tests for registry-native invocation."""
+
+    def test_invoke_function(self) -> None:
+        """Test invoking a module-level function with explicit kwargs."""
+        result = manifest_registry.invoke("list_accounts", org_id="o-1", limit=5)
+
+        assert result == {"org_id": "o-1", "limit": 5}
+
+    def test_invoke_instance_method(self) -> None:
+        """Test methods taking self are called on a new owner instance."""
+        assert manifest_registry.invoke("list_regions", prefix="eu") == ["eu-west-1"]
+
+    def test_invoke_with_explicit_instance(self) -> None:
+        """Test callers can supply the instance to call the method on."""
+        service = RegionService()
+        service.regions = ["us-west-2"]
+
+        result = manifest_registry.invoke("list_regions", instance=service)
+
+        assert result == ["us-west-2"]
+
+    def test_invoke_missing_required_input(self) -> None:
+        """Test missing required inputs fail before the method runs."""
+        with pytest.raises(ValueError, match="org_id"):
+            manifest_registry.invoke("list_accounts")
+
+    def test_invoke_unknown_method(self) -> None:
+        """Test unknown methods raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown method"):
+            manifest_registry.invoke("missing")
+
+    def test_invoke_reads_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test parameters are read from environment variables."""
+        monkeypatch.setenv("org_id", "o-env")
+
+        result = manifest_registry.invoke("list_accounts")
+
+        assert result == {"org_id": "o-env", "limit": 10}
+
+    def test_run_reads_stdin_and_encodes_output(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test run handles the external data protocol end to end."""
+        monkeypatch.setattr("sys.stdin", io.StringIO('{"org_id": "o-2"}'))
+
+        manifest_registry.run(["list", "accounts"])
+
+        output = json.loads(capsys.readouterr().out)
+        decoded = json.loads(base64.b64decode(output["accounts"]))
+        assert decoded == {"org_id": "o-2", "limit": 10}
+
+    def test_run_failure_returns_public_error(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test failures exit non-zero with a sanitized error payload."""
+        monkeypatch.setattr("sys.stdin", io.StringIO("{}"))
+
+        with pytest.raises(SystemExit) as exc_info:
+            manifest_registry.run(["list_accounts"])
+
+        assert exc_info.value.code == 1
+        assert "reference" in json.loads(capsys.readouterr().out)
+
+    def test_cli_run_from_manifest(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,
+    ) -> None:
+        """Test the CLI runs methods resolved lazily from a manifest."""
+        manifest_path = tmp_path / "manifest.json"
+        manifest_registry.export_manifest(manifest_path)
+        monkeypatch.setattr("sys.stdin", io.StringIO('{"prefix": "us"}'))
+
+        assert main(["run", "--manifest", str(manifest_path), "list_regions"]) == 0
+
+        output = json.loads(capsys.readouterr().out)
+        assert json.loads(base64.b64decode(output["regions"])) == ["us-east-1"]
+
+
+class TestRegistryComposite:
+    """Tests for composite data sources."""
+
+    def test_invoke_runs_every_member(self) -> None:
+        """Test members get their namespaced inputs and share an instance."""
+        instances = GroupService.instances
+
+        result = composite_registry.invoke(
+            "directory_inventory",
+            **{"list_users.domain": "a.com", "list_groups.domain": "b.com"},
+        )
+
+        assert result == {
+            "list_users": {"alice": {"domain": "a.com"}},
+            "list_groups": {"groups": {"admins": "b.com"}, "group_count": 10},
+            "list_roles": ["owner"],
+        }
+        assert GroupService.instances == instances + 1
+
+    def test_invalid_member_inputs_fail_before_running(self) -> None:
+        """Test every member is validated before any of them runs."""
+        instances = GroupService.instances
+
+        with pytest.raises(ValueError, match="list_groups"):
+            composite_registry.invoke(
+                "directory_inventory", **{"list_users.domain": "a.com"}
+            )
+
+        assert GroupService.instances == instances
+
+    def test_run_emits_every_member_output(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test one call returns the outputs of all members."""
+        query = {
+            "list_users.domain": "a.com",
+            "list_groups.domain": "b.com",
+            "list_groups.limit": "2",
+        }
+        monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(query)))
+
+        composite_registry.run(["directory_inventory"])
+
+        output = json.loads(capsys.readouterr().out)
+        assert sorted(output) == ["group_count", "groups", "roles", "users"]
+        assert json.loads(base64.b64decode(output["group_count"])) == 2
+        assert json.loads(base64.b64decode(output["roles"])) == ["owner"]
+
+    def test_generated_module(self) -> None:
+        """Test the composite module calls the runtime once for all members."""
+        resources = {
+            r.module_name: r
+            for r in composite_registry.get_all_resources(binary_name="bridge")
+        }
+
+        module = resources["directory_inventory"].get_mixed()
+        external = module["data"]["external"]["default"]
+
+        assert external["program"] == ["bridge", "directory_inventory"]
+        assert external["query"]["list_users.domain"] == (
+            "${try(nonsensitive(var.domain), var.domain)}"
+        )
+        assert "list_groups.limit" in external["query"]
+        assert sorted(module["variable"]) == ["checksum", "domain", "limit"]
+        assert sorted(module["output"]) == ["group_count", "groups", "roles", "users"]
+
+        # Outputs match the members' own modules
+        assert module["output"]["users"] == (
+            resources["list_users"].get_mixed()["output"]["users"]
+            | {"value": "${local.users}"}
+        )
+        assert module["locals"]["users"] == (
+            '${jsondecode(base64decode(data.external.default.result["users"]))}'
+        )
+
+    def test_sealed_generated_module(self) -> None:
+        """Test sealed composites render the same module, once."""
+        unsealed = {
+            r.module_name: r
+            for r in composite_registry.get_all_resources(binary_name="bridge")
+        }
+        sealed = {
+            r.module_name: r.seal()
+            for r in composite_registry.get_all_resources(binary_name="bridge")
+        }
+
+        module = sealed["directory_inventory"].get_mixed()
+
+        assert module == unsealed["directory_inventory"].get_mixed()
+        assert sealed["directory_inventory"].get_mixed() is module
+
+    def test_manifest_round_trip(self) -> None:
+        """Test composites survive manifest serialization."""
+        loaded = TerraformRegistry.from_manifest(composite_registry.export_manifest())
+
+        assert loaded.get_method("directory_inventory").members == [
+            "list_users",
+            "list_groups",
+            "list_roles",
+        ]
+        assert [r.get_mixed() for r in loaded.get_all_resources()] == [
+            r.get_mixed() for r in composite_registry.get_all_resources()
+        ]
+
+    def test_iter_resources_matches_get_all_resources(self) -> None:
+        """Test streamed modules, composites included, match the batch API."""
+        expected = {
+            r.module_name: r.get_mixed() for r in composite_registry.get_all_resources()
+        }
+
+        streamed = {}
+        for resources, module_json, elapsed in composite_registry.iter_resources(
+            max_workers=2
+        ):
+            assert elapsed >= 0
+            streamed[resources.module_name] = module_json
+
+        assert streamed == expected
+
+    def test_members_must_be_data_sources(self) -> None:
+        """Test composites only accept registered data sources."""
+        registry = TerraformRegistry()
+
+        @registry.null_resource()
+        def sync_users() -> None:
+            """Sync users."""
+
+        with pytest.raises(ValueError, match="not found"):
+            registry.composite("inventory", ["list_users"])
+        with pytest.raises(ValueError, match="data source"):
+            registry.composite("inventory", ["sync_users"])
+
+
+class TestRegistryAsync:
+    """Tests for async methods."""
+
+    def test_parameters_inferred_like_sync(self) -> None:
+        """Test async and sync methods infer the same parameters."""
+        async_config = async_registry.get_method("fetch_pages")
+        sync_config = async_registry.get_method("fetch_pages_sync")
+        assert async_config is not None
+        assert sync_config is not None
+
+        assert async_config.is_async()
+        assert not sync_config.is_async()
+        assert async_config.parameters == sync_config.parameters
+
+    def test_invoke_runs_coroutine(self) -> None:
+        """Test invoke returns the awaited result of an async method."""
+        result = async_registry.invoke("fetch_pages", count="3")
+
+        assert result["pages"] == 3
+
+    def test_invoke_reuses_event_loop(self) -> None:
+        """Test repeated invocations on one thread share an event loop."""
+        first = async_registry.invoke("fetch_pages", count=1)
+        second = async_registry.invoke("fetch_pages", count=1)
+
+        assert first["loop"] == second["loop"]
+
+    def test_invoke_fans_out_concurrently(self) -> None:
+        """Test hundreds of awaits inside one invocation overlap."""
+        tic = time.perf_counter()
+        result = async_registry.invoke("fetch_pages", count=300, delay=0.05)
+
+        assert result["pages"] == 300
+        assert time.perf_counter() - tic < 2
+
+    def test_ainvoke(self) -> None:
+        """Test ainvoke awaits async methods and runs sync ones too."""
+
+        async def main() -> tuple[dict, dict]:
+            return await asyncio.gather(
+                async_registry.ainvoke("fetch_pages", count=2),
+                async_registry.ainvoke("fetch_pages_sync", count=2),
+            )
+
+        async_result, sync_result = asyncio.run(main())
+
+        assert async_result["pages"] == 2
+        assert sync_result == {"pages": 2}
+
+    def test_invoke_inside_running_loop_fails(self) -> None:
+        """Test invoke points at ainvoke when a loop is already running."""
+
+        async def main() -> None:
+            async_registry.invoke("fetch_pages", count=1)
+
+        with pytest.raises(RuntimeError, match="ainvoke"):
+            asyncio.run(main())
+
+    def test_composite_mixes_async_and_sync_members(
+        self, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test composites run async and sync members together."""
+        inputs = {"list_links.url": "x.io", "get_title.url": "x.io"}
+        expected = {"list_links": ["x.io/a", "x.io/b"], "get_title": "X.IO"}
+
+        assert async_registry.invoke("crawl", to_stdout=True, **inputs) == expected
+        assert asyncio.run(async_registry.ainvoke("crawl", **inputs)) == expected
+
+        output = json.loads(capsys.readouterr().out)
+        assert sorted(output) == ["links", "title"]
@@ -0,0 +1,272 @@
+"""Tests for out-of-band result files."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import stat
+import time
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from directed_inputs_class import directed_inputs
+
+from python_terraform_bridge.module_resources import TerraformModuleResources
+from python_terraform_bridge.registry import TerraformRegistry
+from python_terraform_bridge.result_files import (
+    HASH_KEY,
+    PATH_KEY,
+    RESULT_DIR_ENV,
+    ResultFile,
+    get_result_dir,
+    get_result_mode,
+    open_result_output,
+    remove_stale_result_files,
+)
+from python_terraform_bridge.runtime import TerraformRuntime, encode_result
+
+
+INVENTORY = {
+    f"host{index}": {"id": index, "ip": f"10.0.0.{index}"} for index in range(30)
+}
+
+file_registry = TerraformRegistry("result_files")
+
+
+@file_registry.data_source(
+    key="hosts",
+    module_class="inventory",
+    extra_outputs={"count": {}},
+    result_mode="file",
+)
+def list_hosts() -> dict:
+    """List hosts."""
+    return {"hosts": INVENTORY, "count": len(INVENTORY)}
+
+
+@file_registry.data_source(key="hosts", module_class="inventory", result_mode="file")
+def iter_hosts() -> Iterator[tuple[str, dict]]:
+    """List hosts one by one."""
+    yield from INVENTORY.items()
+
+
+@directed_inputs(inputs={})
+class InventoryDataSource:
+    """Docstring-configured data source."""
+
+    def list_hosts(self) -> dict:
+        """List hosts.
+
+        generator=key: hosts, result_mode: file
+        """
+        return INVENTORY
+
+
+@pytest.fixture
+def result_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Write result files to a temporary directory."""
+    directory = tmp_path / "results"
+    monkeypatch.setenv(RESULT_DIR_ENV, str(directory))
+    return directory
+
+
+def read_pointer(out: str) -> tuple[dict[str, str], str]:
+    """Parse the runtime's stdout and return the pointer and file content."""
+    pointer = json.loads(out)
+    assert set(pointer) == {PATH_KEY, HASH_KEY}
+    return pointer, Path(pointer[PATH_KEY]).read_text()
+
+
+class TestResultFile:
+    """Tests for writing and collecting result files."""
+
+    def test_content_addressed(self, tmp_path: Path) -> None:
+        """Test identical results share one private file named by its hash."""
+        pointers = []
+        for _ in range(2):
+            result_file = ResultFile(tmp_path)
+            result_file.write('{"hosts": ')
+            result_file.write('"aGk="}\n')
+            pointers.append(result_file.close())
+
+        content = b'{"hosts": "aGk="}\n'
+        digest = hashlib.sha256(content).hexdigest()
+        assert pointers[0] == pointers[1]
+        assert pointers[0] == {
+            PATH_KEY: str(tmp_path.resolve() / f"{digest}.json"),
+            HASH_KEY: digest,
+        }
+        assert os.listdir(tmp_path) == [f"{digest}.json"]
+        assert Path(pointers[0][PATH_KEY]).read_bytes() == content
+        mode = stat.S_IMODE(os.stat(pointers[0][PATH_KEY]).st_mode)
+        assert mode == 0o600
+
+    def test_removes_stale_files(self, tmp_path: Path) -> None:
+        """Test files older than the max age are removed, others are kept."""
+        stale = tmp_path / "stale.json"
+        partial = tmp_path / ".crashed.partial"
+        fresh = tmp_path / "fresh.json"
+        unrelated = tmp_path / "notes.txt"
+        for path in (stale, partial, fresh, unrelated):
+            path.write_text("{}")
+        old = time.time() - 7200
+        for path in (stale, partial, unrelated):
+            os.utime(path, (old, old))
+
+        assert remove_stale_result_files(tmp_path, max_age=3600) == 2
+        assert sorted(os.listdir(tmp_path)) == ["fresh.json", "notes.txt"]
+
+    def test_rewriting_refreshes_age(self, tmp_path: Path) -> None:
+        """Test writing a result again keeps its file from being collected."""
+        result_file = ResultFile(tmp_path, max_age=3600)
+        result_file.write("{}")
+        path = result_file.close()[PATH_KEY]
+        old = time.time() - 7200
+        os.utime(path, (old, old))
+
+        result_file = ResultFile(tmp_path, max_age=3600)
+        result_file.write("{}")
+        assert result_file.close()[PATH_KEY] == path
+        assert os.path.exists(path)
+
+    def test_failed_write_leaves_nothing(
+        self, result_dir: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test an error while writing removes the partial file."""
+        with pytest.raises(RuntimeError), open_result_output("file") as out:
+            out.write("{")
+            raise RuntimeError("lost connection")
+
+        assert os.listdir(result_dir) == []
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership")
+    def test_default_dir_is_per_user(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test users sharing a temporary directory get separate result dirs."""
+        monkeypatch.delenv(RESULT_DIR_ENV, raising=False)
+
+        assert get_result_dir().name == f"terraform-bridge-results-{os.getuid()}"
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership")
+    def test_refuses_unsafe_directories(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test shared, foreign or symlinked directories are never written to."""
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        shared.chmod(0o777)
+        with pytest.raises(RuntimeError, match="expected 0700"):
+            ResultFile(shared)
+
+        link = tmp_path / "link"
+        link.symlink_to(tmp_path / "private")
+        (tmp_path / "private").mkdir(mode=0o700)
+        with pytest.raises(RuntimeError, match="symlink"):
+            ResultFile(link)
+
+        uid = os.getuid()
+        monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+        with pytest.raises(RuntimeError, match="owned by uid"):
+            ResultFile(tmp_path / "private")
+
+        assert os.listdir(shared) == []
+        assert os.listdir(tmp_path / "private") == []
+
+    def test_invalid_mode(self) -> None:
+        """Test unsupported modes are rejected, at registration too."""
+        assert get_result_mode(None) == "inline"
+        with pytest.raises(ValueError, match="Invalid result mode 'disk'"):
+            get_result_mode("disk")
+        with pytest.raises(ValueError, match="Invalid result mode"):
+            file_registry.data_source(key="hosts", result_mode="s3")
+
+
+class TestFileResultModules:
+    """Tests for result_mode: file modules and runtime output."""
+
+    def test_generated_module_reads_file(self) -> None:
+        """Test every output is read from the decoded result file."""
+        resources = file_registry.get_method("list_hosts").to_module_resources()
+
+        module_json = resources.get_external_data()
+
+        local_values = module_json["locals"]
+        assert local_values["result_file"] == (
+            '${jsondecode(file(data.external.default.result["result_path"]))}'
+        )
+        assert local_values["results"] == (
+            '${jsondecode(base64decode(local.result_file["hosts"]))}'
+        )
+        assert local_values["count"] == (
+            '${jsondecode(base64decode(local.result_file["count"]))}'
+        )
+        assert "local_file" not in module_json["data"]
+        external = module_json["data"]["external"]["default"]
+        assert external["lifecycle"]["postcondition"][0]["condition"] == (
+            '${filesha256(self.result["result_path"]) == self.result["result_sha256"]}'
+        )
+
+    def test_split_sub_keys_read_file(self) -> None:
+        """Test pre-split sub keys come from the result file too."""
+        resources = TerraformModuleResources(
+            module_name="list_hosts",
+            docstring=(
+                "List hosts.\n\ngenerator=key: hosts, result_mode: file\n\n"
+                "sub_key=key: host1, split: true\n"
+            ),
+        )
+
+        outputs = resources.get_external_data()["output"]
+
+        assert outputs["host1"]["value"] == (
+            '${jsondecode(base64decode(local.result_file["host1"]))}'
+        )
+
+    def test_composite_rejects_file_mode(self) -> None:
+        """Test composites keep their results inline."""
+        resources = TerraformModuleResources(
+            module_name="hosts_and_zones",
+            docstring=(
+                "Hosts and zones.\n\n"
+                "generator=key: hosts, members: list_hosts|list_zones, "
+                "result_mode: file\n"
+            ),
+        )
+
+        with pytest.raises(RuntimeError, match="cannot use result_mode file"):
+            resources.get_composite_external_data()
+
+    @pytest.mark.parametrize("method_name", ["list_hosts", "iter_hosts"])
+    def test_registry_writes_result_file(
+        self,
+        method_name: str,
+        result_dir: Path,
+        capsys: pytest.CaptureFixture,
+    ) -> None:
+        """Test stdout carries the pointer and the file the external result."""
+        file_registry.invoke(method_name, to_stdout=True)
+
+        pointer, content = read_pointer(capsys.readouterr().out)
+        config = file_registry.get_method(method_name)
+        result = {"hosts": INVENTORY, "count": len(INVENTORY)}
+        if method_name == "iter_hosts":
+            result = INVENTORY
+        expected = encode_result(result, **config.get_output_plan())
+        assert json.loads(content) == expected
+        assert Path(pointer[PATH_KEY]).parent == result_dir.resolve()
+
+    def test_runtime_writes_result_file(
+        self, result_dir: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test docstring-configured methods write result files too."""
+        runtime = TerraformRuntime(InventoryDataSource)
+
+        result = runtime.invoke("list_hosts", from_stdin=False, to_stdout=True)
+
+        assert result == INVENTORY
+        _, content = read_pointer(capsys.readouterr().out)
+        assert json.loads(content) == encode_result(INVENTORY, key="hosts")
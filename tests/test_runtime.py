@@ -2,9 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
+
+import pytest
+
 from directed_inputs_class import directed_inputs
 
-from python_terraform_bridge.runtime import TerraformRuntime
+from python_terraform_bridge.runtime import TerraformRuntime, encode_result
+
+
+def decode(value: str) -> object:
+    """Undo the runtime's base64 JSON encoding."""
+    return json.loads(base64.b64decode(value))
 
 
 @directed_inputs(inputs={"region": "us-east-1"})
@@ -14,6 +25,40 @@ class DecoratedDataSource:
     def list_regions(self, region: str) -> dict[str, str]:
         return {"region": region}
 
+    def list_users(self) -> dict:
+        """List users.
+
+        Returns a dict of users keyed by id.
+        """
+        return {"u1": {"name": "Ada"}}
+
+    def list_zones(self, region: str) -> dict:
+        """List availability zones.
+
+        generator=key: zones
+
+        extra_output=key: zone_count
+        sub_key=key: primary, split: true
+        """
+        return {
+            "zones": {"primary": f"{region}a", "secondary": f"{region}b"},
+            "zone_count": 2,
+        }
+
+    async def list_endpoints(self, region: str) -> list[str]:
+        """List service endpoints.
+
+        generator=key: endpoints
+        """
+        await asyncio.sleep(0)
+        return [f"https://api.{region}.example.com"]
+
+    def list_inventory(self) -> None:
+        """List regions and zones in one call.
+
+        generator=key: inventory, members: list_regions|list_zones
+        """
+
 
 def test_runtime_invokes_decorated_class_without_inheritance() -> None:
     """Ensure TerraformRuntime can execute decorator-based classes."""
@@ -27,3 +72,132 @@ def test_runtime_invokes_decorated_class_without_inheritance() -> None:
     )
 
     assert result == {"region": "us-east-1"}
+
+
+def test_runtime_outputs_prose_docstring_method(
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Ensure methods without bridge annotations output under their name."""
+
+    runtime = TerraformRuntime(DecoratedDataSource)
+
+    runtime.invoke("list_users", from_stdin=False, to_stdout=True)
+
+    output = json.loads(capsys.readouterr().out)
+    assert output == encode_result({"u1": {"name": "Ada"}}, key="list_users")
+
+
+def test_runtime_invokes_prose_docstring_method() -> None:
+    """Ensure prose docstrings are not parsed as composite declarations."""
+
+    runtime = TerraformRuntime(DecoratedDataSource)
+
+    result = runtime.invoke("list_users", from_stdin=False, to_stdout=False)
+
+    assert result == {"u1": {"name": "Ada"}}
+
+
+def test_runtime_rejects_unknown_method_before_caching() -> None:
+    """Ensure unknown method names are rejected and never cached."""
+
+    runtime = TerraformRuntime(DecoratedDataSource)
+
+    with pytest.raises(ValueError, match="Unknown method: missing"):
+        runtime.invoke("missing", from_stdin=False, to_stdout=False)
+
+    assert "missing" not in runtime._module_resources
+
+
+def test_runtime_output_matches_generated_keys(
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Ensure stdout carries every key the generated module reads."""
+
+    runtime = TerraformRuntime(DecoratedDataSource)
+
+    runtime.invoke("list_zones", from_stdin=False, to_stdout=True)
+
+    output = json.loads(capsys.readouterr().out)
+    assert decode(output["zones"]) == {
+        "primary": "us-east-1a",
+        "secondary": "us-east-1b",
+    }
+    assert decode(output["zone_count"]) == 2
+    assert decode(output["primary"]) == "us-east-1a"
+
+
+def test_runtime_runs_composite_members(capsys: pytest.CaptureFixture) -> None:
+    """Ensure composite docstrings run every member in one invocation."""
+
+    runtime = TerraformRuntime(DecoratedDataSource)
+
+    result = runtime.invoke(
+        "list_inventory",
+        from_stdin=False,
+        to_stdout=True,
+        **{"list_zones.region": "eu-west-1"},
+    )
+
+    assert result["list_regions"] == {"region": "us-east-1"}
+    assert result["list_zones"]["zone_count"] == 2
+
+    output = json.loads(capsys.readouterr().out)
+    assert sorted(output) == ["list_regions", "primary", "zone_count", "zones"]
+    assert decode(output["primary"]) == "eu-west-1a"
+
+
+def test_runtime_awaits_async_methods(capsys: pytest.CaptureFixture) -> None:
+    """Ensure async methods are awaited by invoke and ainvoke alike."""
+
+    runtime = TerraformRuntime(DecoratedDataSource)
+    expected = ["https://api.us-east-1.example.com"]
+
+    assert runtime.invoke("list_endpoints", from_stdin=False, to_stdout=True) == (
+        expected
+    )
+    assert decode(json.loads(capsys.readouterr().out)["endpoints"]) == expected
+
+    assert asyncio.run(runtime.ainvoke("list_endpoints")) == expected
+    assert asyncio.run(runtime.ainvoke("list_regions")) == {"region": "us-east-1"}
+
+
+class TestEncodeResult:
+    """Tests for encode_result."""
+
+    def test_primary_key(self) -> None:
+        """Test results are encoded under the configured key."""
+        output = encode_result({"user1": {"id": 1}}, "users")
+
+        assert list(output) == ["users"]
+        assert decode(output["users"]) == {"user1": {"id": 1}}
+
+    def test_string_dict_without_key_is_encoded(self) -> None:
+        """Test string dicts missing the key are encoded, not passed through."""
+        output = encode_result({"user1": "alice"}, "users")
+
+        assert decode(output["users"]) == {"user1": "alice"}
+
+    def test_complete_string_response_passes_through(self) -> None:
+        """Test pre-encoded responses are written unchanged."""
+        assert encode_result({"users": "abc"}, "users") == {"users": "abc"}
+
+    def test_extra_outputs_remainder_is_primary(self) -> None:
+        """Test the primary value is what remains after extra outputs."""
+        output = encode_result(
+            {"alice": {}, "bob": {}, "count": 2},
+            "users",
+            extra_outputs=["count"],
+        )
+
+        assert decode(output["users"]) == {"alice": {}, "bob": {}}
+        assert decode(output["count"]) == 2
+
+    def test_missing_extra_output_is_null(self) -> None:
+        """Test absent extra outputs are still emitted."""
+        output = encode_result({"users": []}, "users", extra_outputs=["count"])
+
+        assert decode(output["count"]) is None
+
+    def test_plaintext_output(self) -> None:
+        """Test plaintext results are written as strings."""
+        assert encode_result("ok", "status", plaintext_output=True) == {"status": "ok"}
@@ -0,0 +1,129 @@
+"""Tests for sharded module generation."""
+
+from __future__ import annotations
+
+import json
+
+from pathlib import Path
+
+import pytest
+
+from python_terraform_bridge.registry import TerraformRegistry
+from python_terraform_bridge.sharding import (
+    SHARD_MANIFEST_NAME,
+    assign_shards,
+    merge_shards,
+    parse_shard,
+)
+
+
+def make_registry(count: int = 12) -> TerraformRegistry:
+    """Registry with count data sources in two module classes."""
+    registry = TerraformRegistry()
+
+    for index in range(count):
+
+        def method(domain: str = "") -> dict:
+            """List things."""
+            return {}
+
+        registry.register(
+            method_name=f"list_items_{index}",
+            key=f"items_{index}",
+            module_class="even" if index % 2 == 0 else "odd",
+        )(method)
+
+    return registry
+
+
+def read_tree(root: Path) -> dict[str, str]:
+    """Map relative file paths below root to their contents."""
+    return {
+        path.relative_to(root).as_posix(): path.read_text()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+class TestSharding:
+    """Tests for shard assignment and merging."""
+
+    def test_parse_shard(self) -> None:
+        """Test shard specifications are parsed and validated."""
+        assert parse_shard("1/4") == (1, 4)
+        assert parse_shard((0, 1)) == (0, 1)
+
+        for invalid in ("4/4", "-1/2", "1", "a/b", (0, 0)):
+            with pytest.raises(ValueError, match="shard"):
+                parse_shard(invalid)
+
+    def test_assignment_is_stable_and_complete(self) -> None:
+        """Test every path lands in exactly one shard, independent of order."""
+        paths = [f"svc/module-{index}/main.tf.json" for index in range(50)]
+
+        assignment = assign_shards(paths, 4)
+
+        assert assignment == assign_shards(reversed(paths), 4)
+        assert set(assignment) == set(paths)
+        assert set(assignment.values()) == {0, 1, 2, 3}
+
+    def test_weights_balance_shards(self) -> None:
+        """Test weighted assignment evens out the cost per shard."""
+        weights = {"heavy/main.tf.json": 10.0}
+        weights.update({f"light-{index}/main.tf.json": 1.0 for index in range(10)})
+
+        assignment = assign_shards([*weights, "new/main.tf.json"], 2, weights)
+
+        loads = [0.0, 0.0]
+        for path, shard_index in assignment.items():
+            loads[shard_index] += weights.get(path, 20 / 11)
+        assert abs(loads[0] - loads[1]) <= 2
+        heavy_shard = assignment["heavy/main.tf.json"]
+        assert list(assignment.values()).count(heavy_shard) < 6
+
+    def test_merged_shards_match_single_run(self, tmp_path: Path) -> None:
+        """Test merging all shards reproduces an unsharded generation."""
+        registry = make_registry()
+        registry.generate_modules(str(tmp_path / "single"))
+
+        shard_dirs = []
+        for index in range(3):
+            shard_dir = tmp_path / f"node-{index}"
+            output_dir = shard_dir / "modules"
+            generated = registry.generate_modules(str(output_dir), shard=f"{index}/3")
+            manifest = json.loads((output_dir / SHARD_MANIFEST_NAME).read_text())
+            assert len(manifest["modules"]) == len(generated)
+            shard_dirs.append(output_dir)
+
+        timings = merge_shards(shard_dirs, tmp_path / "merged")
+
+        assert len(timings) == 12
+        assert read_tree(tmp_path / "merged") == read_tree(tmp_path / "single")
+
+    def test_merge_detects_collisions(self, tmp_path: Path) -> None:
+        """Test a module path generated by two shards is rejected."""
+        registry = make_registry()
+        for index in range(2):
+            registry.generate_modules(str(tmp_path / f"n{index}"), shard=f"{index}/2")
+
+        manifest_path = tmp_path / "n1" / SHARD_MANIFEST_NAME
+        manifest = json.loads(manifest_path.read_text())
+        first = json.loads((tmp_path / "n0" / SHARD_MANIFEST_NAME).read_text())
+        manifest["modules"].update(first["modules"])
+        manifest_path.write_text(json.dumps(manifest))
+
+        with pytest.raises(RuntimeError, match="generated by shards 0 and 1"):
+            merge_shards([tmp_path / "n0", tmp_path / "n1"], tmp_path / "out")
+
+    def test_merge_detects_missing_shards(self, tmp_path: Path) -> None:
+        """Test merging fails unless every shard is present."""
+        registry = make_registry()
+        registry.generate_modules(str(tmp_path / "n0"), shard="0/2")
+
+        with pytest.raises(RuntimeError, match=r"Missing shards \[1\]"):
+            merge_shards([tmp_path / "n0"], tmp_path / "out")
+
+    def test_shard_cannot_dedupe(self, tmp_path: Path) -> None:
+        """Test sharding and deduplication are mutually exclusive."""
+        with pytest.raises(ValueError, match="deduplicated"):
+            make_registry().generate_modules(str(tmp_path), shard="0/2", dedupe=True)
@@ -0,0 +1,134 @@
+"""Tests for staged module tree writes."""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from python_terraform_bridge.registry import TerraformRegistry
+from python_terraform_bridge.staging import StagedTree
+
+
+def staging_dirs(parent: Path) -> list[Path]:
+    """Leftover staging directories below parent."""
+    return [path for path in parent.iterdir() if ".staging-" in path.name]
+
+
+class TestStagedTree:
+    """Tests for StagedTree."""
+
+    def test_new_directory_is_renamed_into_place(self, tmp_path: Path) -> None:
+        """Test a fresh output directory appears fully written at once."""
+        output_dir = tmp_path / "modules"
+
+        with StagedTree(output_dir) as stage:
+            stage.write_json(output_dir / "a" / "main.tf.json", {"a": 1})
+            stage.write_json(output_dir / "b" / "main.tf.json", {"b": 2})
+            assert not output_dir.exists()
+
+        assert json.loads((output_dir / "a" / "main.tf.json").read_text()) == {"a": 1}
+        assert (output_dir / "b" / "main.tf.json").read_text() == json.dumps(
+            {"b": 2}, indent=2
+        )
+        assert staging_dirs(tmp_path) == []
+
+    def test_renamed_directory_uses_default_permissions(self, tmp_path: Path) -> None:
+        """Test the output directory does not keep a private temp mode."""
+        output_dir = tmp_path / "modules"
+        reference_dir = tmp_path / "reference"
+        reference_dir.mkdir()
+
+        with StagedTree(output_dir, durable=False) as stage:
+            stage.write_text(output_dir / "main.tf.json", "{}")
+
+        assert stat.S_IMODE(os.stat(output_dir).st_mode) == stat.S_IMODE(
+            os.stat(reference_dir).st_mode
+        )
+
+    def test_existing_directory_is_updated_file_by_file(self, tmp_path: Path) -> None:
+        """Test files are replaced in place and unrelated files are kept."""
+        output_dir = tmp_path / "modules"
+        (output_dir / "a").mkdir(parents=True)
+        (output_dir / "a" / "main.tf.json").write_text("old")
+        (output_dir / "README.md").write_text("keep")
+
+        with StagedTree(output_dir) as stage:
+            stage.write_text(output_dir / "a" / "main.tf.json", "new")
+            stage.write_text(output_dir / "b" / "main.tf.json", "added")
+            assert (output_dir / "a" / "main.tf.json").read_text() == "old"
+
+        assert (output_dir / "a" / "main.tf.json").read_text() == "new"
+        assert (output_dir / "b" / "main.tf.json").read_text() == "added"
+        assert (output_dir / "README.md").read_text() == "keep"
+        assert staging_dirs(tmp_path) == []
+
+    def test_commit_syncs_only_affected_paths(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test durable commits fsync the files and their directories."""
+        output_dir = tmp_path / "modules"
+        (output_dir / "a").mkdir(parents=True)
+        (output_dir / "untouched").mkdir()
+        synced: list[Path] = []
+        opened: dict[int, Path] = {}
+        real_open, real_fsync = os.open, os.fsync
+
+        def record_open(path: Any, *args: Any, **kwargs: Any) -> int:
+            fd = real_open(path, *args, **kwargs)
+            opened[fd] = Path(path)
+            return fd
+
+        def record_fsync(fd: int) -> None:
+            synced.append(opened[fd])
+            real_fsync(fd)
+
+        monkeypatch.delattr(os, "sync", raising=False)
+        monkeypatch.setattr(os, "open", record_open)
+        monkeypatch.setattr(os, "fsync", record_fsync)
+
+        with StagedTree(output_dir) as stage:
+            stage.write_text(output_dir / "a" / "main.tf.json", "new")
+            stage.write_text(output_dir / "b" / "c" / "main.tf.json", "added")
+
+        assert sum(".staging-" in str(path) for path in synced) == 2
+        assert {path for path in synced if ".staging-" not in str(path)} == {
+            output_dir / "a",
+            output_dir / "b",
+            output_dir / "b" / "c",
+            output_dir,
+            tmp_path,
+        }
+
+    def test_failure_leaves_output_untouched(self, tmp_path: Path) -> None:
+        """Test an exception discards the staged files."""
+        output_dir = tmp_path / "modules"
+        output_dir.mkdir()
+        (output_dir / "main.tf.json").write_text("old")
+
+        with pytest.raises(ValueError), StagedTree(output_dir) as stage:
+            stage.write_text(output_dir / "main.tf.json", "new")
+            raise ValueError("generation failed")
+
+        assert (output_dir / "main.tf.json").read_text() == "old"
+        assert staging_dirs(tmp_path) == []
+
+    def test_registry_staged_output_matches_in_place(self, tmp_path: Path) -> None:
+        """Test staged generation writes the same files as in-place writes."""
+        registry = TerraformRegistry()
+
+        @registry.data_source(key="users", module_class="directory")
+        def list_users(domain: str = "") -> dict:
+            """List users."""
+            return {}
+
+        staged = registry.generate_modules(str(tmp_path / "staged"))
+        in_place = registry.generate_modules(str(tmp_path / "in-place"), staged=False)
+
+        assert staged["list_users"].read_text() == in_place["list_users"].read_text()
+        assert staging_dirs(tmp_path) == []
@@ -0,0 +1,391 @@
+"""Tests for static (import-free) method discovery."""
+
+from __future__ import annotations
+
+import json
+import textwrap
+
+from pathlib import Path
+
+import pytest
+
+from python_terraform_bridge.cli import main
+from python_terraform_bridge.sharding import SHARD_MANIFEST_NAME
+from python_terraform_bridge.static import (
+    find_module_source,
+    get_source_checksum,
+    get_static_methods,
+    load_static_methods,
+)
+
+
+SOURCE = textwrap.dedent(
+    '''
+    import boto3_that_is_not_installed
+
+    from python_terraform_bridge import TerraformModuleParameter, TerraformRegistry
+
+    registry = TerraformRegistry()
+    DYNAMIC = "computed"
+
+
+    class Base:
+        def shared(self) -> dict:
+            """Shared method.
+
+            generator=key: shared, module_class: base
+            """
+            return {}
+
+
+    class MyConnector(Base):
+        def list_users(self, domain: str = "example.com") -> dict:
+            """List all users.
+
+            generator=key: users, module_class: myservice
+
+            name: domain, required: false, type: string, default: "example.com"
+            """
+            return {}
+
+        @registry.data_source(key="groups", module_class="github", always_run=True)
+        def list_groups(self, org: str, limit: int = 10, tags: dict = None) -> dict:
+            """List GitHub groups."""
+            return {}
+
+        @registry.null_resource(
+            module_class="aws",
+            key=DYNAMIC,
+            parameters=[TerraformModuleParameter(name="bucket", type="string")],
+            env_variables={"AWS_PROFILE": {"required": True}},
+        )
+        def create_bucket(self, bucket) -> None:
+            """Create a bucket."""
+
+        @registry.data_source(key="teams", module_class="github", always_run=True)
+        def list_teams(self) -> dict:
+            """List GitHub teams."""
+            return {}
+
+        def hidden(self) -> dict:
+            """Hidden method. NOPARSE"""
+            return {}
+
+        def _private(self) -> dict:
+            return {}
+
+        @property
+        def name(self) -> str:
+            return "connector"
+
+        @classmethod
+        def build(cls) -> MyConnector:
+            return cls()
+    '''
+)
+
+
+class TestStaticDiscovery:
+    """Tests for get_static_methods."""
+
+    def test_discovers_public_methods(self) -> None:
+        """Test methods are found the way get_available_methods finds them."""
+        methods = get_static_methods(SOURCE, "MyConnector")
+
+        assert list(methods) == [
+            "_private",
+            "create_bucket",
+            "list_groups",
+            "list_teams",
+            "list_users",
+            "shared",
+        ]
+
+    def test_docstring_method_resources(self) -> None:
+        """Test undecorated methods are parsed from their docstring."""
+        methods = get_static_methods(SOURCE, "MyConnector")
+
+        resources = methods["list_users"].to_module_resources(
+            terraform_modules_dir="modules"
+        )
+
+        assert methods["list_users"].decorator is None
+        assert resources.generator_parameters["key"] == "users"
+        assert resources.get_module_path() == Path(
+            "modules/myservice/myservice-list-users/main.tf.json"
+        )
+
+    def test_decorator_arguments(self) -> None:
+        """Test literal decorator arguments feed the registry config."""
+        methods = get_static_methods(SOURCE, "MyConnector")
+
+        config = methods["list_groups"].to_method_config()
+
+        assert config.method is None
+        assert config.key == "groups"
+        assert config.module_class == "github"
+        assert config.always_run is True
+        assert config.description == "List GitHub groups."
+
+        params = {p.name: p for p in config.parameters}
+        assert params["org"].required is True
+        assert params["org"].type == "string"
+        assert params["limit"].default == 10
+        assert params["limit"].type == "number"
+        assert params["tags"].type == "map(any)"
+
+    def test_non_literal_arguments_are_reported(self) -> None:
+        """Test non-literal decorator arguments are skipped and reported."""
+        methods = get_static_methods(SOURCE, "MyConnector")
+        method = methods["create_bucket"]
+
+        assert method.unresolved_options == ["key"]
+
+        config = method.to_method_config()
+        assert config.module_type == "null_resource"
+        assert config.key == "create_bucket"
+        assert [p.name for p in config.parameters] == ["bucket"]
+        assert config.env_variables == {"AWS_PROFILE": {"required": True}}
+
+    def test_matches_registry_generation(self) -> None:
+        """Test static output matches what the registry renders."""
+        from python_terraform_bridge.registry import TerraformRegistry
+
+        registry = TerraformRegistry()
+
+        @registry.data_source(key="teams", module_class="github", always_run=True)
+        def list_teams() -> dict:
+            """List GitHub teams."""
+            return {}
+
+        expected = registry.get_method("list_teams").to_module_resources()
+        actual = get_static_methods(SOURCE, "MyConnector")[
+            "list_teams"
+        ].to_module_resources()
+
+        assert actual.get_mixed() == expected.get_mixed()
+        assert actual.get_module_path() == expected.get_module_path()
+
+    def test_missing_class(self) -> None:
+        """Test a missing class raises AttributeError."""
+        with pytest.raises(AttributeError):
+            get_static_methods(SOURCE, "Missing")
+
+
+class TestStaticLoading:
+    """Tests for locating and loading target sources."""
+
+    def test_find_module_source(self, tmp_path: Path) -> None:
+        """Test dotted module paths resolve without importing packages."""
+        package = tmp_path / "pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("raise ImportError('never run')\n")
+        (package / "connector.py").write_text(SOURCE)
+
+        source = find_module_source("pkg.connector", [str(tmp_path)])
+
+        assert source == package / "connector.py"
+
+    def test_find_module_source_missing(self, tmp_path: Path) -> None:
+        """Test a missing module raises ImportError."""
+        with pytest.raises(ImportError):
+            find_module_source("pkg.missing", [str(tmp_path)])
+
+    def test_load_from_file_path(self, tmp_path: Path) -> None:
+        """Test targets can point directly at a source file."""
+        source = tmp_path / "connector.py"
+        source.write_text(SOURCE)
+
+        methods = load_static_methods(f"{source}:MyConnector")
+
+        assert "list_users" in methods
+
+
+CHECKSUM_SOURCE = textwrap.dedent(
+    """
+    import json
+
+    PAGE_SIZE = 100
+
+
+    def paginate(items):
+        return [items[i : i + PAGE_SIZE] for i in range(0, len(items), PAGE_SIZE)]
+
+
+    def unrelated():
+        return 1
+
+
+    class Base:
+        def client(self):
+            return json
+
+
+    class Syncer(Base):
+        def sync(self, items):
+            \"\"\"Sync items.\"\"\"
+            return [self.client().dumps(page) for page in paginate(items)]
+
+        def other(self):
+            return unrelated()
+    """
+)
+
+
+class TestSourceChecksum:
+    """Tests for source-hash checksums."""
+
+    def test_ignores_formatting_comments_and_docstrings(self) -> None:
+        """Test cosmetic edits keep the checksum stable."""
+        edited = CHECKSUM_SOURCE.replace(
+            '"""Sync items."""', '"""Sync every item."""  # noqa'
+        ).replace("PAGE_SIZE = 100", "PAGE_SIZE  =  100  # tuned")
+
+        assert get_source_checksum(edited, "Syncer.sync") == (
+            get_source_checksum(CHECKSUM_SOURCE, "Syncer.sync")
+        )
+
+    def test_hashes_docstring_annotations(self) -> None:
+        """Test annotation lines count while surrounding prose does not."""
+        annotated = CHECKSUM_SOURCE.replace(
+            '"""Sync items."""',
+            '"""Sync items.\n\n        generator=key: items\n        """',
+        )
+        reworded = annotated.replace("Sync items.", "Sync every item.")
+        changed = annotated.replace("key: items", "key: pages")
+
+        checksum = get_source_checksum(annotated, "Syncer.sync")
+        assert checksum != get_source_checksum(CHECKSUM_SOURCE, "Syncer.sync")
+        assert checksum == get_source_checksum(reworded, "Syncer.sync")
+        assert checksum != get_source_checksum(changed, "Syncer.sync")
+
+    @pytest.mark.parametrize(
+        ("old", "new"),
+        [
+            ("PAGE_SIZE = 100", "PAGE_SIZE = 50"),
+            ("i + PAGE_SIZE]", "i + PAGE_SIZE + 1]"),
+            ("return json", "return None"),
+        ],
+    )
+    def test_follows_same_module_dependencies(self, old: str, new: str) -> None:
+        """Test changes to constants, helpers and inherited methods count."""
+        edited = CHECKSUM_SOURCE.replace(old, new)
+
+        assert get_source_checksum(edited, "Syncer.sync") != (
+            get_source_checksum(CHECKSUM_SOURCE, "Syncer.sync")
+        )
+
+    def test_ignores_unrelated_code(self) -> None:
+        """Test code the method does not reach leaves the checksum alone."""
+        edited = CHECKSUM_SOURCE.replace("return 1", "return 2")
+
+        assert get_source_checksum(edited, "Syncer.sync") == (
+            get_source_checksum(CHECKSUM_SOURCE, "Syncer.sync")
+        )
+        assert get_source_checksum(edited, "Syncer.other") != (
+            get_source_checksum(CHECKSUM_SOURCE, "Syncer.other")
+        )
+
+    def test_module_functions(self) -> None:
+        """Test module-level functions can be hashed."""
+        assert get_source_checksum(CHECKSUM_SOURCE, "paginate") != (
+            get_source_checksum(CHECKSUM_SOURCE, "unrelated")
+        )
+
+    def test_missing_method(self) -> None:
+        """Test unknown methods raise AttributeError."""
+        with pytest.raises(AttributeError):
+            get_source_checksum(CHECKSUM_SOURCE, "Syncer.missing")
+
+    def test_generate_uses_checksum_default(self, tmp_path: Path) -> None:
+        """Test generate --source-checksum bakes the hash into the module."""
+        source = tmp_path / "connector.py"
+        source.write_text(SOURCE)
+        output = tmp_path / "modules"
+
+        exit_code = main(
+            [
+                "generate",
+                f"{source}:MyConnector",
+                "-o",
+                str(output),
+                "--static",
+                "--source-checksum",
+            ]
+        )
+
+        assert exit_code == 0
+
+        module_path = output / "aws" / "aws-create-bucket" / "main.tf.json"
+        module_json = json.loads(module_path.read_text())
+        assert module_json["variable"]["checksum"]["default"] == (
+            get_source_checksum(SOURCE, "MyConnector.create_bucket")
+        )
+
+        inherited = output / "base" / "base-shared" / "main.tf.json"
+        assert json.loads(inherited.read_text())["variable"]["checksum"][
+            "default"
+        ] == get_source_checksum(SOURCE, "Base.shared")
+
+
+class TestStaticCli:
+    """Tests for the --static CLI mode."""
+
+    def test_generate_static(self, tmp_path: Path) -> None:
+        """Test generate --static writes modules without importing."""
+        source = tmp_path / "connector.py"
+        source.write_text(SOURCE)
+        output = tmp_path / "modules"
+
+        exit_code = main(
+            ["generate", f"{source}:MyConnector", "-o", str(output), "--static"]
+        )
+
+        assert exit_code == 0
+
+        module_path = output / "github" / "github-list-groups" / "main.tf.json"
+        module_json = json.loads(module_path.read_text())
+        assert "groups" in module_json["output"]
+
+        assert (output / "aws" / "aws-create-bucket" / "main.tf.json").exists()
+        assert not (output / "myservice" / "myservice-private").exists()
+
+    def test_generate_static_shard(self, tmp_path: Path) -> None:
+        """Test generate --static --shard writes a shard manifest."""
+        source = tmp_path / "connector.py"
+        source.write_text(SOURCE)
+        output = tmp_path / "modules"
+
+        exit_code = main(
+            [
+                "generate",
+                f"{source}:MyConnector",
+                "-o",
+                str(output),
+                "--static",
+                "--shard",
+                "0/1",
+            ]
+        )
+
+        assert exit_code == 0
+
+        manifest = json.loads((output / SHARD_MANIFEST_NAME).read_text())
+        assert "aws/aws-create-bucket/main.tf.json" in manifest["modules"]
+
+    def test_list_static(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        """Test list --static reports descriptions."""
+        source = tmp_path / "connector.py"
+        source.write_text(SOURCE)
+
+        exit_code = main(["list", f"{source}:MyConnector", "--json", "--static"])
+
+        assert exit_code == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output == {
+            "create_bucket": "Create a bucket.",
+            "list_groups": "List GitHub groups.",
+            "list_teams": "List GitHub teams.",
+            "list_users": "List all users.",
+            "shared": "Shared method.",
+        }
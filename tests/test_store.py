@@ -0,0 +1,156 @@
+"""Tests for the content-addressed module store."""
+
+from __future__ import annotations
+
+import json
+
+from pathlib import Path
+
+import pytest
+
+from python_terraform_bridge.module_resources import TerraformModuleResources
+from python_terraform_bridge.registry import TerraformRegistry
+from python_terraform_bridge.store import ModuleStore, get_content_hash
+
+
+LISTING_DOCSTRING = """List things.
+
+generator=key: items, module_class: inventory
+
+name: domain, required: false, type: string
+"""
+
+
+def make_resources(module_name: str, docstring: str, modules_dir: Path):
+    """Build resources writing below modules_dir."""
+    return TerraformModuleResources(
+        module_name=module_name,
+        docstring=docstring,
+        terraform_modules_dir=str(modules_dir),
+    )
+
+
+class TestModuleStore:
+    """Tests for ModuleStore."""
+
+    def test_identical_modules_are_stored_once(self, tmp_path: Path) -> None:
+        """Test methods differing only by name share one stored module."""
+        store = ModuleStore(tmp_path)
+
+        for name in ("list_users", "list_groups", "list_roles"):
+            store.add(make_resources(name, LISTING_DOCSTRING, tmp_path))
+        store.add(
+            make_resources(
+                "get_user",
+                "Get a user.\n\ngenerator=key: user, module_class: inventory\n",
+                tmp_path,
+            )
+        )
+
+        assert len(store.modules) == 4
+        assert len(store.stored) == 2
+        assert store.dedup_ratio == 2.0
+        assert sorted(p.name for p in store.store_dir.iterdir()) == sorted(store.stored)
+
+    def test_wrapper_forwards_to_shared_module(self, tmp_path: Path) -> None:
+        """Test the wrapper keeps the per-method interface."""
+        store = ModuleStore(tmp_path)
+        resources = make_resources("list_users", LISTING_DOCSTRING, tmp_path)
+
+        module_path = store.add(resources)
+
+        assert module_path == resources.get_module_path()
+        wrapper = json.loads(module_path.read_text())
+        module_call = wrapper["module"]["default"]
+        shared_dir = module_path.parent.joinpath(module_call["source"]).resolve()
+        shared = json.loads(shared_dir.joinpath("main.tf.json").read_text())
+
+        assert module_call["bridge_method"] == "list_users"
+        assert module_call["domain"] == "${var.domain}"
+        assert set(wrapper["variable"]) == set(resources.get_variables())
+        assert wrapper["output"]["items"]["value"] == "${module.default.items}"
+        assert shared_dir.name == get_content_hash(shared)
+        assert shared["data"]["external"]["default"]["program"][-1] == (
+            "${var.bridge_method}"
+        )
+
+    def test_shared_module_leaves_rendering_untouched(self, tmp_path: Path) -> None:
+        """Test the shared module does not alter get_mixed output."""
+        resources = make_resources("list_users", LISTING_DOCSTRING, tmp_path).seal()
+
+        resources.get_shared_module()
+
+        module_json = resources.get_mixed()
+        assert "bridge_method" not in module_json["variable"]
+        assert module_json["data"]["external"]["default"]["program"][-1] == (
+            "list_users"
+        )
+
+    def test_null_resource_command_uses_variable(self, tmp_path: Path) -> None:
+        """Test null resource commands read the method from the variable."""
+        resources = make_resources(
+            "sync_users",
+            "Sync users.\n\ngenerator=type: null_resource\n",
+            tmp_path,
+        )
+
+        module_json = resources.get_shared_module()
+
+        provisioner = module_json["resource"]["terraform_data"]["default"][
+            "provisioner"
+        ][0]["local-exec"]
+        assert provisioner["command"].endswith(" ${var.bridge_method}")
+        assert "sync_users" not in provisioner["command"]
+
+    def test_registry_dedupe_keeps_spilled_inputs(self, tmp_path: Path) -> None:
+        """Test stored null resources keep their spilled input files."""
+        registry = TerraformRegistry()
+
+        @registry.null_resource(module_class="directory", spill_inputs=True)
+        def apply_config(cfg: dict) -> None:
+            """Apply a config."""
+
+        generated = registry.generate_modules(str(tmp_path), dedupe=True)
+
+        wrapper = json.loads(generated["apply_config"].read_text())
+        shared_dir = (
+            generated["apply_config"].parent / wrapper["module"]["default"]["source"]
+        ).resolve()
+        shared = json.loads(shared_dir.joinpath("main.tf.json").read_text())
+        resources = shared["resource"]
+        triggers = resources["terraform_data"]["default"]["triggers_replace"]
+        assert triggers["cfg"] == "${local_sensitive_file.cfg.filename}"
+        assert set(resources["local_sensitive_file"]) == {"cfg"}
+        assert "local" in shared["terraform"]["required_providers"]
+
+    def test_method_variable_conflict(self, tmp_path: Path) -> None:
+        """Test a parameter named like the method variable is rejected."""
+        resources = make_resources(
+            "list_users",
+            "List users.\n\ngenerator=key: users\n\nname: bridge_method\n",
+            tmp_path,
+        )
+
+        with pytest.raises(RuntimeError, match="bridge_method"):
+            resources.get_shared_module()
+
+    def test_registry_generate_dedupe(self, tmp_path: Path) -> None:
+        """Test generate_modules writes wrappers when deduplicating."""
+        registry = TerraformRegistry()
+
+        @registry.data_source(key="users", module_class="directory")
+        def list_users(domain: str = "") -> dict:
+            """List users."""
+            return {}
+
+        @registry.data_source(key="users", module_class="directory")
+        def list_admins(domain: str = "") -> dict:
+            """List users."""
+            return {}
+
+        generated = registry.generate_modules(str(tmp_path), dedupe=True)
+
+        assert set(generated) == {"list_users", "list_admins"}
+        assert len(list(tmp_path.joinpath("_store").iterdir())) == 1
+        for path in generated.values():
+            assert "module" in json.loads(path.read_text())
@@ -0,0 +1,205 @@
+"""Tests for streamed method results."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import logging
+
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from directed_inputs_class import directed_inputs
+
+from python_terraform_bridge.registry import TerraformRegistry
+from python_terraform_bridge.runtime import encode_result, lambda_handler_factory
+from python_terraform_bridge.streaming import (
+    ResultStreamEncoder,
+    acollect_result,
+    collect_result,
+    dumps_result_stream,
+    write_result_stream,
+)
+
+
+USERS = {f"user{index}": {"id": index, "tags": ["a", "b"]} for index in range(7)}
+
+
+def user_pages(size: int = 3) -> Iterator[dict]:
+    """Yield USERS as dict pages."""
+    names = list(USERS)
+    for start in range(0, len(names), size):
+        yield {name: USERS[name] for name in names[start : start + size]}
+
+
+async def user_pairs() -> AsyncIterator[tuple[str, dict]]:
+    """Yield USERS as (key, value) pairs from an async generator."""
+    for name, user in USERS.items():
+        await asyncio.sleep(0)
+        yield name, user
+
+
+stream_registry = TerraformRegistry("streaming")
+pages_fetched: list[int] = []
+
+
+@stream_registry.data_source(
+    key="users",
+    module_class="directory",
+    extra_outputs={"total": {}},
+)
+def list_users(page_size: int = 3) -> Iterator[dict]:
+    """List users page by page."""
+    for index, page in enumerate(user_pages(page_size)):
+        pages_fetched.append(index)
+        yield page
+    yield {"total": len(USERS)}
+
+
+@stream_registry.data_source(key="numbers", module_class="directory")
+async def list_numbers(count: int) -> AsyncIterator[list]:
+    """List numbers in pages of two."""
+    for start in range(0, count, 2):
+        await asyncio.sleep(0)
+        yield list(range(start, min(start + 2, count)))
+
+
+stream_registry.composite(
+    "directory_streams", ["list_users", "list_numbers"], module_class="directory"
+)
+
+
+@directed_inputs(inputs={})
+class StreamingDataSource:
+    """Data source class with a generator method."""
+
+    def list_users(self) -> Iterator[tuple[str, dict]]:
+        """List users one by one."""
+        yield from USERS.items()
+
+
+class TestResultStreamEncoder:
+    """Tests for encoding result streams."""
+
+    def test_matches_encode_result(self) -> None:
+        """Test streamed output equals encoding the assembled result."""
+        plan = {
+            "key": "users",
+            "extra_outputs": ["total"],
+            "sub_keys": ["user1"],
+        }
+        items = [*user_pages(), ("total", 7)]
+        assembled = {**USERS, "total": 7}
+
+        for plaintext_output in (False, True):
+            out = io.StringIO()
+            write_result_stream(
+                iter(items), out, plaintext_output=plaintext_output, **plan
+            )
+
+            expected = encode_result(
+                assembled, plaintext_output=plaintext_output, **plan
+            )
+            assert out.getvalue() == json.dumps(expected) + "\n"
+
+    def test_assembles_pages_and_pairs(self) -> None:
+        """Test dict pages, pairs and list pages assemble like the result."""
+        assert collect_result(user_pages()) == USERS
+        assert collect_result(user_pairs()) == USERS
+        assert collect_result(iter([[1, 2], [3]])) == [1, 2, 3]
+        assert collect_result(iter([])) == {}
+        assert collect_result({"not": "a stream"}) == {"not": "a stream"}
+
+        assert dumps_result_stream(user_pairs()) == json.dumps(USERS)
+        assert asyncio.run(acollect_result(user_pages())) == USERS
+
+    @pytest.mark.parametrize(
+        ("items", "message"),
+        [
+            ([("a", 1), {"a": 2}], "repeats key 'a'"),
+            ([("a", 1), [2]], "mixes list pages"),
+            (["text"], "not str"),
+        ],
+    )
+    def test_malformed_streams(self, items: list, message: str) -> None:
+        """Test malformed streams are rejected."""
+        with pytest.raises(ValueError, match=message):
+            collect_result(iter(items))
+
+    def test_logs_progress(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test progress is logged per page and summarized at the end."""
+        logger = logging.getLogger("test_streaming")
+        encoder = ResultStreamEncoder(logger=logger, label="list_users")
+
+        with caplog.at_level(logging.DEBUG, logger="test_streaming"):
+            for page in user_pages():
+                encoder.feed(page)
+            encoder.finish()
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert messages == [
+            "Streaming list_users: 1 items, 3 entries",
+            "Streaming list_users: 2 items, 6 entries",
+            "Streaming list_users: 3 items, 7 entries",
+            "Streamed list_users: 3 items, 7 entries",
+        ]
+
+
+class TestStreamedMethods:
+    """Tests for methods returning generators."""
+
+    def test_invoke_returns_stream_lazily(self) -> None:
+        """Test programmatic calls get the generator unconsumed."""
+        pages_fetched.clear()
+
+        stream = stream_registry.invoke("list_users", page_size=2)
+
+        assert pages_fetched == []
+        assert next(stream) == {"user0": USERS["user0"], "user1": USERS["user1"]}
+        assert pages_fetched == [0]
+
+    def test_invoke_writes_stream_to_stdout(
+        self, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Test a streamed result is encoded like the assembled one."""
+        assert stream_registry.invoke("list_users", to_stdout=True) is None
+
+        output = json.loads(capsys.readouterr().out)
+        assert output == encode_result(
+            {**USERS, "total": 7}, key="users", extra_outputs=["total"]
+        )
+
+    def test_async_generator(self, capsys: pytest.CaptureFixture) -> None:
+        """Test async generators stream through invoke and ainvoke."""
+        stream_registry.invoke("list_numbers", to_stdout=True, count=5)
+        output = json.loads(capsys.readouterr().out)
+        assert output == encode_result([0, 1, 2, 3, 4], key="numbers")
+
+        async def main() -> None:
+            await stream_registry.ainvoke("list_numbers", to_stdout=True, count=3)
+
+        asyncio.run(main())
+        output = json.loads(capsys.readouterr().out)
+        assert output == encode_result([0, 1, 2], key="numbers")
+
+    def test_composite_assembles_member_streams(self) -> None:
+        """Test composite members' streams are collected into their results."""
+        result = stream_registry.invoke(
+            "directory_streams", **{"list_numbers.count": 3}
+        )
+
+        assert result == {
+            "list_users": {**USERS, "total": 7},
+            "list_numbers": [0, 1, 2],
+        }
+
+    def test_lambda_handler_encodes_stream(self) -> None:
+        """Test the Lambda body is the JSON of the assembled stream."""
+        handler = lambda_handler_factory(StreamingDataSource)
+
+        response = handler({"method": "list_users"})
+
+        assert response["statusCode"] == 200
+        assert response["body"] == json.dumps(USERS)
@@ -0,0 +1,168 @@
+"""Tests for watch mode regeneration."""
+
+from __future__ import annotations
+
+import sys
+import threading
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from python_terraform_bridge.watch import (
+    InotifyWatcher,
+    ModuleWatcher,
+    PollingWatcher,
+)
+
+
+SOURCE = '''
+class Inventory:
+    def list_users(self, domain: str = ""):
+        """List users.
+
+        generator=key: users, module_class: inventory
+
+        name: domain, required: false, type: string
+        """
+
+    def list_groups(self):
+        """List groups.
+
+        generator=key: groups, module_class: inventory
+        """
+'''
+
+
+@pytest.fixture
+def watcher(tmp_path: Path) -> ModuleWatcher:
+    """A watcher over a source file in tmp_path, already refreshed once."""
+    source_path = tmp_path.joinpath("inventory.py")
+    source_path.write_text(SOURCE)
+
+    module_watcher = ModuleWatcher(
+        f"{source_path}:Inventory",
+        terraform_modules_dir=str(tmp_path.joinpath("modules")),
+    )
+    module_watcher.refresh()
+    return module_watcher
+
+
+class TestModuleWatcher:
+    """Tests for ModuleWatcher."""
+
+    def test_initial_refresh_writes_all_modules(self, watcher: ModuleWatcher) -> None:
+        """Test the first refresh generates every module."""
+        assert set(watcher.rendered) == {"list_users", "list_groups"}
+        for module_path, content in watcher.rendered.values():
+            assert module_path.read_text() == content
+
+    def test_unchanged_source_writes_nothing(self, watcher: ModuleWatcher) -> None:
+        """Test refreshing without edits leaves the modules alone."""
+        assert watcher.refresh() == []
+
+    def test_only_edited_method_is_rebuilt(self, watcher: ModuleWatcher) -> None:
+        """Test an edit rebuilds and rewrites just the affected method."""
+        groups_resources = watcher.resources["list_groups"]
+        watcher.source_path.write_text(
+            SOURCE.replace("generator=key: users", "generator=key: people")
+        )
+
+        written = watcher.refresh()
+
+        assert written == [watcher.rendered["list_users"][0]]
+        assert watcher.resources["list_groups"] is groups_resources
+        assert '"people"' in written[0].read_text()
+
+    def test_rewrites_are_staged(
+        self, watcher: ModuleWatcher, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test modules are never rewritten in place."""
+
+        def write_in_place(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("module written in place")
+
+        monkeypatch.setattr(Path, "write_text", write_in_place)
+        watcher.source_path.write_bytes(
+            SOURCE.replace("generator=key: users", "generator=key: people").encode()
+        )
+
+        written = watcher.refresh()
+
+        assert '"people"' in written[0].read_text()
+        modules_dir = Path(watcher.terraform_modules_dir)
+        assert not [
+            path for path in modules_dir.parent.iterdir() if ".staging-" in path.name
+        ]
+
+    def test_body_edits_do_not_rewrite_modules(self, watcher: ModuleWatcher) -> None:
+        """Test code changes that do not alter the module are skipped."""
+        watcher.source_path.write_text(
+            SOURCE + "\n    def _helper(self):\n        return 1\n"
+        )
+
+        assert watcher.refresh() == []
+
+    def test_removed_method_module_is_deleted(self, watcher: ModuleWatcher) -> None:
+        """Test modules of deleted methods are removed."""
+        module_path = watcher.rendered["list_groups"][0]
+        watcher.source_path.write_text(SOURCE.split("    def list_groups")[0])
+
+        assert watcher.refresh() == [module_path]
+        assert not module_path.exists()
+        assert not module_path.parent.exists()
+        assert set(watcher.rendered) == {"list_users"}
+
+    def test_syntax_error_keeps_previous_state(self, watcher: ModuleWatcher) -> None:
+        """Test a half-edited file leaves the generated modules in place."""
+        rendered = dict(watcher.rendered)
+        watcher.source_path.write_text(SOURCE + "\n    def broken(:\n")
+
+        with pytest.raises(SyntaxError):
+            watcher.refresh()
+
+        assert watcher.rendered == rendered
+
+    def test_restart_skips_up_to_date_files(self, watcher: ModuleWatcher) -> None:
+        """Test a new watcher does not rewrite modules already on disk."""
+        restarted = ModuleWatcher(
+            watcher.target, terraform_modules_dir=watcher.terraform_modules_dir
+        )
+
+        assert restarted.refresh() == []
+
+
+class TestFileWatchers:
+    """Tests for the file change watchers."""
+
+    def _assert_detects_change(self, files: Any, path: Path) -> None:
+        """Write path from another thread and wait for the change."""
+        timer = threading.Timer(0.1, path.write_text, args=("changed",))
+        timer.start()
+        try:
+            assert files.wait(timeout=5) == {path.resolve()}
+        finally:
+            timer.join()
+
+    def test_polling_watcher(self, tmp_path: Path) -> None:
+        """Test polling reports modified files and times out otherwise."""
+        path = tmp_path.joinpath("source.py")
+        path.write_text("original")
+
+        with PollingWatcher([path.resolve()], interval=0.01) as files:
+            assert files.wait(timeout=0.05) == set()
+            self._assert_detects_change(files, path)
+
+    @pytest.mark.skipif(
+        not sys.platform.startswith("linux"), reason="inotify is Linux only"
+    )
+    def test_inotify_watcher(self, tmp_path: Path) -> None:
+        """Test inotify reports writes to watched files only."""
+        path = tmp_path.joinpath("source.py")
+        path.write_text("original")
+
+        with InotifyWatcher([path]) as files:
+            tmp_path.joinpath("other.py").write_text("ignored")
+            assert files.wait(timeout=0.05) == set()
+            self._assert_detects_change(files, path)